@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Benchmark resp.json()-style, typed and streamed decoding of Greenhouse, Lever and Ashby payloads."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pull_jobs import (
+    JSON_SCHEMAS,
+    STREAM_CHUNK_BYTES,
+    JsonArrayReader,
+    ashby_record,
+    ashby_records,
+    ashby_records_typed,
+    greenhouse_record,
+    greenhouse_records,
+    greenhouse_records_typed,
+    lever_record,
+    lever_records,
+    lever_records_typed,
+    msgspec,
+)
+
+TITLES = ["Bioinformatics Scientist", "Data Engineer", "Computational Biologist", "Account Executive", "Scientist II"]
+LOCATIONS = ["Boston, MA", "Remote - US", "London, UK", "South San Francisco, CA", "Remote"]
+WORDS = ["python", "RNA-seq", "genome", "pipeline", "team", "benefits", "single cell", "the", "and", "with"]
+
+
+def synthetic_posting(rnd: random.Random, idx: int) -> dict:
+    posted = datetime.now(timezone.utc) - timedelta(days=rnd.randint(0, 60), minutes=rnd.randint(0, 1440))
+    body = "&lt;p&gt;" + " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(100, 600))) + "&lt;/p&gt;"
+    return {
+        "idx": idx,
+        "title": rnd.choice(TITLES),
+        "location": rnd.choice(LOCATIONS),
+        "posted": posted,
+        "body": body,
+        "department": rnd.choice(["R&D", "Engineering", "Commercial"]),
+    }
+
+
+def synthetic_payloads(boards: int, jobs: int, seed: int) -> dict[str, list[bytes]]:
+    rnd = random.Random(seed)
+    payloads: dict[str, list[bytes]] = {"greenhouse": [], "lever": [], "ashby": []}
+    for board in range(boards):
+        postings = [synthetic_posting(rnd, idx) for idx in range(jobs)]
+        # Real boards carry plenty of fields the pullers never read.
+        greenhouse = {
+            "jobs": [
+                {
+                    "id": 4000000 + board * 1000 + p["idx"],
+                    "internal_job_id": 3000000 + p["idx"],
+                    "title": p["title"],
+                    "location": {"name": p["location"]},
+                    "absolute_url": f"https://boards.greenhouse.io/b{board}/jobs/{p['idx']}",
+                    "updated_at": p["posted"].astimezone(timezone(timedelta(hours=-4))).isoformat(timespec="seconds"),
+                    "requisition_id": f"R{p['idx']:05d}",
+                    "metadata": [{"id": 1, "name": "Employment Type", "value": "Full-time", "value_type": "single_select"}],
+                    "departments": [{"id": 7, "name": p["department"], "child_ids": [], "parent_id": None}],
+                    "offices": [{"id": 9, "name": p["location"], "location": p["location"], "child_ids": []}],
+                    "content": p["body"],
+                }
+                for p in postings
+            ],
+            "meta": {"total": len(postings)},
+        }
+        lever = [
+            {
+                "id": f"{board:04x}-{p['idx']:08x}",
+                "text": p["title"],
+                "categories": {"location": p["location"], "team": p["department"], "commitment": "Full-time"},
+                "hostedUrl": f"https://jobs.lever.co/b{board}/{p['idx']}",
+                "applyUrl": f"https://jobs.lever.co/b{board}/{p['idx']}/apply",
+                "createdAt": int(p["posted"].timestamp() * 1000),
+                "descriptionPlain": p["body"],
+                "lists": [{"text": "Requirements", "content": p["body"][:400]}],
+                "description": p["body"],
+            }
+            for p in postings
+        ]
+        ashby = {
+            "apiVersion": "1",
+            "jobs": [
+                {
+                    "id": f"{board}-{p['idx']}",
+                    "title": p["title"],
+                    "location": p["location"],
+                    "department": p["department"],
+                    "isRemote": "Remote" in p["location"],
+                    "jobUrl": f"https://jobs.ashbyhq.com/b{board}/{p['idx']}",
+                    "updatedAt": p["posted"].isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+                    "descriptionPlain": p["body"],
+                    "description": p["body"],
+                }
+                for p in postings
+            ],
+        }
+        payloads["greenhouse"].append(json.dumps(greenhouse).encode("utf-8"))
+        payloads["lever"].append(json.dumps(lever).encode("utf-8"))
+        payloads["ashby"].append(json.dumps(ashby).encode("utf-8"))
+    return payloads
+
+
+def recorded_payloads(directory: str) -> dict[str, list[bytes]]:
+    payloads: dict[str, list[bytes]] = {"greenhouse": [], "lever": [], "ashby": []}
+    for source in payloads:
+        for path in sorted(Path(directory).glob(f"{source}*.json")):
+            payloads[source].append(path.read_bytes())
+    return payloads
+
+
+def parse_stdlib(source: str, body: bytes):
+    payload = json.loads(body)
+    return payload if source == "lever" else payload["jobs"]
+
+
+def parse_typed(source: str, body: bytes):
+    payload = msgspec.json.decode(body, type=JSON_SCHEMAS[source])
+    return payload if source == "lever" else payload.jobs
+
+
+def parse_stream(source: str, body: bytes):
+    chunks = (body[start : start + STREAM_CHUNK_BYTES] for start in range(0, len(body), STREAM_CHUNK_BYTES))
+    return JsonArrayReader(chunks, None if source == "lever" else "jobs")
+
+
+def streamed(build_one):
+    def build(company: str, jobs, list_source: str) -> list:
+        return [build_one(company, job, list_source) for job in jobs]
+
+    return build
+
+
+BUILDERS = {
+    "stdlib": {"greenhouse": greenhouse_records, "lever": lever_records, "ashby": ashby_records},
+    "typed": {"greenhouse": greenhouse_records_typed, "lever": lever_records_typed, "ashby": ashby_records_typed},
+    "stream": {"greenhouse": streamed(greenhouse_record), "lever": streamed(lever_record), "ashby": streamed(ashby_record)},
+}
+PARSERS = {"stdlib": parse_stdlib, "typed": parse_typed, "stream": parse_stream}
+
+
+def measure(mode: str, source: str, bodies: list[bytes], rounds: int) -> tuple[float, float, float, list]:
+    """Seconds to parse, seconds to parse and build records, peak traced bytes, and the records."""
+    parse = PARSERS[mode]
+    build = BUILDERS[mode][source]
+    records = [record for body in bodies for record in build("Bench", parse(source, body), "bench")]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for body in bodies:
+            for _ in parse(source, body):
+                pass
+    parse_time = (time.perf_counter() - start) / rounds
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for body in bodies:
+            build("Bench", parse(source, body), "bench")
+    total_time = (time.perf_counter() - start) / rounds
+    peaks = []
+    for body in bodies:
+        tracemalloc.start()
+        build("Bench", parse(source, body), "bench")
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return parse_time, total_time, sum(peaks), records
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare stdlib, typed and streamed JSON decoding into JobRecords.")
+    parser.add_argument("--payload-dir", help="Recorded greenhouse*/lever*/ashby*.json payloads; synthetic if omitted.")
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--jobs-per-board", type=int, default=150)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    if msgspec is None:
+        print("msgspec is not installed; nothing to compare")
+        return 1
+    args = parse_args()
+    if args.payload_dir:
+        payloads = recorded_payloads(args.payload_dir)
+    else:
+        payloads = synthetic_payloads(args.boards, args.jobs_per_board, args.seed)
+
+    failed = False
+    for source, bodies in payloads.items():
+        if not bodies:
+            continue
+        results = {mode: measure(mode, source, bodies, args.rounds) for mode in PARSERS}
+        expected = results["stdlib"][3]
+        postings = max(1, len(expected))
+        print(f"{source}: {len(bodies)} payloads, {len(expected)} postings, {sum(map(len, bodies)) / 1048576:.1f} MiB")
+        for mode, (parse_time, total_time, peak, records) in results.items():
+            print(
+                f"  {mode:<6} decode {parse_time / postings * 1e6:6.1f} us/posting, "
+                f"with records {total_time / postings * 1e6:6.1f} us/posting, "
+                f"{peak / postings / 1024:5.1f} KiB peak/posting"
+            )
+            if [r.to_json() for r in records] != [r.to_json() for r in expected]:
+                print(f"  {mode} records differ from the stdlib path")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark the threaded and async fetch engines against a local mock ATS server."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pull_jobs
+from pull_jobs import HOST_SCHEDULER, AsyncFetchEngine, SessionPool, iter_target_jobs
+
+
+def mock_jobs(board: str, count: int) -> list[dict]:
+    rnd = random.Random(board)
+    today = date.today()
+    return [
+        {
+            "id": f"{board}-{idx}",
+            "title": rnd.choice(["Bioinformatics Scientist", "Data Engineer", "Computational Biologist"]),
+            "location": rnd.choice(["Boston, MA", "Remote - US", "London, UK"]),
+            "date": (today - timedelta(days=rnd.randint(0, 20))).isoformat(),
+        }
+        for idx in range(count)
+    ]
+
+
+def make_handler(latency: float, jobs_per_board: int) -> type[BaseHTTPRequestHandler]:
+    class MockAtsHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            return
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            parts = self.path.split("?")[0].strip("/").split("/")
+            if len(parts) < 2 or parts[1].startswith("missing"):
+                body = b"{}"
+                status = 404
+            else:
+                kind, board = parts[0], parts[1]
+                jobs = mock_jobs(board, jobs_per_board)
+                status = 200
+                if kind == "greenhouse":
+                    payload = {
+                        "jobs": [
+                            {
+                                "id": job["id"],
+                                "title": job["title"],
+                                "location": {"name": job["location"]},
+                                "absolute_url": f"https://example.com/{job['id']}",
+                                "updated_at": f"{job['date']}T09:00:00-04:00",
+                                "content": "&lt;p&gt;Python, R and RNA-seq.&lt;/p&gt;",
+                            }
+                            for job in jobs
+                        ]
+                    }
+                elif kind == "lever":
+                    payload = [
+                        {
+                            "id": job["id"],
+                            "text": job["title"],
+                            "categories": {"location": job["location"]},
+                            "hostedUrl": f"https://example.com/{job['id']}",
+                            "createdAt": 1760000000000,
+                            "description": "Python, R and RNA-seq.",
+                        }
+                        for job in jobs
+                    ]
+                else:
+                    payload = {
+                        "jobs": [
+                            {
+                                "id": job["id"],
+                                "title": job["title"],
+                                "location": job["location"],
+                                "jobUrl": f"https://example.com/{job['id']}",
+                                "updatedAt": f"{job['date']}T00:00:00.000Z",
+                                "description": "Python, R and RNA-seq.",
+                            }
+                            for job in jobs
+                        ]
+                    }
+                body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return MockAtsHandler
+
+
+def build_targets(base_url: str, count: int) -> list[tuple[dict, str]]:
+    kinds = ["greenhouse", "lever", "ashby"]
+    targets = []
+    for idx in range(count):
+        kind = kinds[idx % len(kinds)]
+        board = f"missing{idx}" if idx % 25 == 0 else f"board{idx}"
+        row = {"company_name": f"Company {idx}", "api_name": kind, "api_url": f"{base_url}/{kind}/{board}"}
+        targets.append((row, "bench"))
+    return targets
+
+
+def run_engine(targets: list[tuple[dict, str]], workers: int, sessions) -> tuple[float, list[str], list[str]]:
+    pull_jobs.FAILURE_LOG.clear()
+    start = time.perf_counter()
+    records = [
+        job.to_json(sort_keys=True)
+        for _, jobs in iter_target_jobs(targets, workers, sessions)
+        for job in jobs
+    ]
+    elapsed = time.perf_counter() - start
+    stats = sessions.connection_stats()
+    sessions.close()
+    failures = sorted(json.dumps(row, sort_keys=True) for row in pull_jobs.FAILURE_LOG)
+    print(f"    {len(records)} jobs in {elapsed:.2f}s; {stats['opened']} connections opened, {stats['reused']} reused")
+    return elapsed, sorted(records), failures
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare --engine threads and --engine async throughput.")
+    parser.add_argument("--targets", type=int, default=300)
+    parser.add_argument("--jobs-per-board", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.15, help="Mock server delay per request (seconds).")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[3, 64, 200],
+        help="In-flight request levels; each runs both engines at that level (3 is the GitHub runner's thread default).",
+    )
+    parser.add_argument("--json-decoder", choices=["typed", "stdlib", "stream"], default="typed")
+    parser.add_argument("--host-rate", type=float, default=1000.0, help="Token-bucket rate per host (requests per second).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    HOST_SCHEDULER.configure(args.host_rate)
+    pull_jobs.JSON_DECODER = args.json_decoder
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency, args.jobs_per_board))
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    targets = build_targets(f"http://127.0.0.1:{server.server_address[1]}", args.targets)
+
+    # Every mock board shares one host, so the per-host limit is the level too.
+    runs = []
+    for level in args.concurrency:
+        print(f"{level} in flight:")
+        print("  threads:")
+        thread_run = run_engine(targets, level, SessionPool(level))
+        print("  async:")
+        engine = AsyncFetchEngine(level, level)
+        async_run = run_engine(targets, engine.concurrency, engine)
+        print(f"  async / threads: {thread_run[0] / async_run[0]:.2f}x")
+        runs.extend([thread_run, async_run])
+    server.shutdown()
+
+    _, records, failures = runs[0]
+    if any(run[1] != records or run[2] != failures for run in runs):
+        print("Engines disagree on records or failure log")
+        return 1
+    print(f"Identical output across all runs ({len(records)} jobs, {len(failures)} failures)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
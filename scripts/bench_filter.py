@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark in-process filtering against a FilterPool on a synthetic corpus."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from pull_jobs import FilterPool, JobRecord, compile_filter, filter_jobs, load_json
+
+TITLES = [
+    "Bioinformatics Scientist", "Senior Bioinformatics Engineer", "Computational Biologist II", "Sales Manager",
+    "Pipeline Strategy Lead", "Software Engineer, Front End", "Data Scientist", "Genomics Research Associate",
+    "Principal Scientist, NGS", "Director of Omics", "Scientist, Single-Cell", "Research Scientist - RNA",
+    "Workflow Engineer", "Intern, Computational Biology", "Business Analyst", "Account Executive",
+]
+LOCATIONS = [
+    "Boston, MA", "San Diego, CA", "Remote - US", "London, UK", "Remote", "Toronto, Canada", "",
+    "United States", "Hybrid - Cambridge, MA", "Singapore", "New York, NY", "Remote, EMEA",
+]
+WORDS = [
+    "python", "R", "RNA-seq", "genome", "cell", "protein", "5+ years", "PhD", "single cell", "NGS", "variant",
+    "clinical", "nextflow", "snakemake", "docker", "aws", "machine learning", "statistics", "<p>", "</p>",
+    "pathway", "assay", "Seurat", "scanpy", "omics", "sequencing", "the", "team", "with", "and", "benefits",
+]
+
+
+def synthetic_jobs(count: int, words: int, seed: int) -> list[JobRecord]:
+    rnd = random.Random(seed)
+    today = date.today()
+    jobs = []
+    for idx in range(count):
+        posted = today - timedelta(days=rnd.randint(0, 40))
+        jobs.append(
+            JobRecord(
+                company=f"Company {idx % 1000}",
+                job_title=rnd.choice(TITLES),
+                location=rnd.choice(LOCATIONS),
+                remote_or_hybrid="unknown",
+                posting_date=posted.isoformat() if rnd.random() < 0.8 else "",
+                source=rnd.choice(["greenhouse", "lever", "ashby"]),
+                job_url=f"https://example.com/{idx}",
+                job_id=str(idx),
+                description=" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(0, words))),
+                list_source="bench",
+            )
+        )
+    return jobs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare single-process and process-pool filtering.")
+    parser.add_argument("--filter", default="data/jobs_filter.json")
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    filter_cfg = load_json(Path(args.filter))
+    jobs = synthetic_jobs(args.jobs, args.words, args.seed)
+
+    start = time.perf_counter()
+    serial = filter_jobs(jobs, compile_filter(filter_cfg))
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pool = FilterPool(compile_filter(filter_cfg), args.workers, args.chunk_size)
+    pooled = pool.filter(jobs)
+    pool.close()
+    pooled_time = time.perf_counter() - start
+
+    print(f"Jobs: {len(jobs)}; passed: {len(serial[0])}; dropped: {len(serial[1])}")
+    print(f"Single process: {serial_time:.2f}s")
+    print(f"{args.workers} worker processes: {pooled_time:.2f}s (including pool start-up)")
+    if serial != pooled:
+        print("Process pool disagrees with the single-process filter")
+        return 1
+    print(f"Identical output; speed-up {serial_time / pooled_time:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark the HTML link extractors on saved careers pages."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from pull_jobs import LINK_EXTRACTORS, links_from_soup
+
+ROLES = ["Bioinformatics Scientist", "Data Engineer", "Computational Biologist", "Research Associate", "QA Analyst"]
+NAV = ["Why join us", "Students and graduates", "Our departments", "Benefits", "Locations", "Contact"]
+
+
+def synthetic_page(seed: int, jobs: int) -> str:
+    rnd = random.Random(seed)
+    nav = "".join(f'<li class="nav"><a href="/careers/{idx}"><span>{label}</span></a></li>' for idx, label in enumerate(NAV))
+    rows = []
+    for idx in range(jobs):
+        title = rnd.choice(ROLES)
+        rows.append(
+            f'<tr class="job-row"><td><a href="/jobs/{seed}-{idx}/apply?src=careers&amp;ref=list">'
+            f"<strong>{title}</strong> &ndash; Team {idx % 7}</a></td>"
+            f'<td>{rnd.choice(["Boston, MA", "Remote", "San Diego, CA"])}</td>'
+            f'<td><a href="https://other.example.com/share?job={idx}">Share</a></td></tr>'
+        )
+    script = "<script>window.__STATE__ = {jobs: [], filters: {}};</script>"
+    return (
+        "<!DOCTYPE html><html><head><title>Careers</title>"
+        f"{script}<style>.job-row td {{ padding: 4px }}</style></head><body>"
+        f"<header><ul>{nav}</ul></header><main><table>{''.join(rows)}</table></main>"
+        "<footer><a href='/privacy'>Privacy</a> <a href='/jobs'>All jobs</a></footer></body></html>"
+    )
+
+
+def load_pages(pages_dir: str | None, count: int, jobs: int) -> list[str]:
+    if pages_dir:
+        return [
+            path.read_text(encoding="utf-8", errors="replace")
+            for path in sorted(Path(pages_dir).glob("**/*.htm*"))
+        ]
+    return [synthetic_page(seed, jobs) for seed in range(count)]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare link extractors for icims/rippling/careers_url pages.")
+    parser.add_argument("--pages-dir", help="Directory of saved careers pages (*.html); synthetic pages if omitted.")
+    parser.add_argument("--pages", type=int, default=200, help="Synthetic pages to generate.")
+    parser.add_argument("--jobs-per-page", type=int, default=150)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    pages = load_pages(args.pages_dir, args.pages, args.jobs_per_page)
+    if not pages:
+        print("No pages to benchmark")
+        return 1
+    expected = [links_from_soup(page) for page in pages]
+    print(f"Pages: {len(pages)}; {sum(len(page) for page in pages) / len(pages) / 1024:.0f} KiB average")
+
+    failed = False
+    for name, extractor in sorted(LINK_EXTRACTORS.items()):
+        start = time.perf_counter()
+        mismatches = 0
+        for page, links in zip(pages, expected):
+            try:
+                if extractor(page) != links:
+                    mismatches += 1
+            except Exception:
+                mismatches += 1
+        elapsed = time.perf_counter() - start
+
+        peaks = []
+        for page in pages:
+            tracemalloc.start()
+            try:
+                extractor(page)
+            except Exception:
+                pass
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        print(
+            f"  {name:<10} {elapsed / len(pages) * 1000:7.2f} ms/page  "
+            f"{sum(peaks) / len(peaks) / 1024:8.0f} KiB peak/page  "
+            f"{mismatches} pages differ from soup"
+        )
+        failed = failed or (name == "tokenizer" and mismatches > 0)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark KeywordMatcher against the per-token match_token path it replaced."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+
+from pull_jobs import NON_US_LOCATION_TOKENS, KeywordMatcher, load_json, normalize, upper_list
+
+FILLER = [
+    "the", "team", "will", "work", "with", "our", "data", "scientists", "to", "build",
+    "models", "and", "tools", "for", "drug", "discovery", "experience", "in", "a", "fast",
+    "paced", "environment", "is", "required", "benefits", "include", "equity", "and", "pto",
+]
+
+
+# Frozen copy of the per-token matcher KeywordMatcher replaced, kept as the
+# reference for both output and timing.
+def match_token(token: str, text_norm: str) -> bool:
+    token_norm = normalize(token)
+    if not token_norm:
+        return False
+    if " " in token_norm:
+        return token_norm in text_norm
+    if len(token_norm) <= 3:
+        return re.search(rf"\b{re.escape(token_norm)}\b", text_norm) is not None
+    return token_norm in text_norm
+
+
+def match_any(tokens: list[str], text_norm: str) -> bool:
+    return any(match_token(token, text_norm) for token in tokens or [])
+
+
+def count_matches(tokens: list[str], text_norm: str) -> int:
+    return sum(1 for token in tokens or [] if match_token(token, text_norm))
+
+
+def keyword_lists(filter_cfg: dict) -> dict[str, list[str]]:
+    scoring = filter_cfg.get("keyword_scoring", {})
+    return {
+        "title_soft": upper_list(filter_cfg.get("title_filter", {}).get("soft_include_any", [])),
+        "non_us_location": list(NON_US_LOCATION_TOKENS),
+        "experience": upper_list(filter_cfg.get("experience_filter", {}).get("exclude_if_contains_any", [])),
+        "global_exclude": upper_list(filter_cfg.get("global_exclusions", {}).get("exclude_if_contains_any", [])),
+        "scoring_strong": upper_list(scoring.get("strong", [])),
+        "scoring_medium": upper_list(scoring.get("medium", [])),
+        "scoring_nice": upper_list(scoring.get("nice_to_have", [])),
+    }
+
+
+def synthetic_texts(lists: dict[str, list[str]], count: int, words: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    vocab = [token for tokens in lists.values() for token in tokens]
+    texts = []
+    for _ in range(count):
+        parts = [rnd.choice(vocab) if rnd.random() < 0.08 else rnd.choice(FILLER) for _ in range(words)]
+        texts.append(normalize(" ".join(parts)))
+    return texts
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare compiled and per-token keyword matching.")
+    parser.add_argument("--filter", default="data/jobs_filter.json")
+    parser.add_argument("--jobs", type=int, default=2800)
+    parser.add_argument(
+        "--words", type=int, nargs="+", default=[8, 400], help="Text lengths to time: title-sized and description-sized."
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def compare(lists: dict[str, list[str]], matchers: dict[str, KeywordMatcher], texts: list[str]) -> None:
+    for name, tokens in lists.items():
+        matcher = matchers[name]
+        for text in texts:
+            if matcher.match_any(text) != match_any(tokens, text):
+                raise SystemExit(f"match_any mismatch in {name}")
+            if matcher.count_matches(text) != count_matches(tokens, text):
+                raise SystemExit(f"count_matches mismatch in {name}")
+
+    start = time.perf_counter()
+    for tokens in lists.values():
+        for text in texts:
+            match_any(tokens, text)
+            count_matches(tokens, text)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for matcher in matchers.values():
+        for text in texts:
+            matcher.match_any(text)
+            matcher.count_matches(text)
+    compiled_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for matcher in matchers.values():
+        for text in texts:
+            matcher.match_any(text)
+    any_time = time.perf_counter() - start
+
+    print(f"  Per-token path: {legacy_time:.3f}s")
+    print(f"  Compiled path:  {compiled_time:.3f}s ({any_time:.3f}s of it match_any)")
+    if compiled_time:
+        print(f"  Speed-up: {legacy_time / compiled_time:.1f}x")
+
+
+def main() -> int:
+    args = parse_args()
+    lists = keyword_lists(load_json(Path(args.filter)))
+
+    start = time.perf_counter()
+    matchers = {name: KeywordMatcher(tokens) for name, tokens in lists.items()}
+    compile_time = time.perf_counter() - start
+    print(f"Lists: {len(lists)}; tokens: {sum(len(t) for t in lists.values())}; compile {compile_time * 1000:.1f}ms")
+
+    for words in args.words:
+        texts = synthetic_texts(lists, args.jobs, words, args.seed)
+        print(f"Jobs: {len(texts)} of {words} words (~{sum(map(len, texts)) // len(texts)} chars):")
+        compare(lists, matchers, texts)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,25 +4,57 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import codecs
 import os
 import csv
+import random
+import gzip
+import hashlib
+import html
 import json
+import math
+import multiprocessing
 import re
 import socket
+import sqlite3
+import sys
 import time
+import zlib
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable
-from threading import Lock
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from urllib.parse import urlparse
+from typing import Callable, Iterable, Iterator
+from threading import BoundedSemaphore, Lock, Thread, local
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
+from heapq import heappop, heappush
+from html.parser import HTMLParser
+import itertools
+from json.encoder import encode_basestring_ascii
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
 from bs4 import BeautifulSoup
 from bs4 import XMLParsedAsHTMLWarning
+from bs4.dammit import EntitySubstitution
+from lxml import html as lxml_html
 import warnings
 
+try:
+    import msgspec
+except ImportError:  # typed decoding is optional; pullers fall back to resp.json()
+    msgspec = None
+
 USER_AGENT = "bioinfo-job-tracker/1.0"
 
 FAILURE_LOG: list[dict] = []
@@ -50,18 +82,132 @@ def log_failure(
         )
 
 
-@dataclass
+JOB_FIELDS = (
+    "company",
+    "job_title",
+    "location",
+    "remote_or_hybrid",
+    "posting_date",
+    "source",
+    "job_url",
+    "job_id",
+    "description",
+    "list_source",
+)
+JOB_JSON_KEYS = tuple(f'"{name}": ' for name in JOB_FIELDS)
+JOB_SORTED_FIELDS = tuple(sorted(range(len(JOB_FIELDS)), key=lambda idx: JOB_FIELDS[idx]))
+DESCRIPTION_COMPRESS_MIN = 512
+
+
+def json_value(value) -> str:
+    return encode_basestring_ascii(value) if type(value) is str else json.dumps(value)
+
+
 class JobRecord:
-    company: str
-    job_title: str
-    location: str
-    remote_or_hybrid: str
-    posting_date: str
-    source: str
-    job_url: str
-    job_id: str
-    description: str
-    list_source: str
+    """One posting, kept small because every record of a run can be alive at once.
+
+    company, source and list_source repeat across thousands of records and
+    are interned. Descriptions of DESCRIPTION_COMPRESS_MIN chars or more are
+    stored zlib-compressed and only inflated when read.
+    """
+
+    __slots__ = (
+        "company",
+        "job_title",
+        "location",
+        "remote_or_hybrid",
+        "posting_date",
+        "source",
+        "job_url",
+        "job_id",
+        "_description",
+        "list_source",
+        "first_seen",
+        "stale",
+    )
+
+    def __init__(
+        self,
+        company: str,
+        job_title: str,
+        location: str,
+        remote_or_hybrid: str,
+        posting_date: str,
+        source: str,
+        job_url: str,
+        job_id: str,
+        description: str,
+        list_source: str,
+    ) -> None:
+        self.company = sys.intern(company) if type(company) is str else company
+        self.job_title = job_title
+        self.location = location
+        self.remote_or_hybrid = remote_or_hybrid
+        self.posting_date = posting_date
+        self.source = sys.intern(source) if type(source) is str else source
+        self.job_url = job_url
+        self.job_id = job_id
+        self.description = description
+        self.list_source = sys.intern(list_source) if type(list_source) is str else list_source
+        # When this run's lifecycle index first saw the posting; not part of
+        # the serialized record.
+        self.first_seen = ""
+        # Served from the HTTP cache for a target the time budget deferred,
+        # not fetched this run; not part of the serialized record either.
+        self.stale = False
+
+    @property
+    def description(self) -> str:
+        value = self._description
+        if type(value) is bytes:
+            return zlib.decompress(value).decode("utf-8")
+        return value
+
+    @description.setter
+    def description(self, value: str) -> None:
+        if type(value) is str and len(value) >= DESCRIPTION_COMPRESS_MIN:
+            self._description = zlib.compress(value.encode("utf-8"), 1)
+        else:
+            self._description = value
+
+    def values(self) -> tuple:
+        return (
+            self.company,
+            self.job_title,
+            self.location,
+            self.remote_or_hybrid,
+            self.posting_date,
+            self.source,
+            self.job_url,
+            self.job_id,
+            self.description,
+            self.list_source,
+        )
+
+    def to_dict(self) -> dict:
+        return dict(zip(JOB_FIELDS, self.values()))
+
+    def to_json(self, sort_keys: bool = False) -> str:
+        """Same text as json.dumps(job.to_dict(), ensure_ascii=True, sort_keys=sort_keys)."""
+        values = self.values()
+        order = JOB_SORTED_FIELDS if sort_keys else range(len(JOB_FIELDS))
+        return "{" + ", ".join([JOB_JSON_KEYS[idx] + json_value(values[idx]) for idx in order]) + "}"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JobRecord):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in zip(JOB_FIELDS, self.values()))
+        return f"JobRecord({fields})"
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 def normalize_text(text: str) -> str:
@@ -103,6 +249,14 @@ def age_days(posting_date: str) -> int | None:
         return None
 
 
+def posting_age(job: JobRecord) -> int | None:
+    """Age from the ATS posting date, or from when the posting was first seen if the ATS gives none."""
+    age = age_days(job.posting_date)
+    if age is None and job.first_seen:
+        age = age_days(job.first_seen)
+    return age
+
+
 def load_json(path: Path) -> dict:
     with path.open(encoding="utf-8") as handle:
         return json.load(handle)
@@ -136,39 +290,829 @@ def load_targets(paths: list[Path]) -> list[tuple[dict, str]]:
     return unique
 
 
+class AsyncBridgeSession:
+    """requests.Session stand-in whose GETs run on an AsyncFetchEngine loop.
+
+    Pullers call get() from worker threads exactly as they would on a
+    requests.Session; the request itself is awaited on the engine's event
+    loop and handed back as a regular requests.Response. With stream=True
+    its body is left on the connection and read through an AsyncBody.
+    """
+
+    def __init__(self, engine: "AsyncFetchEngine") -> None:
+        self.engine = engine
+        self.headers = {"User-Agent": USER_AGENT}
+
+    def get(
+        self,
+        url: str,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return self.engine.run(
+            self.engine.fetch("GET", url, merged, timeout, allow_redirects, telemetry=current_telemetry(), stream=stream)
+        )
+
+    def post(
+        self,
+        url: str,
+        json: dict | None = None,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return self.engine.run(self.engine.fetch("POST", url, merged, timeout, allow_redirects, json, current_telemetry()))
+
+
+class AsyncBody:
+    """File-like raw body of a streamed async response, for requests.Response.iter_content.
+
+    Each read() awaits the next bytes on the engine loop, so a worker thread
+    parses one chunk while the next is still arriving. The connection and
+    its per-host slot are released at the end of the body or on close().
+    """
+
+    def __init__(self, engine: "AsyncFetchEngine", resp, slot: asyncio.Semaphore) -> None:
+        self.engine = engine
+        self._resp = resp
+        self._slot = slot
+        self._open = True
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._open:
+            return b""
+        try:
+            chunk = self.engine.run(self._resp.content.read(size))
+        except BaseException:
+            self.close()
+            raise
+        if not chunk:
+            self.close()
+        return chunk
+
+    def close(self) -> None:
+        if self._open:
+            self._open = False
+            self.engine.loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        self._resp.release()
+        self._slot.release()
+
+
+class AsyncFetchEngine:
+    """aiohttp transport for `--engine async`, shaped like SessionPool.
+
+    One event loop on a background thread owns a single aiohttp connector, so
+    in-flight requests are bounded by `concurrency` overall and `per_host` per
+    host instead of by the CPU-derived worker count. Pullers and their parsing
+    stay in worker threads and never run on the loop.
+    """
+
+    def __init__(self, concurrency: int, per_host: int) -> None:
+        try:
+            import aiohttp
+        except ImportError as exc:
+            raise SystemExit("--engine async requires aiohttp (pip install aiohttp)") from exc
+        self._aiohttp = aiohttp
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self.loop.run_forever, name="async-fetch", daemon=True)
+        self._thread.start()
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._stats = {"opened": 0, "reused": 0}
+        self._hosts: set[str] = set()
+        self._client = asyncio.run_coroutine_threadsafe(self._open(), self.loop).result()
+        self._session = AsyncBridgeSession(self)
+
+    async def _open(self):
+        aiohttp = self._aiohttp
+        trace = aiohttp.TraceConfig()
+
+        async def on_create(session, ctx, params) -> None:
+            self._stats["opened"] += 1
+
+        async def on_reuse(session, ctx, params) -> None:
+            self._stats["reused"] += 1
+
+        # Connection set-up and DNS timings go to the target's telemetry
+        # record, handed over as trace_request_ctx. The lookup happens inside
+        # connection set-up, so it is taken out of connect_s as on the
+        # threaded engine.
+        async def on_create_start(session, ctx, params) -> None:
+            ctx.connect_started = time.perf_counter()
+            ctx.dns_seconds = 0.0
+
+        async def on_create_end(session, ctx, params) -> None:
+            add_telemetry(ctx.trace_request_ctx, "connections")
+            add_telemetry(
+                ctx.trace_request_ctx, "connect_s", time.perf_counter() - ctx.connect_started - ctx.dns_seconds
+            )
+
+        async def on_dns_start(session, ctx, params) -> None:
+            ctx.dns_started = time.perf_counter()
+
+        async def on_dns_end(session, ctx, params) -> None:
+            ctx.dns_seconds = time.perf_counter() - ctx.dns_started
+            add_telemetry(ctx.trace_request_ctx, "dns_s", ctx.dns_seconds)
+
+        trace.on_connection_create_end.append(on_create)
+        trace.on_connection_reuseconn.append(on_reuse)
+        trace.on_connection_create_start.append(on_create_start)
+        trace.on_connection_create_end.append(on_create_end)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ttl_dns_cache=600)
+        return aiohttp.ClientSession(connector=connector, trace_configs=[trace])
+
+    async def fetch(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        timeout: int,
+        allow_redirects: bool,
+        json_body: dict | None = None,
+        telemetry: dict | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        host = (urlparse(url).hostname or "").lower()
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+            self._hosts.add(host)
+        await limit.acquire()
+        try:
+            started = time.perf_counter()
+            resp = await self._client.request(
+                method,
+                url,
+                json=json_body,
+                headers=headers,
+                allow_redirects=allow_redirects,
+                timeout=self._aiohttp.ClientTimeout(total=timeout),
+                trace_request_ctx=telemetry,
+            )
+        except BaseException:
+            limit.release()
+            raise
+        # Rebuild a requests.Response so .text/.json() decode exactly as
+        # they do on the threaded engine.
+        result = requests.Response()
+        result.status_code = resp.status
+        result.reason = resp.reason
+        result.headers = CaseInsensitiveDict(resp.headers)
+        result.url = str(resp.url)
+        result.encoding = get_encoding_from_headers(result.headers)
+        result.elapsed = timedelta(seconds=time.perf_counter() - started)
+        if stream:
+            result.raw = AsyncBody(self, resp, limit)
+            return result
+        try:
+            result._content = await resp.read()
+            result._content_consumed = True
+        finally:
+            resp.release()
+            limit.release()
+        return result
+
+    def run(self, coro):
+        """Await coro on the engine loop from a worker thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def session_for(self, url: str) -> AsyncBridgeSession:
+        return self._session
+
+    def connection_stats(self) -> dict[str, int]:
+        return {"hosts": len(self._hosts), **self._stats}
+
+    def close(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._client.close(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
 RETRY_STATUS = {429, 500, 502, 503, 504}
 
 
-def request_json(url: str, session: requests.Session, retries: int = 2, timeout: int = 20) -> dict | list | None:
-    for attempt in range(retries + 1):
+class TimedConnectMixin:
+    """Adds new-connection set-up time to the target's telemetry: the DNS lookup as dns_s, TCP and TLS as connect_s."""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        self._dns_seconds = 0.0
+        super().connect()
+        note_request("connections")
+        note_request("dns_s", self._dns_seconds)
+        note_request("connect_s", time.perf_counter() - started - self._dns_seconds)
+
+    def _new_conn(self) -> socket.socket:
+        # Resolve here, where the lookup can be timed on its own, then let
+        # urllib3 connect to each address in turn as create_connection would.
+        host = self._dns_host
+        started = time.perf_counter()
         try:
-            resp = session.get(url, timeout=timeout, allow_redirects=True)
+            addresses = socket.getaddrinfo(host.strip("[]"), self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as exc:
+            raise NameResolutionError(self.host, self, exc) from exc
+        finally:
+            self._dns_seconds = time.perf_counter() - started
+        if not addresses:
+            return super()._new_conn()
+        try:
+            for idx, (*_, sockaddr) in enumerate(addresses):
+                self._dns_host = sockaddr[0]
+                try:
+                    return super()._new_conn()
+                except (ConnectTimeoutError, NewConnectionError):
+                    if idx == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+
+
+class TimedHTTPConnection(TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class SessionPool:
+    """Thread-safe keep-alive sessions shared by every target on the same host.
+
+    Each host gets one requests.Session whose connection pool is sized to the
+    worker count, so concurrent targets on boards-api.greenhouse.io (and
+    friends) reuse warm TCP/TLS connections instead of handshaking per target.
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        self.pool_size = max(1, pool_size)
+        self._sessions: dict[str, requests.Session] = {}
+        self._lock = Lock()
+
+    def session_for(self, url: str) -> requests.Session:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT})
+                # Redirects can leave the host, so keep a few pools per session.
+                adapter = TimedHTTPAdapter(pool_connections=8, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def connection_stats(self) -> dict[str, int]:
+        opened = 0
+        requests_sent = 0
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            pools = session.get_adapter("https://").poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                requests_sent += pool.num_requests
+        return {
+            "hosts": len(sessions),
+            "opened": opened,
+            "reused": max(0, requests_sent - opened),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+class RetryLater(Exception):
+    """Hands the current target back to iter_target_jobs for a delayed retry."""
+
+    def __init__(self, host: str, delay: float) -> None:
+        super().__init__(f"{host} busy for {delay:.2f}s")
+        self.host = host
+        self.delay = delay
+
+
+class TargetDeferred(Exception):
+    """The time budget has no room left for this target; it goes first next run."""
+
+
+class HostScheduler:
+    """Adaptive per-host token buckets and retry bookkeeping shared by workers.
+
+    Each host earns `rate` request tokens per second, up to `burst`. A
+    throttled response halves that host's rate and closes it until its
+    Retry-After (or a jittered exponential backoff) has passed; successes
+    win the rate back gradually. Attempts are counted per (target, URL) so a
+    requeued target resumes its retry budget instead of starting over.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        burst: int = 20,
+        min_rate: float = 0.5,
+        base_delay: float = 0.8,
+        max_delay: float = 60.0,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"throttled": 0, "retries": 0, "requeued": 0}
+        self._hosts: dict[str, dict] = {}
+        self._attempts: dict[tuple, int] = {}
+        self._lock = Lock()
+
+    def configure(self, rate: float) -> None:
+        self.rate = max(self.min_rate, rate)
+        self.burst = max(1, int(self.rate))
+
+    def _bucket(self, host: str, now: float) -> dict:
+        bucket = self._hosts.get(host)
+        if bucket is None:
+            bucket = {"rate": self.rate, "tokens": float(self.burst), "updated": now, "not_before": 0.0}
+            self._hosts[host] = bucket
+        return bucket
+
+    def reserve(self, host: str) -> float:
+        """Take a token for host; return 0.0, or the seconds until one is free."""
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(host, now)
+            if now < bucket["not_before"]:
+                return bucket["not_before"] - now
+            bucket["tokens"] = min(self.burst, bucket["tokens"] + (now - bucket["updated"]) * bucket["rate"])
+            bucket["updated"] = now
+            if bucket["tokens"] >= 1:
+                bucket["tokens"] -= 1
+                return 0.0
+            return (1 - bucket["tokens"]) / bucket["rate"]
+
+    def backoff(self, host: str, attempt: int, retry_after: float | None, throttled: bool) -> float:
+        with self._lock:
+            if retry_after is not None:
+                delay = min(self.max_delay, max(0.0, retry_after))
+            else:
+                delay = random.uniform(0.5, 1.0) * min(self.max_delay, self.base_delay * (2 ** attempt))
+            self.stats["retries"] += 1
+            if throttled:
+                bucket = self._bucket(host, time.monotonic())
+                bucket["rate"] = max(self.min_rate, bucket["rate"] / 2)
+                bucket["not_before"] = max(bucket["not_before"], time.monotonic() + delay)
+                self.stats["throttled"] += 1
+            return delay
+
+    def succeeded(self, host: str) -> None:
+        with self._lock:
+            bucket = self._bucket(host, time.monotonic())
+            bucket["rate"] = min(self.rate, bucket["rate"] + self.rate * 0.1)
+
+    def attempt(self, key: tuple) -> int:
+        with self._lock:
+            return self._attempts.get(key, 0)
+
+    def advance(self, key: tuple) -> None:
+        with self._lock:
+            self._attempts[key] = self._attempts.get(key, 0) + 1
+
+    def finish(self, key: tuple) -> None:
+        with self._lock:
+            self._attempts.pop(key, None)
+
+    def requeued(self) -> None:
+        with self._lock:
+            self.stats["requeued"] += 1
+
+
+HOST_SCHEDULER = HostScheduler()
+REQUEST_CONTEXT = local()
+# Token waits this short are paced inline; anything longer requeues the target.
+INLINE_WAIT_SECONDS = 0.25
+
+
+TELEMETRY_LOCK = Lock()
+
+
+def current_telemetry() -> dict | None:
+    """The telemetry record of the target this thread is fetching, if any."""
+    return getattr(REQUEST_CONTEXT, "telemetry", None)
+
+
+def add_telemetry(record: dict | None, field: str, amount: float = 1) -> None:
+    # Page fan-out and the async loop can update one record from several threads.
+    if record is not None:
+        with TELEMETRY_LOCK:
+            record[field] += amount
+
+
+def note_request(field: str, amount: float = 1) -> None:
+    add_telemetry(current_telemetry(), field, amount)
+
+
+def request_key(url: str, json_body: dict | None = None) -> str:
+    """Identity of a request: the URL for GETs, method, URL and body for POSTs."""
+    if json_body is None:
+        return url
+    return f"POST {url} {json.dumps(json_body, sort_keys=True)}"
+
+
+def retry_after_seconds(resp: requests.Response) -> float | None:
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def scheduled_get(
+    url: str,
+    session: requests.Session,
+    retries: int,
+    timeout: int,
+    headers: dict | None = None,
+    decode=None,
+    json_body: dict | None = None,
+    stream: bool = False,
+):
+    """GET url under HOST_SCHEDULER, retrying 429/5xx and request errors.
+
+    Inside fetch_target a retry raises RetryLater so the worker can move on to
+    other hosts; elsewhere it waits inline. Returns decode(resp) (or resp) on
+    a final response, None once the retry budget is spent on errors. With
+    json_body the request is a POST of that body. With stream the body is
+    left unread for decode to consume through iter_body.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    target_key = getattr(REQUEST_CONTEXT, "target_key", None)
+    key = (target_key, request_key(url, json_body))
+    while True:
+        wait = HOST_SCHEDULER.reserve(host)
+        if wait > 0:
+            if target_key is not None and wait > INLINE_WAIT_SECONDS:
+                HOST_SCHEDULER.requeued()
+                note_request("requeues")
+                raise RetryLater(host, wait)
+            time.sleep(wait)
+            note_request("wait_s", wait)
+            continue
+        attempt = HOST_SCHEDULER.attempt(key)
+        try:
+            if json_body is None:
+                resp = session.get(url, timeout=timeout, allow_redirects=True, headers=headers, stream=stream)
+            else:
+                resp = session.post(url, json=json_body, timeout=timeout, allow_redirects=True, headers=headers)
             if resp.status_code in RETRY_STATUS and attempt < retries:
-                time.sleep(0.8 * (attempt + 1))
-                continue
-            if resp.status_code >= 400:
-                return None
-            return resp.json()
+                resp.close()
+                delay = HOST_SCHEDULER.backoff(host, attempt, retry_after_seconds(resp), throttled=True)
+            else:
+                result = decode(resp) if decode is not None else resp
+                HOST_SCHEDULER.finish(key)
+                if resp.status_code < 400:
+                    HOST_SCHEDULER.succeeded(host)
+                return result
         except Exception:
             if attempt >= retries:
+                HOST_SCHEDULER.finish(key)
                 return None
-            time.sleep(0.8 * (attempt + 1))
-    return None
+            delay = HOST_SCHEDULER.backoff(host, attempt, None, throttled=False)
+        HOST_SCHEDULER.advance(key)
+        note_request("retries")
+        if target_key is not None:
+            HOST_SCHEDULER.requeued()
+            note_request("requeues")
+            raise RetryLater(host, delay)
+        time.sleep(delay)
+        note_request("wait_s", delay)
 
 
-def request_text(url: str, session: requests.Session, retries: int = 2, timeout: int = 20) -> requests.Response | None:
-    for attempt in range(retries + 1):
-        try:
-            resp = session.get(url, timeout=timeout, allow_redirects=True, headers={"User-Agent": USER_AGENT})
-            if resp.status_code in RETRY_STATUS and attempt < retries:
-                time.sleep(0.8 * (attempt + 1))
+def decode_json(resp: requests.Response) -> dict | list | None:
+    if resp.status_code >= 400:
+        return None
+    return resp.json()
+
+
+# "typed" decodes Greenhouse, Lever and Ashby payloads straight into the
+# schemas below when msgspec is installed; "stream" decodes their jobs[]
+# one posting at a time as the body arrives (--json-decoder).
+JSON_DECODER = "typed"
+
+
+def typed_decoder(schema):
+    """decode_json that returns `schema` instances, or the dict tree when the payload does not fit it."""
+
+    def decode(resp: requests.Response):
+        if resp.status_code >= 400:
+            return None
+        if JSON_DECODER == "typed" and msgspec is not None:
+            try:
+                return msgspec.json.decode(resp.content, type=schema)
+            except msgspec.MsgspecError:
+                pass
+        return resp.json()
+
+    return decode
+
+
+def request_json(
+    url: str,
+    session: requests.Session,
+    retries: int = 2,
+    timeout: int = 20,
+    json_body: dict | None = None,
+    schema=None,
+) -> dict | list | None:
+    decode = decode_json if schema is None else typed_decoder(schema)
+    return scheduled_get(url, session, retries, timeout, decode=decode, json_body=json_body)
+
+
+def is_typed(value) -> bool:
+    return msgspec is not None and isinstance(value, msgspec.Struct)
+
+
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def iter_body(resp: requests.Response) -> Iterator[bytes]:
+    """The response body in chunks, read off the wire as they are consumed.
+
+    Session wrappers that need the whole body (HttpCache fingerprints) hook
+    in through resp.body_observers: each is called with every chunk and
+    then with b"" once the body is complete. Bodies that were already read
+    (revalidation) are replayed from memory.
+    """
+    observers = getattr(resp, "body_observers", ())
+    buffered = resp._content_consumed
+    chunks = resp.iter_content(STREAM_CHUNK_BYTES)
+    while True:
+        started = time.perf_counter()
+        chunk = next(chunks, None)
+        if not buffered:
+            note_request("fetch_s", time.perf_counter() - started)
+            note_request("bytes", len(chunk or b""))
+        if chunk is None:
+            break
+        for observer in observers:
+            observer(chunk)
+        yield chunk
+    for observer in observers:
+        observer(b"")
+
+
+class InvalidPayload(ValueError):
+    """Well-formed JSON that is not the shape the puller expects."""
+
+
+NON_WHITESPACE = re.compile(r"\S")
+# What may follow a complete number inside an array or object.
+JSON_NUMBER_END = frozenset(" \t\n\r,]}")
+
+
+class JsonArrayReader:
+    """Decodes the items of one JSON array from a chunked body, one at a time.
+
+    The array is the document itself, or the value of `key` in the top-level
+    object (a missing key reads as an empty array, like payload.get(key, [])).
+    Only the undecoded part of the body and the current item are held, so
+    memory follows the largest posting rather than the whole board. The rest
+    of the body is drained after the array so observers see all of it.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], key: str | None = None) -> None:
+        self.key = key
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder("utf-8-sig")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        for chunk in self._chunks:
+            piece = self._text.decode(chunk)
+            if piece:
+                self._buffer = self._buffer[self._pos :] + piece
+                self._pos = 0
+                return True
+        return False
+
+    def _peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the body."""
+        while True:
+            match = NON_WHITESPACE.search(self._buffer, self._pos)
+            if match:
+                self._pos = match.start()
+                return match.group()
+            self._pos = len(self._buffer)
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            # Another value where an object or array should open is the
+            # wrong shape; anything else is broken JSON.
+            if char in "{[" and found:
+                raise InvalidPayload(f"expected {char!r}, found {found!r}")
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def _separator(self, close: str) -> bool:
+        """Consumes ',' (False) or the closing bracket (True)."""
+        found = self._peek()
+        if found not in (",", close):
+            raise json.JSONDecodeError(f"Expecting ',' or {close!r}", self._buffer, self._pos)
+        self._pos += 1
+        return found == close
+
+    def _value(self):
+        self._peek()  # raw_decode does not skip leading whitespace
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value may run to the end of the chunk, and a number cut
+            # at "27048." or "1e" decodes as its prefix, so read on.
+            cut = end == len(self._buffer) or (
+                type(value) in (int, float) and self._buffer[end] not in JSON_NUMBER_END
+            )
+            if cut and self._fill():
                 continue
-            return resp
-        except Exception:
-            if attempt >= retries:
+            self._pos = end
+            return value
+
+    def _find_key(self) -> bool:
+        self._expect("{")
+        if self._peek() == "}":
+            return False
+        while True:
+            name = self._value()
+            if not isinstance(name, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+            self._expect(":")
+            if name == self.key:
+                return True
+            self._value()
+            if self._separator("}"):
+                return False
+
+    def __iter__(self) -> Iterator:
+        if self.key is None or self._find_key():
+            self._expect("[")
+            if self._peek() == "]":
+                self._pos += 1
+            else:
+                while True:
+                    yield self._value()
+                    if self._separator("]"):
+                        break
+        for _ in self._chunks:
+            pass
+
+
+def request_json_items(
+    url: str,
+    session: requests.Session,
+    key: str | None,
+    build: Callable,
+    retries: int = 2,
+    timeout: int = 20,
+) -> list | str | None:
+    """build(item) for each item of the payload's array, decoded as the body streams in.
+
+    Returns None when the request failed and "invalid_payload" when the body
+    is JSON of another shape. A body that breaks off is retried like any
+    other request error, and nothing built from it is kept.
+    """
+
+    def decode(resp: requests.Response):
+        try:
+            if resp.status_code >= 400:
                 return None
-            time.sleep(0.8 * (attempt + 1))
-    return None
+            try:
+                return [build(item) for item in JsonArrayReader(iter_body(resp), key)]
+            except InvalidPayload:
+                return "invalid_payload"
+        finally:
+            resp.close()
+
+    return scheduled_get(url, session, retries, timeout, decode=decode, stream=True)
+
+
+def parse_iso_date(value: str | None) -> str:
+    """parse_date for sources whose timestamps are ISO 8601; other strings still go through parse_date."""
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(value).date().isoformat()
+    except ValueError:
+        return parse_date(value)
+
+
+EPOCH_DATE = date(1970, 1, 1)
+
+
+def parse_epoch_ms_date(value: int | float | None) -> str:
+    """UTC date of an epoch-milliseconds timestamp (Lever createdAt)."""
+    if not value:
+        return ""
+    return (EPOCH_DATE + timedelta(days=value // 86_400_000)).isoformat()
+
+
+# Only the fields the pullers read are declared; msgspec skips the rest of
+# each posting without building it. The structs hold no cycles, so the
+# garbage collector need not track them.
+if msgspec is not None:
+
+    class GreenhouseLocation(msgspec.Struct, gc=False):
+        name: str | None = ""
+
+    class GreenhousePosting(msgspec.Struct, gc=False):
+        id: int | str | None = ""
+        title: str | None = None
+        location: GreenhouseLocation | None = None
+        absolute_url: str | None = None
+        updated_at: str | None = None
+        created_at: str | None = None
+        content: str | None = ""
+
+    class GreenhouseBoard(msgspec.Struct, gc=False):
+        jobs: list[GreenhousePosting] = []
+
+    class LeverCategories(msgspec.Struct, gc=False):
+        location: str | None = ""
+
+    class LeverPosting(msgspec.Struct, gc=False):
+        id: int | str | None = ""
+        text: str | None = None
+        categories: LeverCategories | None = None
+        hostedUrl: str | None = None
+        createdAt: int | float | None = None
+        description: str | None = ""
+
+    class AshbyPosting(msgspec.Struct, gc=False):
+        id: int | str | None = ""
+        title: str | None = None
+        location: str | None = ""
+        jobUrl: str | None = None
+        updatedAt: str | None = None
+        createdAt: str | None = None
+        description: str | None = ""
+
+    class AshbyBoard(msgspec.Struct, gc=False):
+        jobs: list[AshbyPosting] = []
+
+    JSON_SCHEMAS = {"greenhouse": GreenhouseBoard, "lever": list[LeverPosting], "ashby": AshbyBoard}
+else:
+    JSON_SCHEMAS = {}
+
+
+def request_text(url: str, session: requests.Session, retries: int = 2, timeout: int = 20) -> requests.Response | None:
+    return scheduled_get(url, session, retries, timeout, headers={"User-Agent": USER_AGENT})
 
 
 def detect_remote(text: str) -> str:
@@ -180,36 +1124,216 @@ def detect_remote(text: str) -> str:
     return "onsite"
 
 
+class DetailCache:
+    """Detail payloads keyed by URL, kept across runs while the posting's version is unchanged."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, list] = {}
+        self.used: dict[str, list] = {}
+        self._lock = Lock()
+
+    def get(self, url: str, version: str = ""):
+        with self._lock:
+            entry = self.used.get(url) or self.entries.get(url)
+            if entry is None or entry[0] != version:
+                return None
+            self.used[url] = entry
+            return entry[1]
+
+    def put(self, url: str, version: str, value) -> None:
+        with self._lock:
+            self.used[url] = [version, value]
+
+    def keep(self, urls: Iterable[str]) -> None:
+        """Carry last run's entries for urls into this run's, for postings reused without a lookup."""
+        with self._lock:
+            for url in urls:
+                entry = self.entries.get(url)
+                if entry is not None:
+                    self.used.setdefault(url, entry)
+
+    def load(self, path: Path) -> None:
+        if not path.exists():
+            return
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except Exception:
+            return
+        if isinstance(data, dict):
+            self.entries = data
+
+    def save(self, path: Path) -> None:
+        # Only this run's postings are kept, so closed postings age out.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as handle:
+            json.dump(self.used, handle, ensure_ascii=True)
+        os.replace(tmp_path, path)
+
+
+class GreenhouseTwoPhase:
+    """Two-phase Greenhouse pulls for `--greenhouse-two-phase`.
+
+    The board is listed without content=true and the listing filter stages
+    run on each posting. Only postings they keep get their /jobs/{id}
+    detail fetched, with bounded concurrency. The content comes from
+    `details` while the posting's updated_at is unchanged. Postings dropped
+    in phase one keep an empty description. That changes no filter result
+    (see FILTER_STAGES), but their drop reason can move to another stage.
+    """
+
+    def __init__(self, compiled: CompiledFilter, details: DetailCache) -> None:
+        self.compiled = compiled
+        self.details = details
+        self.stats = {"listed": 0, "skipped": 0, "reused": 0, "fetched": 0, "failed": 0}
+        self._lock = Lock()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def fill(
+        self,
+        company: str,
+        url: str,
+        versions: list[tuple],
+        records: list[JobRecord],
+        session,
+        list_source: str,
+    ) -> None:
+        """Fetch details for records the listing stages keep; versions holds each posting's (id, updated_at)."""
+        pipeline = self.compiled.pipeline
+        wanted = [
+            (version, record)
+            for version, record in zip(versions, records)
+            if pipeline.listing_drop_reason(JobFields(record, self.compiled)) is None
+        ]
+        self.count("listed", len(records))
+        self.count("skipped", len(records) - len(wanted))
+        # Details are keyed on updated_at here, so they stay out of the
+        # target's HTTP-cache fingerprints.
+        if isinstance(session, CachedSession):
+            session = session.session
+
+        def fetch(item: tuple[tuple, JobRecord]) -> None:
+            (job_id, updated_at), record = item
+            detail_url = self.detail_url(url, job_id)
+            version = str(updated_at)
+            content = self.details.get(detail_url, version)
+            if content is not None:
+                self.count("reused")
+            else:
+                payload = request_json(detail_url, session)
+                if not isinstance(payload, dict):
+                    self.count("failed")
+                    log_failure(company, "greenhouse", detail_url, list_source, "detail_failed")
+                    return
+                content = normalize_text(payload.get("content", ""))
+                self.details.put(detail_url, version, content)
+                self.count("fetched")
+            record.description = content
+
+        fetch_pages(fetch, wanted)
+
+    @staticmethod
+    def detail_url(url: str, job_id) -> str:
+        return f"{urlparse(url)._replace(query='', fragment='').geturl().rstrip('/')}/{job_id}"
+
+    def retain(self, url: str, records: list[JobRecord]) -> None:
+        """Keep the cached details of a board whose listing was reused as-is."""
+        self.details.keep(self.detail_url(url, record.job_id) for record in records)
+
+
+GREENHOUSE_TWO_PHASE: GreenhouseTwoPhase | None = None
+
+
+def greenhouse_listing_url(url: str, content: bool) -> str:
+    parsed = urlparse(url)
+    query = [part for part in parsed.query.split("&") if part and not part.startswith("content=")]
+    if content:
+        query.append("content=true")
+    return parsed._replace(query="&".join(query)).geturl()
+
+
 def pull_greenhouse(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
-    if "content=true" not in url:
+    two_phase = GREENHOUSE_TWO_PHASE
+    if two_phase is not None:
+        url = greenhouse_listing_url(url, content=False)
+    elif "content=true" not in url:
         separator = "&" if "?" in url else "?"
         url = f"{url}{separator}content=true"
-    payload = request_json(url, session)
-    if not isinstance(payload, dict):
-        log_failure(company, "greenhouse", url, list_source, "request_failed")
-        return []
-    jobs = payload.get("jobs", [])
-    if not isinstance(jobs, list):
-        log_failure(company, "greenhouse", url, list_source, "invalid_payload")
-        return []
+    if JSON_DECODER == "stream":
+        items = request_json_items(url, session, "jobs", lambda job: greenhouse_record(company, job, list_source, True))
+        if not isinstance(items, list):
+            log_failure(company, "greenhouse", url, list_source, items or "request_failed")
+            return []
+        results = [record for record, _ in items]
+        versions = [version for _, version in items]
+    else:
+        payload = request_json(url, session, schema=JSON_SCHEMAS.get("greenhouse"))
+        if is_typed(payload):
+            results = greenhouse_records_typed(company, payload.jobs, list_source)
+            versions = [(job.id, job.updated_at or "") for job in payload.jobs]
+        else:
+            if not isinstance(payload, dict):
+                log_failure(company, "greenhouse", url, list_source, "request_failed")
+                return []
+            jobs = payload.get("jobs", [])
+            if not isinstance(jobs, list):
+                log_failure(company, "greenhouse", url, list_source, "invalid_payload")
+                return []
+            results = greenhouse_records(company, jobs, list_source)
+            versions = [(job.get("id", ""), job.get("updated_at") or "") for job in jobs]
+    if two_phase is not None:
+        two_phase.fill(company, url, versions, results, session, list_source)
+    return results
+
+
+def greenhouse_records(company: str, jobs: list[dict], list_source: str) -> list[JobRecord]:
+    return [greenhouse_record(company, job, list_source) for job in jobs]
+
+
+def greenhouse_record(company: str, job: dict, list_source: str, with_version: bool = False):
+    """One posting's JobRecord; with_version also returns its (id, updated_at) for GreenhouseTwoPhase."""
+    title = normalize_text(job.get("title"))
+    loc = normalize_text(job.get("location", {}).get("name", ""))
+    job_url = normalize_text(job.get("absolute_url"))
+    posted = parse_date(job.get("updated_at") or job.get("created_at") or "")
+    remote = detect_remote(title + " " + loc)
+    record = JobRecord(
+        company=company,
+        job_title=title,
+        location=loc,
+        remote_or_hybrid=remote,
+        posting_date=posted,
+        source="greenhouse",
+        job_url=job_url,
+        job_id=str(job.get("id", "")),
+        description=normalize_text(job.get("content", "")),
+        list_source=list_source,
+    )
+    if with_version:
+        return record, (job.get("id", ""), job.get("updated_at") or "")
+    return record
+
+
+def greenhouse_records_typed(company: str, jobs: list, list_source: str) -> list[JobRecord]:
     results = []
     for job in jobs:
-        title = normalize_text(job.get("title"))
-        loc = normalize_text(job.get("location", {}).get("name", ""))
-        job_url = normalize_text(job.get("absolute_url"))
-        posted = parse_date(job.get("updated_at") or job.get("created_at") or "")
-        remote = detect_remote(title + " " + loc)
+        title = normalize_text(job.title)
+        loc = normalize_text(job.location.name if job.location is not None else "")
         results.append(
             JobRecord(
                 company=company,
                 job_title=title,
                 location=loc,
-                remote_or_hybrid=remote,
-                posting_date=posted,
+                remote_or_hybrid=detect_remote(title + " " + loc),
+                posting_date=parse_iso_date(job.updated_at or job.created_at),
                 source="greenhouse",
-                job_url=job_url,
-                job_id=str(job.get("id", "")),
-                description=normalize_text(job.get("content", "")),
+                job_url=normalize_text(job.absolute_url),
+                job_id=str(job.id),
+                description=normalize_text(job.content),
                 list_source=list_source,
             )
         )
@@ -217,29 +1341,62 @@ def pull_greenhouse(company: str, url: str, session: requests.Session, list_sour
 
 
 def pull_lever(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
-    payload = request_json(url, session)
+    if JSON_DECODER == "stream":
+        records = request_json_items(url, session, None, lambda job: lever_record(company, job, list_source))
+        if not isinstance(records, list):
+            log_failure(company, "lever", url, list_source, "request_failed")
+            return []
+        return records
+    payload = request_json(url, session, schema=JSON_SCHEMAS.get("lever"))
     if not isinstance(payload, list):
         log_failure(company, "lever", url, list_source, "request_failed")
         return []
+    if payload and is_typed(payload[0]):
+        return lever_records_typed(company, payload, list_source)
+    return lever_records(company, payload, list_source)
+
+
+def lever_records(company: str, jobs: list[dict], list_source: str) -> list[JobRecord]:
+    return [lever_record(company, job, list_source) for job in jobs]
+
+
+def lever_record(company: str, job: dict, list_source: str) -> JobRecord:
+    title = normalize_text(job.get("text"))
+    loc = normalize_text(job.get("categories", {}).get("location", ""))
+    job_url = normalize_text(job.get("hostedUrl"))
+    posted = parse_date(job.get("createdAt") and datetime.utcfromtimestamp(job.get("createdAt") / 1000).date().isoformat())
+    remote = detect_remote(title + " " + loc)
+    description = normalize_text(job.get("description", ""))
+    return JobRecord(
+        company=company,
+        job_title=title,
+        location=loc,
+        remote_or_hybrid=remote,
+        posting_date=posted,
+        source="lever",
+        job_url=job_url,
+        job_id=str(job.get("id", "")),
+        description=description,
+        list_source=list_source,
+    )
+
+
+def lever_records_typed(company: str, jobs: list, list_source: str) -> list[JobRecord]:
     results = []
-    for job in payload:
-        title = normalize_text(job.get("text"))
-        loc = normalize_text(job.get("categories", {}).get("location", ""))
-        job_url = normalize_text(job.get("hostedUrl"))
-        posted = parse_date(job.get("createdAt") and datetime.utcfromtimestamp(job.get("createdAt") / 1000).date().isoformat())
-        remote = detect_remote(title + " " + loc)
-        description = normalize_text(job.get("description", ""))
+    for job in jobs:
+        title = normalize_text(job.text)
+        loc = normalize_text(job.categories.location if job.categories is not None else "")
         results.append(
             JobRecord(
                 company=company,
                 job_title=title,
                 location=loc,
-                remote_or_hybrid=remote,
-                posting_date=posted,
+                remote_or_hybrid=detect_remote(title + " " + loc),
+                posting_date=parse_epoch_ms_date(job.createdAt),
                 source="lever",
-                job_url=job_url,
-                job_id=str(job.get("id", "")),
-                description=description,
+                job_url=normalize_text(job.hostedUrl),
+                job_id=str(job.id),
+                description=normalize_text(job.description),
                 list_source=list_source,
             )
         )
@@ -247,7 +1404,15 @@ def pull_lever(company: str, url: str, session: requests.Session, list_source: s
 
 
 def pull_ashby(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
-    payload = request_json(url, session)
+    if JSON_DECODER == "stream":
+        records = request_json_items(url, session, "jobs", lambda job: ashby_record(company, job, list_source))
+        if not isinstance(records, list):
+            log_failure(company, "ashby", url, list_source, records or "request_failed")
+            return []
+        return records
+    payload = request_json(url, session, schema=JSON_SCHEMAS.get("ashby"))
+    if is_typed(payload):
+        return ashby_records_typed(company, payload.jobs, list_source)
     if not isinstance(payload, dict):
         log_failure(company, "ashby", url, list_source, "request_failed")
         return []
@@ -255,12 +1420,83 @@ def pull_ashby(company: str, url: str, session: requests.Session, list_source: s
     if not isinstance(jobs, list):
         log_failure(company, "ashby", url, list_source, "invalid_payload")
         return []
+    return ashby_records(company, jobs, list_source)
+
+
+def ashby_records(company: str, jobs: list[dict], list_source: str) -> list[JobRecord]:
+    return [ashby_record(company, job, list_source) for job in jobs]
+
+
+def ashby_record(company: str, job: dict, list_source: str) -> JobRecord:
+    title = normalize_text(job.get("title"))
+    loc = normalize_text(job.get("location", ""))
+    job_url = normalize_text(job.get("jobUrl"))
+    posted = parse_date(job.get("updatedAt") or job.get("createdAt") or "")
+    remote = detect_remote(title + " " + loc)
+    return JobRecord(
+        company=company,
+        job_title=title,
+        location=loc,
+        remote_or_hybrid=remote,
+        posting_date=posted,
+        source="ashby",
+        job_url=job_url,
+        job_id=str(job.get("id", "")),
+        description=normalize_text(job.get("description", "")),
+        list_source=list_source,
+    )
+
+
+def ashby_records_typed(company: str, jobs: list, list_source: str) -> list[JobRecord]:
     results = []
     for job in jobs:
-        title = normalize_text(job.get("title"))
-        loc = normalize_text(job.get("location", ""))
-        job_url = normalize_text(job.get("jobUrl"))
-        posted = parse_date(job.get("updatedAt") or job.get("createdAt") or "")
+        title = normalize_text(job.title)
+        loc = normalize_text(job.location)
+        results.append(
+            JobRecord(
+                company=company,
+                job_title=title,
+                location=loc,
+                remote_or_hybrid=detect_remote(title + " " + loc),
+                posting_date=parse_iso_date(job.updatedAt or job.createdAt),
+                source="ashby",
+                job_url=normalize_text(job.jobUrl),
+                job_id=str(job.id),
+                description=normalize_text(job.description),
+                list_source=list_source,
+            )
+        )
+    return results
+
+
+# Upper bound on concurrent page requests a single paginated puller makes.
+PAGE_FAN_OUT = 4
+
+
+def fetch_pages(fetch, pages: list, fan_out: int = PAGE_FAN_OUT) -> list:
+    """Call fetch(page) for every page with bounded concurrency, in page order."""
+    if len(pages) <= 1 or fan_out <= 1:
+        return [fetch(page) for page in pages]
+    record = current_telemetry()
+
+    def fetch_page(page):
+        REQUEST_CONTEXT.telemetry = record
+        try:
+            return fetch(page)
+        finally:
+            REQUEST_CONTEXT.telemetry = None
+
+    with ThreadPoolExecutor(max_workers=min(fan_out, len(pages))) as pool:
+        return list(pool.map(fetch_page, pages))
+
+
+def parse_smartrecruiters_jobs(company: str, jobs: list, list_source: str) -> list[JobRecord]:
+    results = []
+    for job in jobs:
+        title = normalize_text(job.get("name"))
+        loc = normalize_text(job.get("location", {}).get("city", ""))
+        job_url = normalize_text(job.get("ref", ""))
+        posted = parse_date(job.get("releasedDate") or "")
         remote = detect_remote(title + " " + loc)
         results.append(
             JobRecord(
@@ -269,10 +1505,10 @@ def pull_ashby(company: str, url: str, session: requests.Session, list_source: s
                 location=loc,
                 remote_or_hybrid=remote,
                 posting_date=posted,
-                source="ashby",
+                source="smartrecruiters",
                 job_url=job_url,
                 job_id=str(job.get("id", "")),
-                description=normalize_text(job.get("description", "")),
+                description=normalize_text(job.get("jobAd", {}).get("sections", {}).get("jobDescription", "")),
                 list_source=list_source,
             )
         )
@@ -280,62 +1516,189 @@ def pull_ashby(company: str, url: str, session: requests.Session, list_source: s
 
 
 def pull_smartrecruiters(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
-    results = []
-    offset = 0
     limit = 100
+    separator = "&" if "?" in url else "?"
+
+    def page_url(offset: int) -> str:
+        return f"{url}{separator}offset={offset}&limit={limit}&country=us"
+
+    first = request_json(page_url(0), session)
+    if not isinstance(first, dict):
+        log_failure(company, "smartrecruiters", url, list_source, "request_failed")
+        return []
+    jobs = first.get("content", [])
+    if not isinstance(jobs, list) or not jobs:
+        return []
+    results = parse_smartrecruiters_jobs(company, jobs, list_source)
+    if len(jobs) < limit:
+        return results
+
+    total = first.get("totalFound")
+    if isinstance(total, int) and total > 0:
+        # totalFound tells us every remaining offset up front, so fetch them
+        # side by side and keep whichever pages succeed, in offset order.
+        offsets = list(range(limit, total, limit))
+        payloads = fetch_pages(lambda offset: request_json(page_url(offset), session), offsets)
+        for offset, payload in zip(offsets, payloads):
+            page_jobs = payload.get("content") if isinstance(payload, dict) else None
+            if not isinstance(page_jobs, list):
+                log_failure(company, "smartrecruiters", page_url(offset), list_source, "page_failed")
+                continue
+            results.extend(parse_smartrecruiters_jobs(company, page_jobs, list_source))
+        return results
+
+    offset = limit
     while True:
-        separator = "&" if "?" in url else "?"
-        page_url = f"{url}{separator}offset={offset}&limit={limit}&country=us"
-        payload = request_json(page_url, session)
+        payload = request_json(page_url(offset), session)
         if not isinstance(payload, dict):
-            if offset == 0:
-                log_failure(company, "smartrecruiters", url, list_source, "request_failed")
             break
         jobs = payload.get("content", [])
         if not isinstance(jobs, list) or not jobs:
             break
-        for job in jobs:
-            title = normalize_text(job.get("name"))
-            loc = normalize_text(job.get("location", {}).get("city", ""))
-            job_url = normalize_text(job.get("ref", ""))
-            posted = parse_date(job.get("releasedDate") or "")
-            remote = detect_remote(title + " " + loc)
-            results.append(
-                JobRecord(
-                    company=company,
-                    job_title=title,
-                    location=loc,
-                    remote_or_hybrid=remote,
-                    posting_date=posted,
-                    source="smartrecruiters",
-                    job_url=job_url,
-                    job_id=str(job.get("id", "")),
-                    description=normalize_text(job.get("jobAd", {}).get("sections", {}).get("jobDescription", "")),
-                    list_source=list_source,
-                )
-            )
+        results.extend(parse_smartrecruiters_jobs(company, jobs, list_source))
         if len(jobs) < limit:
             break
         offset += limit
     return results
 
 
-def pull_workday(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
-    payload = request_json(url, session)
-    if not isinstance(payload, dict):
-        log_failure(company, "workday", url, list_source, "request_failed")
-        return []
-    jobs = payload.get("jobPostings") or payload.get("items") or []
-    if not isinstance(jobs, list):
-        log_failure(company, "workday", url, list_source, "invalid_payload")
+WORKDAY_PAGE_SIZE = 20
+# Optional server-side searchText for Workday CXS searches (--workday-search-text).
+WORKDAY_SEARCH_TEXT = ""
+
+
+class QueryPushdown:
+    """Server-side narrowing of ATS searches derived from jobs_filter.json (`--pushdown`).
+
+    When the location filter targets the US, a Workday search whose first
+    page reports a locationCountry facet is run again from offset 0 for the
+    United States facet only. Postings neither that search nor the first
+    page returned are counted as avoided. SmartRecruiters already asks for country=us.
+    Lever only filters on exact location/team values, which the API does
+    not list. Title terms are not pushed down: the local filter also keeps
+    postings on description signals alone.
+
+    Narrowing trades recall for bytes, because a remote posting filed under
+    another country is no longer seen. The local filter still makes the
+    final decision on everything that is fetched. Narrowed targets are kept
+    in `narrowed` so the lifecycle index does not close the postings the
+    search left out.
+    """
+
+    def __init__(self, filter_cfg: dict) -> None:
+        include = normalize(" ".join(filter_cfg.get("location_filter", {}).get("include_any", [])))
+        self.us_only = US_COUNTRY_MATCHER.match_any(include)
+        self.stats = {"targets": 0, "postings_fetched": 0, "postings_avoided": 0, "bytes_avoided": 0}
+        self.narrowed: set[str] = set()
+        self._lock = Lock()
+
+    @staticmethod
+    def facet_values(facets: list, parameter: str) -> list[dict]:
+        for facet in facets:
+            if not isinstance(facet, dict):
+                continue
+            values = facet.get("values") or []
+            if facet.get("facetParameter") == parameter:
+                return values
+            # Workday nests country under locationMainGroup on some tenants.
+            nested = QueryPushdown.facet_values(values, parameter)
+            if nested:
+                return nested
         return []
+
+    def workday(self, payload: dict) -> tuple[dict, int] | None:
+        """appliedFacets limiting a Workday search to the US, and the postings it covers."""
+        if not self.us_only:
+            return None
+        total = payload.get("total")
+        if not isinstance(total, int):
+            return None
+        ids = []
+        matched = 0
+        for value in self.facet_values(payload.get("facets") or [], "locationCountry"):
+            if isinstance(value, dict) and value.get("id") and is_us_location(normalize(value.get("descriptor", ""))):
+                ids.append(value["id"])
+                matched += value.get("count") or 0
+        # Not worth a second search unless it saves at least one page.
+        if not ids or matched + WORKDAY_PAGE_SIZE >= total:
+            return None
+        return {"locationCountry": ids}, matched
+
+    def record(self, total: int, fetched: int, kept: int, first_page: list) -> None:
+        """Counts one narrowed search: `fetched` postings came back and `kept` of `total` were seen at all."""
+        avoided = max(0, total - kept)
+        per_posting = len(json.dumps(first_page)) / max(1, len(first_page))
+        with self._lock:
+            self.mark(getattr(REQUEST_CONTEXT, "target_key", None))
+            self.stats["targets"] += 1
+            self.stats["postings_fetched"] += fetched
+            self.stats["postings_avoided"] += avoided
+            self.stats["bytes_avoided"] += int(avoided * per_posting)
+
+    def mark(self, target_key: str | None) -> None:
+        if target_key is not None:
+            self.narrowed.add(target_key)
+
+    def reused(self, target_key: str, urls: dict[str, dict]) -> None:
+        """Marks a target whose records the HTTP cache reused if the search they came from was narrowed."""
+        if any((entry.get("json") or {}).get("appliedFacets") for entry in urls.values()):
+            with self._lock:
+                self.mark(target_key)
+
+
+QUERY_PUSHDOWN: QueryPushdown | None = None
+
+
+def workday_api_from_url(url: str) -> str | None:
+    """CXS search endpoint for a myworkdayjobs.com career-site or CXS URL."""
+    parsed = urlparse(url)
+    host = parsed.hostname
+    if not host or "myworkdayjobs.com" not in host:
+        return None
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) >= 4 and parts[0] == "wday" and parts[1] == "cxs":
+        return f"https://{host}/wday/cxs/{parts[2]}/{parts[3]}/jobs"
+    if parts and re.fullmatch(r"[a-z]{2}-[a-z]{2}", parts[0].lower()):
+        parts = parts[1:]
+    if not parts:
+        return None
+    tenant = host.split(".")[0]
+    return f"https://{host}/wday/cxs/{tenant}/{parts[0]}/jobs"
+
+
+def workday_site_url(api_url: str) -> str:
+    parsed = urlparse(api_url)
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) >= 4 and parts[0] == "wday" and parts[1] == "cxs":
+        return f"{parsed.scheme}://{parsed.netloc}/{parts[3]}"
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def parse_workday_posted(value: str) -> str:
+    """Workday reports age as text ("Posted Today", "Posted 30+ Days Ago")."""
+    text = (value or "").strip().lower()
+    today = datetime.now(timezone.utc).date()
+    if "today" in text:
+        return today.isoformat()
+    if "yesterday" in text:
+        return (today - timedelta(days=1)).isoformat()
+    match = re.search(r"(\d+)\+?\s+days?\s+ago", text)
+    if match:
+        return (today - timedelta(days=int(match.group(1)))).isoformat()
+    return parse_date(value or "")
+
+
+def parse_workday_jobs(company: str, jobs: list, site_url: str, list_source: str) -> list[JobRecord]:
     results = []
     for job in jobs:
         title = normalize_text(job.get("title") or job.get("jobTitle"))
         loc = normalize_text(job.get("locationsText") or job.get("location") or "")
         job_url = normalize_text(job.get("externalPath") or "")
-        posted = parse_date(job.get("postedOn") or "")
+        if job_url.startswith("/"):
+            job_url = f"{site_url}{job_url}"
+        posted = parse_workday_posted(job.get("postedOn") or "")
         remote = detect_remote(title + " " + loc)
+        bullet_fields = job.get("bulletFields") or [""]
         results.append(
             JobRecord(
                 company=company,
@@ -345,7 +1708,7 @@ def pull_workday(company: str, url: str, session: requests.Session, list_source:
                 posting_date=posted,
                 source="workday",
                 job_url=job_url,
-                job_id=str(job.get("id", "")),
+                job_id=str(job.get("id") or bullet_fields[0] or ""),
                 description=normalize_text(job.get("jobDescription", "")),
                 list_source=list_source,
             )
@@ -353,31 +1716,314 @@ def pull_workday(company: str, url: str, session: requests.Session, list_source:
     return results
 
 
-def pull_icims(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
+def pull_workday(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
+    api_url = workday_api_from_url(url) or url
+    site_url = workday_site_url(api_url)
+
+    applied_facets: dict = {}
+
+    def search(offset: int) -> dict | list | None:
+        body = {
+            "appliedFacets": applied_facets,
+            "limit": WORKDAY_PAGE_SIZE,
+            "offset": offset,
+            "searchText": WORKDAY_SEARCH_TEXT,
+        }
+        return request_json(api_url, session, json_body=body)
+
+    payload = search(0)
+    if not isinstance(payload, dict):
+        log_failure(company, "workday", url, list_source, "request_failed")
+        return []
+    jobs = payload.get("jobPostings") or payload.get("items") or []
+    if not isinstance(jobs, list):
+        log_failure(company, "workday", url, list_source, "invalid_payload")
+        return []
+    pages = [jobs]
+    # Only the first page carries a reliable total; fan out the rest from it.
+    total = payload.get("total")
+    pushdown = QUERY_PUSHDOWN.workday(payload) if QUERY_PUSHDOWN is not None and jobs else None
+    if pushdown is not None:
+        # The narrowed search starts over at offset 0, however few postings
+        # it covers; those it shares with the first page are dropped as
+        # duplicates below.
+        applied_facets, matched = pushdown
+        offsets = list(range(0, matched, WORKDAY_PAGE_SIZE))
+    elif isinstance(total, int) and total > len(jobs) and jobs:
+        offsets = list(range(WORKDAY_PAGE_SIZE, total, WORKDAY_PAGE_SIZE))
+    else:
+        offsets = []
+    for offset, page in zip(offsets, fetch_pages(search, offsets)):
+        page_jobs = page.get("jobPostings") if isinstance(page, dict) else None
+        if not isinstance(page_jobs, list):
+            log_failure(company, "workday", f"{api_url}?offset={offset}", list_source, "page_failed")
+            continue
+        pages.append(page_jobs)
+
+    results = []
+    seen = set()
+    for page_jobs in pages:
+        # Postings can shift between pages mid-crawl; keep the first copy.
+        fresh = []
+        for job in page_jobs:
+            key = job.get("externalPath") or json.dumps(job, sort_keys=True)
+            if key in seen:
+                continue
+            seen.add(key)
+            fresh.append(job)
+        results.extend(parse_workday_jobs(company, fresh, site_url, list_source))
+    if pushdown is not None:
+        QUERY_PUSHDOWN.record(total, sum(len(page_jobs) for page_jobs in pages[1:]), len(results), jobs)
+    return results
+
+
+class SoupFallback(Exception):
+    """Markup the anchor tokenizer does not reproduce exactly; parse it with BeautifulSoup."""
+
+
+# Mirrors how BeautifulSoup's html.parser builder turns text into strings:
+# void tags never hold text, text under these containers is left out of
+# get_text(), and whitespace-only runs outside <pre>/<textarea> collapse to
+# one newline or space.
+VOID_TAGS = {
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed", "frame", "hr", "image", "img",
+    "input", "isindex", "keygen", "link", "menuitem", "meta", "nextid", "param", "source", "spacer",
+    "track", "wbr",
+}
+HIDDEN_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+
+def collapse_blank(data: str) -> str:
+    if data.strip(ASCII_SPACES):
+        return data
+    return "\n" if "\n" in data else " "
+
+
+class AnchorTokenizer(HTMLParser):
+    """Collect (href, get_text(" ")) for every <a href> without building a tree."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.stack: list[tuple[str, list[str] | None]] = []
+        self.links: list[tuple[str, list[str]]] = []
+        self.pending: list[str] = []
+
+    def flush(self, keep: bool = False) -> None:
+        if not self.pending:
+            return
+        data = "".join(self.pending)
+        self.pending = []
+        hidden = False
+        preserve = False
+        for tag, _ in self.stack:
+            hidden = hidden or tag in HIDDEN_TEXT_TAGS
+            preserve = preserve or tag in PRESERVE_WHITESPACE_TAGS
+        if hidden and not keep:
+            return
+        if not preserve:
+            data = collapse_blank(data)
+        for _, parts in self.stack:
+            if parts is not None:
+                parts.append(data)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.flush()
+        if tag in VOID_TAGS:
+            return
+        parts = None
+        if tag == "a":
+            href = None
+            for key, value in attrs:
+                if key == "href":
+                    href = value or ""
+            if href is not None:
+                parts = []
+                self.links.append((href, parts))
+        self.stack.append((tag, parts))
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        self.flush()
+        for idx in range(len(self.stack) - 1, -1, -1):
+            if self.stack[idx][0] == tag:
+                del self.stack[idx:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self.pending.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        character = EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name)
+        self.pending.append(character if character is not None else f"&{name}")
+
+    def handle_charref(self, name: str) -> None:
+        # Plain printable code points only; BeautifulSoup remaps C1 controls,
+        # surrogates and malformed references in ways not worth duplicating.
+        try:
+            code = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        except ValueError:
+            raise SoupFallback(name) from None
+        if not (0x20 <= code < 0x7F or 0xA0 <= code < 0xD800 or 0xE000 <= code < 0xFDD0 or 0xFDF0 <= code < 0xFFFE):
+            raise SoupFallback(name)
+        self.pending.append(chr(code))
+
+    def handle_comment(self, data: str) -> None:
+        self.flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self.flush()
+
+    def handle_pi(self, data: str) -> None:
+        self.flush()
+
+    def unknown_decl(self, data: str) -> None:
+        self.flush()
+        if data.upper().startswith("CDATA["):
+            # CDATA sections count as text even inside hidden containers.
+            self.pending.append(data[len("CDATA[") :])
+            self.flush(keep=True)
+
+
+def links_from_tokenizer(text: str) -> list[tuple[str, str]]:
+    tokenizer = AnchorTokenizer()
+    tokenizer.feed(text)
+    tokenizer.close()
+    tokenizer.flush()
+    return [(href, " ".join(parts)) for href, parts in tokenizer.links]
+
+
+def links_from_lxml(text: str) -> list[tuple[str, str]]:
+    # lxml repairs markup the way browsers do, so nested anchors, repeated
+    # attributes and unknown entities can come out differently from
+    # BeautifulSoup's html.parser tree.
+    def text_parts(element, parts: list[str], top: bool) -> None:
+        if isinstance(element.tag, str):
+            if element.text and element.tag not in HIDDEN_TEXT_TAGS:
+                parts.append(collapse_blank(element.text))
+            for child in element:
+                text_parts(child, parts, False)
+        if not top and element.tail:
+            parts.append(collapse_blank(element.tail))
+
+    links = []
+    for anchor in lxml_html.fromstring(text).iter("a"):
+        href = anchor.get("href")
+        if href is None:
+            continue
+        parts: list[str] = []
+        text_parts(anchor, parts, True)
+        links.append((href, " ".join(parts)))
+    return links
+
+
+def links_from_soup(text: str) -> list[tuple[str, str]]:
+    warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+    soup = BeautifulSoup(text, "html.parser")
+    return [(a["href"], a.get_text(" ")) for a in soup.find_all("a", href=True)]
+
+
+LINK_EXTRACTORS = {
+    "tokenizer": links_from_tokenizer,
+    "lxml": links_from_lxml,
+    "soup": links_from_soup,
+}
+LINK_EXTRACTOR = "tokenizer"
+
+
+def extract_links(text: str) -> list[tuple[str, str]]:
+    """(href, anchor text) for each <a href> in document order, as BeautifulSoup would give them."""
+    extractor = LINK_EXTRACTORS[LINK_EXTRACTOR]
+    if extractor is not links_from_soup:
+        try:
+            return extractor(text)
+        except Exception:
+            pass
+    return links_from_soup(text)
+
+
+# iCIMS search results come 20 or so to a page, addressed by a 0-based pr=
+# parameter. The paginator links a window of pages around the current one
+# and labels it "Page 1 of N"; whichever says more wins. Boards longer than
+# ICIMS_MAX_PAGES are read up to it and logged as "page_limit".
+ICIMS_PAGE_PARAM = re.compile(r"[?&]pr=(\d+)")
+ICIMS_PAGE_LABEL = re.compile(r"Page(?:\s|<[^>]*>)+\d+(?:\s|<[^>]*>)+of(?:\s|<[^>]*>)+(\d+)", re.IGNORECASE)
+ICIMS_MAX_PAGES = 50
+
+
+def icims_page_count(text: str, links: list[tuple[str, str]]) -> int:
+    pages = 1
+    for href, _ in links:
+        match = ICIMS_PAGE_PARAM.search(href)
+        if match:
+            pages = max(pages, int(match.group(1)) + 1)
+    match = ICIMS_PAGE_LABEL.search(text)
+    if match:
+        pages = max(pages, int(match.group(1)))
+    return pages
+
+
+def icims_page_url(url: str, page: int) -> str:
+    parsed = urlparse(url)
+    query = [(key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True) if key != "pr"]
+    return parsed._replace(query=urlencode([("pr", str(page)), *query])).geturl()
+
+
+def icims_page_links(company: str, url: str, session: requests.Session, list_source: str, page: int | None = None):
+    """(text, links) of one search page, or None after logging why it could not be read."""
+    page_url = url if page is None else icims_page_url(url, page)
+    reason = "request_error" if page is None else "page_failed"
     try:
-        resp = request_text(url, session, retries=2, timeout=20)
+        resp = request_text(page_url, session, retries=2, timeout=20)
         if not resp:
-            log_failure(company, "icims", url, list_source, "request_error")
-            return []
+            log_failure(company, "icims", page_url, list_source, reason)
+            return None
         if resp.status_code >= 400:
-            log_failure(company, "icims", url, list_source, "http_error", resp.status_code)
-            return []
-        warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-        soup = BeautifulSoup(resp.text, "html.parser")
+            reason = "http_error" if page is None else reason
+            log_failure(company, "icims", page_url, list_source, reason, resp.status_code)
+            return None
+        return resp.text, extract_links(resp.text)
+    except RetryLater:
+        raise
     except Exception:
-        log_failure(company, "icims", url, list_source, "request_error")
+        log_failure(company, "icims", page_url, list_source, reason)
+        return None
+
+
+def pull_icims(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
+    first = icims_page_links(company, url, session, list_source)
+    if first is None:
         return []
+    text, links = first
+    page_count = icims_page_count(text, links)
+    pages = list(range(1, min(page_count, ICIMS_MAX_PAGES)))
+    # Later pages are fetched side by side; a page that fails is logged and
+    # skipped rather than dropping the whole tenant.
+    for result in fetch_pages(lambda page: icims_page_links(company, url, session, list_source, page), pages):
+        if result is not None:
+            links.extend(result[1])
+    if page_count > ICIMS_MAX_PAGES:
+        log_failure(company, "icims", icims_page_url(url, ICIMS_MAX_PAGES), list_source, "page_limit")
 
     results = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "/jobs/" not in href:
+    seen = set()
+    for href, title_raw in links:
+        if "/jobs/" not in href or "/jobs/search" in href:
             continue
-        title = normalize_text(a.get_text(" "))
+        title = normalize_text(title_raw)
         if not title:
             continue
         if href.startswith("/"):
             href = f"{urlparse(url).scheme}://{urlparse(url).hostname}{href}"
+        # Pages overlap when postings move while they are being read.
+        if href in seen:
+            continue
+        seen.add(href)
         results.append(
             JobRecord(
                 company=company,
@@ -392,9 +2038,147 @@ def pull_icims(company: str, url: str, session: requests.Session, list_source: s
                 list_source=list_source,
             )
         )
+    if DETAIL_PAGES is not None:
+        DETAIL_PAGES.fill(company, "icims", results, session, list_source)
     return results
 
 
+# Basic role title guard to avoid nav links like "students and graduates"
+CAREERS_ROLE_KEYWORDS = [
+    "SCIENTIST",
+    "ENGINEER",
+    "ANALYST",
+    "BIOINFORMATICS",
+    "COMPUTATIONAL",
+    "DATA",
+    "RESEARCH",
+    "DEVELOPER",
+    "PROGRAMMER",
+    "BIOLOGIST",
+    "GENOMICS",
+    "INFORMATICS",
+    "SOFTWARE",
+    "ML",
+    "AI",
+    "MACHINE LEARNING",
+    "STATISTICIAN",
+    "BIOSTATISTICIAN",
+    "QA",
+    "QC",
+    "INTERN",
+    "ASSOCIATE",
+    "FELLOW",
+    "MANAGER",
+    "DIRECTOR",
+    "LEAD",
+    "SENIOR",
+    "PRINCIPAL",
+]
+CAREERS_NAV_PHRASES = [
+    "STUDENTS AND GRADUATES",
+    "WHY",
+    "YOUR CAREER",
+    "OUR DEPARTMENTS",
+    "MEET OUR COLLEAGUES",
+    "LATEST UPDATES",
+    "INFORMATION CENTRE",
+    "EXPLORE ALL CAREERS",
+    "GLOBAL",
+    "CAREERS",
+    "JOBS",
+    "OPENINGS",
+    "POSITIONS",
+    "COUNTRY",
+    "REGION",
+]
+CAREERS_COUNTRY_TERMS = [
+    "AUSTRIA",
+    "BELGIUM",
+    "BRAZIL",
+    "CHILE",
+    "COLOMBIA",
+    "COSTA RICA",
+    "DENMARK",
+    "FINLAND",
+    "FRANCE",
+    "GERMANY",
+    "INDIA",
+    "IRELAND",
+    "ITALY",
+    "JAPAN",
+    "KOREA",
+    "MEXICO",
+    "NETHERLANDS",
+    "NORWAY",
+    "POLAND",
+    "PORTUGAL",
+    "SINGAPORE",
+    "SPAIN",
+    "SWEDEN",
+    "SWITZERLAND",
+    "UNITED KINGDOM",
+    "UK",
+    "CANADA",
+]
+CAREERS_JOB_HREF_RE = re.compile(r"\bjob(s)?\b|careers|positions|openings|job-postings", re.IGNORECASE)
+CAREERS_LINK_DEBUG = False
+
+
+class CareersLinkClassifier:
+    """Decide which anchors on a careers page are job postings, and why the rest are not.
+
+    Keyword lists are compiled once into single regexes; the page's scheme
+    and host are resolved once per page rather than per anchor.
+    """
+
+    def __init__(self, role_keywords: list[str], nav_phrases: list[str], country_terms: list[str]) -> None:
+        self.role = keyword_pattern(role_keywords)
+        self.nav = keyword_pattern(nav_phrases)
+        self.country = keyword_pattern(country_terms)
+
+    def classify(self, page_url: str, links: Iterable[tuple[str, str]]) -> Iterator[tuple[str, str, str]]:
+        """Yield (job_url, title, reason) per anchor; reason is "" for an accepted posting."""
+        page = urlparse(page_url)
+        base_host = page.hostname or ""
+        prefix = f"{page.scheme}://{base_host}"
+        seen = set()
+        for href, title_raw in links:
+            if not href:
+                yield href, "", "empty_href"
+                continue
+            if href.startswith("/"):
+                href = prefix + href
+                host = base_host
+            else:
+                host = urlparse(href).hostname or ""
+            if host and base_host and host != base_host:
+                yield href, "", "off_site"
+                continue
+            if not CAREERS_JOB_HREF_RE.search(href):
+                yield href, "", "not_job_url"
+                continue
+            title = normalize_text(title_raw)
+            if not title:
+                yield href, "", "empty_title"
+                continue
+            title_norm = normalize(title)
+            if not self.role.search(title_norm):
+                yield href, title, "no_role_keyword"
+                continue
+            if self.nav.search(title_norm):
+                yield href, title, "nav_link"
+                continue
+            if self.country.search(title_norm):
+                yield href, title, "country_link"
+                continue
+            key = (title, href)
+            if key in seen:
+                yield href, title, "duplicate"
+                continue
+            seen.add(key)
+            yield href, title, ""
+
+
 def pull_careers_url(company: str, url: str, session: requests.Session, list_source: str) -> list[JobRecord]:
     try:
         resp = request_text(url, session, retries=2, timeout=20)
@@ -404,118 +2188,19 @@ def pull_careers_url(company: str, url: str, session: requests.Session, list_sou
         if resp.status_code >= 400:
             log_failure(company, "careers_url", url, list_source, "http_error", resp.status_code)
             return []
-        warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        links = extract_links(resp.text)
+    except RetryLater:
+        raise
     except Exception:
         log_failure(company, "careers_url", url, list_source, "request_error")
         return []
 
-    base_host = urlparse(resp.url).hostname or ""
     results = []
-    seen = set()
-    # Basic role title guard to avoid nav links like "students and graduates"
-    role_keywords = [
-        "SCIENTIST",
-        "ENGINEER",
-        "ANALYST",
-        "BIOINFORMATICS",
-        "COMPUTATIONAL",
-        "DATA",
-        "RESEARCH",
-        "DEVELOPER",
-        "PROGRAMMER",
-        "BIOLOGIST",
-        "GENOMICS",
-        "INFORMATICS",
-        "SOFTWARE",
-        "ML",
-        "AI",
-        "MACHINE LEARNING",
-        "STATISTICIAN",
-        "BIOSTATISTICIAN",
-        "QA",
-        "QC",
-        "INTERN",
-        "ASSOCIATE",
-        "FELLOW",
-        "MANAGER",
-        "DIRECTOR",
-        "LEAD",
-        "SENIOR",
-        "PRINCIPAL",
-    ]
-    nav_phrases = [
-        "STUDENTS AND GRADUATES",
-        "WHY",
-        "YOUR CAREER",
-        "OUR DEPARTMENTS",
-        "MEET OUR COLLEAGUES",
-        "LATEST UPDATES",
-        "INFORMATION CENTRE",
-        "EXPLORE ALL CAREERS",
-        "GLOBAL",
-        "CAREERS",
-        "JOBS",
-        "OPENINGS",
-        "POSITIONS",
-        "COUNTRY",
-        "REGION",
-    ]
-    country_terms = [
-        "AUSTRIA",
-        "BELGIUM",
-        "BRAZIL",
-        "CHILE",
-        "COLOMBIA",
-        "COSTA RICA",
-        "DENMARK",
-        "FINLAND",
-        "FRANCE",
-        "GERMANY",
-        "INDIA",
-        "IRELAND",
-        "ITALY",
-        "JAPAN",
-        "KOREA",
-        "MEXICO",
-        "NETHERLANDS",
-        "NORWAY",
-        "POLAND",
-        "PORTUGAL",
-        "SINGAPORE",
-        "SPAIN",
-        "SWEDEN",
-        "SWITZERLAND",
-        "UNITED KINGDOM",
-        "UK",
-        "CANADA",
-    ]
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if not href:
-            continue
-        if href.startswith("/"):
-            href = f"{urlparse(resp.url).scheme}://{base_host}{href}"
-        host = urlparse(href).hostname or ""
-        if host and base_host and host != base_host:
-            continue
-        if not re.search(r"\bjob(s)?\b|careers|positions|openings|job-postings", href, re.IGNORECASE):
-            continue
-        title_raw = a.get_text(" ")
-        title = normalize_text(title_raw)
-        if not title:
-            continue
-        title_norm = normalize(title)
-        if not match_any(role_keywords, title_norm):
-            continue
-        if match_any(nav_phrases, title_norm):
-            continue
-        if match_any(country_terms, title_norm):
-            continue
-        key = (title, href)
-        if key in seen:
+    for href, title, reason in CAREERS_LINK_CLASSIFIER.classify(resp.url, links):
+        if reason:
+            if CAREERS_LINK_DEBUG:
+                print(f"careers_url {company}: {reason}: {title or '-'} {href}")
             continue
-        seen.add(key)
         results.append(
             JobRecord(
                 company=company,
@@ -530,6 +2215,8 @@ def pull_careers_url(company: str, url: str, session: requests.Session, list_sou
                 list_source=list_source,
             )
         )
+    if DETAIL_PAGES is not None:
+        DETAIL_PAGES.fill(company, "careers_url", results, session, list_source)
     return results
 
 
@@ -542,8 +2229,7 @@ def pull_rippling(company: str, url: str, session: requests.Session, list_source
         log_failure(company, "rippling", url, list_source, "http_error", resp.status_code)
         return []
     try:
-        warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        links = extract_links(resp.text)
     except Exception:
         log_failure(company, "rippling", url, list_source, "parse_error")
         return []
@@ -551,8 +2237,7 @@ def pull_rippling(company: str, url: str, session: requests.Session, list_source
     results = []
     seen = set()
     base_host = urlparse(resp.url).hostname or ""
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
+    for href, title_raw in links:
         if "/jobs/" not in href:
             continue
         if href.startswith("/"):
@@ -560,7 +2245,7 @@ def pull_rippling(company: str, url: str, session: requests.Session, list_source
         host = urlparse(href).hostname or ""
         if host and base_host and host != base_host:
             continue
-        title = normalize_text(a.get_text(" "))
+        title = normalize_text(title_raw)
         if not title:
             continue
         key = (title, href)
@@ -583,9 +2268,157 @@ def pull_rippling(company: str, url: str, session: requests.Session, list_source
         )
     if not results:
         log_failure(company, "rippling", url, list_source, "no_jobs_found")
+    elif DETAIL_PAGES is not None:
+        DETAIL_PAGES.fill(company, "rippling", results, session, list_source)
     return results
 
 
+JSON_LD_SCRIPT = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def json_ld_job_posting(text: str) -> dict | None:
+    """The first schema.org JobPosting in a page's JSON-LD blocks, looking inside lists and @graph."""
+    for match in JSON_LD_SCRIPT.finditer(text):
+        try:
+            data = json.loads(match.group(1).strip(), strict=False)
+        except ValueError:
+            continue
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(reversed(node))
+                continue
+            if not isinstance(node, dict):
+                continue
+            kind = node.get("@type")
+            if kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind):
+                return node
+            if "@graph" in node:
+                stack.append(node["@graph"])
+    return None
+
+
+def json_ld_name(value) -> str:
+    """Text of a schema.org value given either as a string or as a thing with a name."""
+    if isinstance(value, dict):
+        value = value.get("name")
+    return value.strip() if isinstance(value, str) else ""
+
+
+def json_ld_location(posting: dict) -> str:
+    """Each jobLocation as "City, Region, Country", joined with "; " and led by "Remote" for TELECOMMUTE."""
+    places = posting.get("jobLocation") or []
+    if not isinstance(places, list):
+        places = [places]
+    names = []
+    for place in places:
+        if not isinstance(place, dict):
+            continue
+        address = place.get("address")
+        if isinstance(address, dict):
+            parts = [
+                json_ld_name(address.get("addressLocality")),
+                json_ld_name(address.get("addressRegion")),
+                json_ld_name(address.get("addressCountry")),
+            ]
+            name = ", ".join(part for part in parts if part)
+        else:
+            name = json_ld_name(address) or json_ld_name(place)
+        if name and name not in names:
+            names.append(name)
+    if str(posting.get("jobLocationType", "")).upper() == "TELECOMMUTE":
+        areas = posting.get("applicantLocationRequirements") or []
+        if not isinstance(areas, list):
+            areas = [areas]
+        areas = [name for name in map(json_ld_name, areas) if name]
+        names.insert(0, "Remote - " + ", ".join(areas) if areas else "Remote")
+    return normalize_text("; ".join(names))
+
+
+class DetailPages:
+    """Detail-page enrichment for icims, rippling and careers_url records (`--detail-pages`).
+
+    Those pullers only see a title and a link, so location, date and
+    description are read from the JSON-LD JobPosting on each posting's own
+    page. Only records the listing stages keep are looked up. A page is
+    fetched once in its lifetime: what it yielded is kept in `details` by
+    URL, including pages without a JobPosting, and dropped from the cache
+    once the posting disappears; targets the HTTP cache reuses keep theirs
+    through retain_details. Concurrent fetches per host are capped at
+    `per_host` across all workers, on top of HOST_SCHEDULER's rate.
+    """
+
+    def __init__(self, compiled: CompiledFilter, details: DetailCache, per_host: int) -> None:
+        self.compiled = compiled
+        self.details = details
+        self.per_host = max(1, per_host)
+        self.stats = {"listed": 0, "skipped": 0, "reused": 0, "fetched": 0, "enriched": 0, "failed": 0}
+        self._slots: dict[str, BoundedSemaphore] = {}
+        self._lock = Lock()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def _slot(self, url: str) -> BoundedSemaphore:
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = BoundedSemaphore(self.per_host)
+            return slot
+
+    def fill(self, company: str, source: str, records: list[JobRecord], session, list_source: str) -> None:
+        pipeline = self.compiled.pipeline
+        wanted = [
+            record for record in records if pipeline.listing_drop_reason(JobFields(record, self.compiled)) is None
+        ]
+        self.count("listed", len(records))
+        self.count("skipped", len(records) - len(wanted))
+        # Detail pages are cached by URL here, so they stay out of the
+        # target's HTTP-cache fingerprints.
+        if isinstance(session, CachedSession):
+            session = session.session
+
+        def fetch(record: JobRecord) -> None:
+            detail = self.details.get(record.job_url)
+            if detail is not None:
+                self.count("reused")
+            else:
+                with self._slot(record.job_url):
+                    resp = request_text(record.job_url, session)
+                if not resp:
+                    self.count("failed")
+                    log_failure(company, source, record.job_url, list_source, "detail_failed")
+                    return
+                posting = json_ld_job_posting(resp.text)
+                detail = {}
+                if posting is not None:
+                    description = posting.get("description")
+                    detail = {
+                        "location": json_ld_location(posting),
+                        "posting_date": parse_iso_date(str(posting.get("datePosted") or "")),
+                        "description": normalize_text(description if isinstance(description, str) else ""),
+                    }
+                self.details.put(record.job_url, "", detail)
+                self.count("fetched")
+            if detail:
+                self.count("enriched")
+                record.location = record.location or detail.get("location", "")
+                record.posting_date = record.posting_date or detail.get("posting_date", "")
+                record.description = record.description or detail.get("description", "")
+                record.remote_or_hybrid = detect_remote(record.job_title + " " + record.location)
+
+        fetch_pages(fetch, wanted)
+
+
+DETAIL_PAGES: DetailPages | None = None
+
+
 def pull_jobs_for_target(row: dict, session: requests.Session, list_source: str) -> list[JobRecord]:
     company = row.get("company_name", "")
     api_name = row.get("api_name", "")
@@ -615,59 +2448,856 @@ def pull_jobs_for_target(row: dict, session: requests.Session, list_source: str)
     return []
 
 
+def retain_details(row: dict, records: list[JobRecord]) -> None:
+    """Keep the cached detail payloads behind records reused without running their puller."""
+    if GREENHOUSE_TWO_PHASE is not None and row.get("api_name") == "greenhouse":
+        GREENHOUSE_TWO_PHASE.retain(row.get("api_url", ""), records)
+    if DETAIL_PAGES is not None and row.get("api_name") in ("icims", "careers_url", "rippling"):
+        DETAIL_PAGES.details.keep(record.job_url for record in records)
+
+
+class CachedSession:
+    """Per-target session wrapper that fingerprints every payload it fetches.
+
+    revalidate() replays last run's URLs as conditional GETs (POST searches are
+    replayed as-is and compared by hash), through scheduled_get like any other
+    request: the first URL alone, then the rest PAGE_FAN_OUT at a time. Fresh 200 bodies fetched along the way are kept and served to the
+    puller if it has to run, so a changed board is still downloaded only once.
+    """
+
+    def __init__(self, session, prior_urls: dict[str, dict]) -> None:
+        self.session = session
+        self.prior_urls = prior_urls
+        self.fetched: dict[str, dict] = {}
+        self.complete = True
+        self.stats = {"not_modified": 0, "same_hash": 0, "changed": 0}
+        self._prefetched: dict[str, requests.Response] = {}
+
+    @staticmethod
+    def fingerprint(resp: requests.Response, digest: str | None = None) -> dict:
+        if digest is None:
+            digest = hashlib.sha256(resp.url.encode("utf-8") + b"\n" + resp.content).hexdigest()
+        return {
+            "etag": resp.headers.get("ETag", ""),
+            "last_modified": resp.headers.get("Last-Modified", ""),
+            "sha256": digest,
+        }
+
+    def revalidate(self) -> bool:
+        if not self.prior_urls:
+            return False
+        items = list(self.prior_urls.items())
+        # A board that changed has almost always changed on its first page,
+        # so that one is checked alone and the rest only once it matched.
+        return self._revalidate(items[:1]) and self._revalidate(items[1:])
+
+    def _revalidate(self, items: list[tuple[str, dict]]) -> bool:
+        """Replay items with bounded concurrency like fetch_pages; True if every one is unchanged."""
+        target_key = getattr(REQUEST_CONTEXT, "target_key", None)
+
+        def replay(item: tuple[str, dict]) -> requests.Response | None:
+            key, prior = item
+            # Keep the target's key on fan-out threads so a throttled replay
+            # still hands the target back instead of waiting inline.
+            previous = getattr(REQUEST_CONTEXT, "target_key", None)
+            REQUEST_CONTEXT.target_key = target_key
+            try:
+                if "json" in prior:
+                    return scheduled_get(prior["url"], self.session, 2, 20, json_body=prior["json"])
+                headers = {}
+                if prior.get("etag"):
+                    headers["If-None-Match"] = prior["etag"]
+                if prior.get("last_modified"):
+                    headers["If-Modified-Since"] = prior["last_modified"]
+                return scheduled_get(key, self.session, 2, 20, headers=headers)
+            finally:
+                REQUEST_CONTEXT.target_key = previous
+
+        responses = fetch_pages(replay, items)
+        # Every fresh body is kept, so the puller does not download it again
+        # even when an earlier page is the one that changed.
+        for (key, _), resp in zip(items, responses):
+            if resp is not None and resp.status_code == 200:
+                self._prefetched[key] = resp
+        for (key, prior), resp in zip(items, responses):
+            if resp is None:
+                return False
+            if resp.status_code == 304:
+                self.stats["not_modified"] += 1
+                self.fetched[key] = dict(prior)
+                continue
+            if resp.status_code != 200:
+                return False
+            fingerprint = self._record_fingerprint(resp, prior)
+            if fingerprint["sha256"] != prior.get("sha256"):
+                self.stats["changed"] += 1
+                return False
+            self.stats["same_hash"] += 1
+            self.fetched[key] = fingerprint
+        return True
+
+    def _record_fingerprint(self, resp: requests.Response, request: dict, digest: str | None = None) -> dict:
+        fingerprint = self.fingerprint(resp, digest)
+        if "json" in request:
+            fingerprint["url"] = request["url"]
+            fingerprint["json"] = request["json"]
+        return fingerprint
+
+    def _finish(self, key: str, resp: requests.Response, request: dict) -> requests.Response:
+        if resp.status_code == 200:
+            self.fetched[key] = self._record_fingerprint(resp, request)
+        else:
+            self.complete = False
+        return resp
+
+    def _finish_streamed(self, key: str, resp: requests.Response) -> requests.Response:
+        """_finish for a body the puller reads through iter_body: hashed as it streams past."""
+        if resp.status_code != 200:
+            self.complete = False
+            return resp
+        digest = hashlib.sha256(resp.url.encode("utf-8") + b"\n")
+
+        def observe(chunk: bytes) -> None:
+            if chunk:
+                digest.update(chunk)
+            else:
+                self.fetched[key] = self._record_fingerprint(resp, {}, digest.hexdigest())
+
+        resp.body_observers = [*getattr(resp, "body_observers", ()), observe]
+        return resp
+
+    def get(
+        self,
+        url: str,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        resp = self._prefetched.pop(url, None)
+        if resp is None:
+            resp = self.session.get(
+                url, timeout=timeout, allow_redirects=allow_redirects, headers=headers, stream=stream
+            )
+        if stream:
+            return self._finish_streamed(url, resp)
+        return self._finish(url, resp, {})
+
+    def post(
+        self,
+        url: str,
+        json: dict | None = None,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        key = request_key(url, json)
+        resp = self._prefetched.pop(key, None)
+        if resp is None:
+            resp = self.session.post(url, json=json, timeout=timeout, allow_redirects=allow_redirects, headers=headers)
+        return self._finish(key, resp, {"url": url, "json": json})
+
+
+class HttpCache:
+    """On-disk ETag/Last-Modified cache of ATS payloads and their parsed records.
+
+    One JSON file per target holds the validators and content hash of every
+    URL its puller fetched, plus the JobRecords parsed from them. When every
+    URL comes back 304 or byte-identical, the records are reused as-is and
+    the puller never runs.
+
+    Entries are only reused under the same `variant` they were saved with:
+    see fetch_variant for the modes whose records depend on more than the
+    payloads.
+    """
+
+    def __init__(self, directory: Path, variant: str = "") -> None:
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.variant = variant
+        self.stats = {
+            "targets_reused": 0,
+            "targets_fetched": 0,
+            "targets_stale": 0,
+            "not_modified": 0,
+            "same_hash": 0,
+            "changed": 0,
+        }
+        self._lock = Lock()
+
+    @staticmethod
+    def fetch_variant(filter_cfg: dict, modes: dict[str, bool]) -> str:
+        """Cache variant: empty, or a hash of the filter and modes when any mode fetches by the filter.
+
+        Two-phase Greenhouse, Workday pushdown and detail pages only fetch
+        what the filter keeps, and those fetches are not fingerprinted, so
+        records cached under one filter must not be reused under another.
+        """
+        if not any(modes.values()):
+            return ""
+        encoded = json.dumps([modes, filter_cfg], sort_keys=True, ensure_ascii=True).encode("utf-8")
+        return hashlib.sha1(encoded).hexdigest()
+
+    @staticmethod
+    def target_key(row: dict, list_source: str) -> str:
+        return "|".join(
+            [row.get("api_name", ""), row.get("api_url", ""), row.get("company_name", ""), list_source]
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def load(self, key: str) -> dict | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = load_json(path)
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key or entry.get("variant", "") != self.variant:
+            return None
+        return entry
+
+    def save(self, key: str, urls: dict[str, dict], records: list[JobRecord]) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(
+                {"key": key, "variant": self.variant, "urls": urls, "records": [job.to_dict() for job in records]},
+                handle,
+                ensure_ascii=True,
+            )
+        os.replace(tmp_path, path)
+
+    def stale(self, row: dict, list_source: str) -> list[JobRecord] | None:
+        """The target's cached records flagged stale, for a target that was not fetched; None if none are cached."""
+        prior = self.load(self.target_key(row, list_source))
+        if prior is None:
+            return None
+        records = [JobRecord(**record) for record in prior.get("records", [])]
+        for job in records:
+            job.stale = True
+        retain_details(row, records)
+        with self._lock:
+            self.stats["targets_stale"] += 1
+        return records
+
+    def pull(self, row: dict, session, list_source: str) -> list[JobRecord]:
+        key = self.target_key(row, list_source)
+        prior = self.load(key)
+        cached = CachedSession(session, (prior or {}).get("urls", {}))
+        reused = cached.revalidate()
+        if reused:
+            records = [JobRecord(**record) for record in prior.get("records", [])]
+            retain_details(row, records)
+            if QUERY_PUSHDOWN is not None:
+                QUERY_PUSHDOWN.reused(key, prior.get("urls", {}))
+        else:
+            records = pull_jobs_for_target(row, cached, list_source)
+        note_request("cache_reused", int(reused))
+        with self._lock:
+            self.stats["targets_reused" if reused else "targets_fetched"] += 1
+            for name, count in cached.stats.items():
+                self.stats[name] += count
+        # Targets that logged a failure are pulled fresh next time so the
+        # failure log keeps reporting them.
+        if not reused and cached.complete and cached.fetched and not has_failure(row, list_source):
+            self.save(key, cached.fetched, records)
+        return records
+
+
+def has_failure(row: dict, list_source: str) -> bool:
+    company = row.get("company_name", "")
+    api_name = row.get("api_name", "")
+    with FAILURE_LOCK:
+        return any(
+            entry["company_name"] == company
+            and entry["api_name"] == api_name
+            and entry["list_source"] == list_source
+            for entry in FAILURE_LOG
+        )
+
+
+TELEMETRY_COUNTERS = (
+    "requests",
+    "bytes",
+    "errors",
+    "connections",
+    "retries",
+    "requeues",
+    "cache_reused",
+    "dns_s",
+    "connect_s",
+    "ttfb_s",
+    "fetch_s",
+    "wait_s",
+    "wall_s",
+)
+TELEMETRY_PERCENTILE_FIELDS = ("wall_s", "fetch_s", "ttfb_s", "parse_s", "filter_s")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+class TimedSession:
+    """Session wrapper that adds each request's latency and size to a telemetry record.
+
+    ttfb_s is the time to response headers (Response.elapsed); fetch_s runs
+    until the body has been read. Connection set-up is recorded separately
+    by the transport. A streamed body is counted by iter_body as it is read.
+    """
+
+    def __init__(self, session, record: dict) -> None:
+        self.session = session
+        self.record = record
+
+    def _timed(self, send, url: str, **kwargs) -> requests.Response:
+        started = time.perf_counter()
+        try:
+            resp = send(url, **kwargs)
+            size = len(resp.content) if not kwargs.get("stream") or resp._content_consumed else 0
+        except Exception:
+            add_telemetry(self.record, "errors")
+            raise
+        finally:
+            add_telemetry(self.record, "requests")
+            add_telemetry(self.record, "fetch_s", time.perf_counter() - started)
+        add_telemetry(self.record, "ttfb_s", resp.elapsed.total_seconds())
+        add_telemetry(self.record, "bytes", size)
+        if resp.status_code >= 400:
+            add_telemetry(self.record, "errors")
+        return resp
+
+    def get(
+        self,
+        url: str,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self._timed(
+            self.session.get, url, timeout=timeout, allow_redirects=allow_redirects, headers=headers, stream=stream
+        )
+
+    def post(
+        self,
+        url: str,
+        json: dict | None = None,
+        timeout: int = 20,
+        allow_redirects: bool = True,
+        headers: dict | None = None,
+    ) -> requests.Response:
+        return self._timed(
+            self.session.post, url, json=json, timeout=timeout, allow_redirects=allow_redirects, headers=headers
+        )
+
+
+class RunTelemetry:
+    """Per-target fetch, parse and filter timings, written as JSONL during the run.
+
+    fetch_target opens one record per target and keeps it across requeues;
+    the HTTP layer adds to it through REQUEST_CONTEXT. finish() adds the job
+    count and filter time and appends the line, so a run killed part-way
+    still leaves the targets it finished. Targets the time budget deferred,
+    before or after a requeue, get a record with outcome "deferred"; the
+    percentiles only cover the ones fetched. Timings are seconds summed over
+    the target's requests, so fetch_s can exceed wall_s when pages are
+    fetched concurrently. parse_s is the wall time not spent on requests or
+    rate-limit waits. dns_s is the DNS lookup time of new connections and
+    connect_s their TCP and TLS set-up after it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.records: list[dict] = []
+        self._open: dict[str, dict] = {}
+        self._lock = Lock()
+        self._handle = path.open("w", encoding="utf-8")
+
+    def start(self, key: str, row: dict, list_source: str) -> dict:
+        with self._lock:
+            record = self._open.get(key)
+            if record is None:
+                record = {
+                    "company_name": row.get("company_name", ""),
+                    "api_name": row.get("api_name", ""),
+                    "list_source": list_source,
+                    "outcome": "fetched",
+                    **dict.fromkeys(TELEMETRY_COUNTERS, 0),
+                }
+                self._open[key] = record
+            return record
+
+    def finish(self, key: str, jobs: int, filter_seconds: float) -> None:
+        with self._lock:
+            record = self._open.pop(key, None)
+        if record is None:
+            return
+        record["parse_s"] = max(0.0, record["wall_s"] - record["fetch_s"] - record["wait_s"])
+        record["jobs"] = jobs
+        record["filter_s"] = filter_seconds
+        for name, value in record.items():
+            if isinstance(value, float):
+                record[name] = round(value, 4)
+        self.records.append(record)
+        self._handle.write(json.dumps(record, ensure_ascii=True) + "\n")
+        self._handle.flush()
+
+    def defer(self, key: str, row: dict, list_source: str) -> None:
+        """Mark the target deferred; finish() still writes its record."""
+        self.start(key, row, list_source)["outcome"] = "deferred"
+
+    def summary(self, slowest: int = 20) -> list[str]:
+        fetched = [record for record in self.records if record["outcome"] == "fetched"]
+        lines = [
+            f"  {'':<9} {'p50':>8} {'p95':>8} {'p99':>8}   over {len(fetched)} targets "
+            f"({len(self.records) - len(fetched)} deferred), "
+            f"{sum(r['requests'] for r in self.records)} requests, "
+            f"{sum(r['bytes'] for r in self.records) / 1048576:.1f} MiB"
+        ]
+        for name in TELEMETRY_PERCENTILE_FIELDS:
+            values = [record[name] for record in fetched]
+            lines.append(
+                f"  {name:<9} {percentile(values, 50):7.3f}s {percentile(values, 95):7.3f}s {percentile(values, 99):7.3f}s"
+            )
+        lines.append(f"Slowest {min(slowest, len(fetched))} targets:")
+        for record in sorted(fetched, key=lambda r: r["wall_s"], reverse=True)[:slowest]:
+            lines.append(
+                f"  {record['wall_s']:7.2f}s  {record['company_name']} ({record['api_name']}): "
+                f"{record['requests']} requests, {record['bytes'] / 1024:.0f} KiB, "
+                f"{record['retries']} retries, {record['jobs']} jobs"
+            )
+        return lines
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class CrawlScheduler:
+    """Orders targets by historical yield and keeps the crawl inside --time-budget.
+
+    A target's yield is its filtered postings per second of fetch time over
+    previous runs. With a budget, targets carried over from the last run go
+    first, then targets with no history yet, then the rest by yield. A
+    target only starts while its expected fetch time still fits before the
+    deadline (carried-over targets whenever any time is left); the others
+    are deferred and saved for the next run. Targets already running are
+    always allowed to finish.
+    """
+
+    def __init__(self, path: Path, budget_seconds: float = 0.0) -> None:
+        self.path = path
+        self.deadline = time.monotonic() + budget_seconds if budget_seconds > 0 else None
+        self.history: dict[str, dict] = {}
+        self.carried: dict[str, int] = {}
+        self.deferred: dict[str, None] = {}
+        self.spent: dict[str, float] = {}
+        self._lock = Lock()
+        if path.exists():
+            try:
+                data = load_json(path)
+            except Exception:
+                data = {}
+            if isinstance(data, dict):
+                self.history = data.get("targets", {})
+                self.carried = {key: idx for idx, key in enumerate(data.get("deferred", []))}
+
+    @staticmethod
+    def rate(history: dict) -> float:
+        return history.get("filtered", 0) / max(history.get("seconds", 0.0), 0.1)
+
+    def order(self, targets: list[tuple[dict, str]]) -> list[tuple[dict, str]]:
+        carried = self.carried
+
+        def rank(item: tuple[int, tuple[dict, str]]) -> tuple:
+            idx, (row, list_source) = item
+            key = HttpCache.target_key(row, list_source)
+            if key in carried:
+                return (0, carried[key], idx)
+            history = self.history.get(key)
+            if history is None:
+                return (1, 0.0, idx)
+            return (2, -self.rate(history), idx)
+
+        return [target for _, target in sorted(enumerate(targets), key=rank)]
+
+    def admit(self, key: str, at: float | None = None) -> bool:
+        if self.deadline is None:
+            return True
+        remaining = self.deadline - (time.monotonic() if at is None else at)
+        expected = self.history.get(key, {}).get("seconds", 0.0)
+        if remaining > 0 and (expected < remaining or key in self.carried):
+            return True
+        with self._lock:
+            self.deferred[key] = None
+        return False
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self.spent[key] = self.spent.get(key, 0.0) + seconds
+
+    def save(self, passed_by_target: dict[str, int]) -> None:
+        for key, seconds in self.spent.items():
+            previous = self.history.get(key)
+            if previous is not None:
+                # Smooth over runs so one slow response does not bury a board.
+                seconds = (seconds + previous.get("seconds", seconds)) / 2
+            self.history[key] = {"seconds": round(seconds, 3), "filtered": passed_by_target.get(key, 0)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump({"targets": self.history, "deferred": list(self.deferred)}, handle, ensure_ascii=True)
+        os.replace(tmp_path, self.path)
+
+
+def fetch_target(
+    target: tuple[dict, str],
+    sessions: SessionPool | AsyncFetchEngine,
+    cache: HttpCache | None = None,
+    telemetry: RunTelemetry | None = None,
+    scheduler: CrawlScheduler | None = None,
+) -> list[JobRecord]:
+    row, list_source = target
+    if not row.get("company_name"):
+        return []
+    key = HttpCache.target_key(row, list_source)
+    if scheduler is not None and not scheduler.admit(key):
+        raise TargetDeferred(key)
+    session = sessions.session_for(row.get("api_url", ""))
+    REQUEST_CONTEXT.target_key = key
+    record = None
+    if telemetry is not None:
+        record = REQUEST_CONTEXT.telemetry = telemetry.start(key, row, list_source)
+        session = TimedSession(session, record)
+    started = time.perf_counter()
+    try:
+        if cache is not None:
+            return cache.pull(row, session, list_source)
+        return pull_jobs_for_target(row, session, list_source)
+    finally:
+        REQUEST_CONTEXT.target_key = None
+        REQUEST_CONTEXT.telemetry = None
+        elapsed = time.perf_counter() - started
+        if record is not None:
+            add_telemetry(record, "wall_s", elapsed)
+        if scheduler is not None:
+            scheduler.record(key, elapsed)
+
+
+def iter_target_jobs(
+    targets: list[tuple[dict, str]],
+    workers: int,
+    sessions: SessionPool | AsyncFetchEngine,
+    cache: HttpCache | None = None,
+    telemetry: RunTelemetry | None = None,
+    scheduler: CrawlScheduler | None = None,
+) -> Iterable[tuple[tuple[dict, str], list[JobRecord]]]:
+    """Yield (target, jobs) as targets finish, in completion order.
+
+    A target that raises RetryLater is parked until its host reopens while
+    the workers carry on with the rest of the queue. Targets the scheduler
+    defers are yielded with their cached records flagged stale, or not at
+    all when the cache has nothing for them.
+    """
+    delayed: list[tuple[float, int, tuple[dict, str]]] = []
+    tiebreak = itertools.count()
+
+    def park(target: tuple[dict, str], exc: RetryLater) -> bool:
+        ready_at = time.monotonic() + exc.delay
+        # No point waiting for a host that reopens after the deadline.
+        if scheduler is not None and not scheduler.admit(HttpCache.target_key(*target), ready_at):
+            return False
+        heappush(delayed, (ready_at, next(tiebreak), target))
+        return True
+
+    def deferred(target: tuple[dict, str]) -> list[JobRecord] | None:
+        jobs = cache.stale(*target) if cache is not None else None
+        if telemetry is not None:
+            key = HttpCache.target_key(*target)
+            telemetry.defer(key, *target)
+            # Targets served stale are finished by the caller with their jobs.
+            if jobs is None:
+                telemetry.finish(key, 0, 0.0)
+        return jobs
+
+    def due() -> list[tuple[dict, str]]:
+        ready = []
+        now = time.monotonic()
+        while delayed and delayed[0][0] <= now:
+            ready.append(heappop(delayed)[2])
+        return ready
+
+    if workers <= 1:
+        queue = deque(targets)
+        while queue or delayed:
+            queue.extend(due())
+            if not queue:
+                time.sleep(max(0.0, delayed[0][0] - time.monotonic()))
+                continue
+            target = queue.popleft()
+            try:
+                jobs = fetch_target(target, sessions, cache, telemetry, scheduler)
+            except RetryLater as exc:
+                if park(target, exc) or (jobs := deferred(target)) is None:
+                    continue
+            except TargetDeferred:
+                if (jobs := deferred(target)) is None:
+                    continue
+            yield target, jobs
+        return
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch_target, t, sessions, cache, telemetry, scheduler): t for t in targets}
+        while futures or delayed:
+            for target in due():
+                futures[pool.submit(fetch_target, target, sessions, cache, telemetry, scheduler)] = target
+            timeout = max(0.0, delayed[0][0] - time.monotonic()) if delayed else None
+            if not futures:
+                time.sleep(timeout or 0.0)
+                continue
+            done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                target = futures.pop(future)
+                try:
+                    jobs = future.result()
+                except RetryLater as exc:
+                    if park(target, exc) or (jobs := deferred(target)) is None:
+                        continue
+                except TargetDeferred:
+                    if (jobs := deferred(target)) is None:
+                        continue
+                yield target, jobs
+
+
 def normalize(text: str) -> str:
     value = re.sub(r"[^A-Za-z0-9]+", " ", text or "")
     value = re.sub(r"\s+", " ", value).strip()
     return value.upper()
 
 
-def normalize_company(name: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9]+", " ", name or "")
-    value = re.sub(r"\s+", " ", value).strip()
-    return value.lower()
+def normalize_company(name: str) -> str:
+    value = re.sub(r"[^A-Za-z0-9]+", " ", name or "")
+    value = re.sub(r"\s+", " ", value).strip()
+    return value.lower()
+
+
+def match_token(token: str, text_norm: str) -> bool:
+    token_norm = normalize(token)
+    if not token_norm:
+        return False
+    if " " in token_norm:
+        return token_norm in text_norm
+    if len(token_norm) <= 3:
+        return re.search(rf"\b{re.escape(token_norm)}\b", text_norm) is not None
+    return token_norm in text_norm
+
+
+@lru_cache(maxsize=32)
+def text_words(text_norm: str) -> frozenset[str]:
+    return frozenset(text_norm.split(" "))
+
+
+# Up to this length one regex pass over the text beats one `in` scan per
+# substring token (titles, locations); past it the C substring scans win.
+KEYWORD_REGEX_MAX_CHARS = 90
+
+
+def substring_pattern(tokens: Iterable[str]) -> re.Pattern:
+    """One regex matching wherever any of tokens occurs, with shared prefixes factored into a trie."""
+    trie: dict = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        if "" in node:
+            # A token ends here, so any match can stop here too.
+            return ""
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items())]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return re.compile(build(trie) if trie else r"(?!)")
+
+
+class KeywordMatcher:
+    """Keyword list compiled once, with the same hybrid rules as match_token.
+
+    Tokens of <=3 chars must match a whole word; longer tokens and phrases
+    match as substrings of the normalized text. Normalized text only holds
+    single-space separated [A-Z0-9] words, so a whole-word match is a set
+    lookup against the text's words, which are split once per text and
+    shared by every matcher that scans it. match_any looks for the substring
+    tokens with one compiled pattern in short texts.
+    """
+
+    def __init__(self, tokens: Iterable[str] | None) -> None:
+        self.tokens: list[str] = []
+        self._entries: list[tuple[str, bool]] = []
+        words: set[str] = set()
+        subs: dict[str, None] = {}
+        for token in tokens or []:
+            token_norm = normalize(token)
+            if not token_norm:
+                continue
+            is_word = " " not in token_norm and len(token_norm) <= 3
+            self.tokens.append(token)
+            self._entries.append((token_norm, is_word))
+            if is_word:
+                words.add(token_norm)
+            else:
+                subs[token_norm] = None
+        self._words = frozenset(words)
+        # A token containing another can never be the only one to match.
+        self._subs = tuple(token for token in subs if not any(other != token and other in token for other in subs))
+        self._sub_pattern = substring_pattern(self._subs)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def match_any(self, text_norm: str) -> bool:
+        if len(text_norm) <= KEYWORD_REGEX_MAX_CHARS:
+            if self._sub_pattern.search(text_norm) is not None:
+                return True
+        else:
+            for token_norm in self._subs:
+                if token_norm in text_norm:
+                    return True
+        return bool(self._words) and not self._words.isdisjoint(text_words(text_norm))
+
+    def which_matched(self, text_norm: str) -> list[str]:
+        if not self._entries:
+            return []
+        found_words = self._words & text_words(text_norm) if self._words else frozenset()
+        return [
+            token
+            for token, (token_norm, is_word) in zip(self.tokens, self._entries)
+            if (token_norm in found_words if is_word else token_norm in text_norm)
+        ]
+
+    def count_matches(self, text_norm: str) -> int:
+        return len(self.which_matched(text_norm))
+
+
+def keyword_pattern(tokens: Iterable[str]) -> re.Pattern:
+    """One regex matching normalized text wherever match_any(tokens, text) would."""
+    alternatives = []
+    for token in tokens:
+        token_norm = normalize(token)
+        if not token_norm:
+            continue
+        if " " not in token_norm and len(token_norm) <= 3:
+            alternatives.append(rf"\b{re.escape(token_norm)}\b")
+        else:
+            alternatives.append(re.escape(token_norm))
+    return re.compile("|".join(alternatives) or r"(?!)")
+
+
+MARKUP_RE = re.compile(r"<!--.*?-->|<(script|style)\b.*?</\1\s*>|</?[A-Za-z][^>]*>", re.S | re.I)
 
 
-def is_phrase(token: str) -> bool:
-    return " " in normalize(token)
+def description_text(raw: str) -> str:
+    """Normalized words of a description, without the markup around them.
 
+    Greenhouse sends entity-escaped HTML, so entities are unescaped before
+    tags are stripped and once more afterwards; otherwise tag names and
+    entities such as NBSP end up as words in the filter text.
+    """
+    value = html.unescape(raw or "")
+    if "<" in value:
+        value = MARKUP_RE.sub(" ", value)
+        if "&" in value:
+            value = html.unescape(value)
+    return normalize(value)
 
-def match_token(token: str, text_norm: str) -> bool:
-    token_norm = normalize(token)
-    if not token_norm:
-        return False
-    if " " in token_norm:
-        return token_norm in text_norm
-    if len(token_norm) <= 3:
-        return re.search(rf"\b{re.escape(token_norm)}\b", text_norm) is not None
-    return token_norm in text_norm
 
+class DescriptionCache:
+    """description_text results keyed by (job_id, content hash), kept across runs."""
 
-def match_any(tokens: list[str], text_norm: str) -> bool:
-    return any(match_token(token, text_norm) for token in tokens or [])
+    def __init__(self, entries: dict[str, str] | None = None) -> None:
+        self.entries: dict[str, str] = entries or {}
+        self.used: dict[str, str] = {}
+        # Filter workers collect the entries they add, to hand back with each shard.
+        self.pending: dict[str, str] | None = None
+        self.stats = {"reused": 0, "normalized": 0}
 
+    @staticmethod
+    def key(job: JobRecord) -> str:
+        return f"{job.job_id}:{hashlib.sha1(job.description.encode('utf-8')).hexdigest()}"
 
-def match_all(tokens: list[str], text_norm: str) -> bool:
-    return all(match_token(token, text_norm) for token in tokens or [])
+    def text(self, job: JobRecord) -> str:
+        raw = job.description
+        if not raw:
+            return ""
+        key = self.key(job)
+        value = self.used.get(key)
+        if value is None:
+            value = self.entries.get(key)
+            if value is None:
+                value = description_text(raw)
+                self.stats["normalized"] += 1
+            else:
+                self.stats["reused"] += 1
+            self.used[key] = value
+            if self.pending is not None:
+                self.pending[key] = value
+        else:
+            self.stats["reused"] += 1
+        return value
 
+    def keep(self, job: JobRecord) -> None:
+        """Carry a posting's entry into this run's without normalizing it, for outcomes reused as-is."""
+        if job.description:
+            key = self.key(job)
+            value = self.entries.get(key)
+            if value is not None:
+                self.used.setdefault(key, value)
 
-def count_matches(tokens: list[str], text_norm: str) -> int:
-    return sum(1 for token in tokens or [] if match_token(token, text_norm))
+    def take_used(self) -> tuple[dict[str, str], dict[str, int]]:
+        """Entries first used, and stats, since the last call (for a filter worker to hand back)."""
+        taken = (self.pending or {}, self.stats)
+        self.pending = {}
+        self.stats = {"reused": 0, "normalized": 0}
+        return taken
 
+    def merge_used(self, used: dict[str, str], stats: dict[str, int]) -> None:
+        self.used.update(used)
+        for name, count in stats.items():
+            self.stats[name] += count
 
-def build_filter_text(job: JobRecord) -> str:
-    return normalize(
-        " ".join(
-            [
-                job.job_title,
-                job.location,
-                job.description,
-            ]
-        )
-    )
+    def load(self, path: Path) -> None:
+        if not path.exists():
+            return
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except Exception:
+            return
+        if isinstance(data, dict):
+            self.entries = data
 
+    def save(self, path: Path) -> None:
+        # Only this run's postings are kept, so closed postings age out.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as handle:
+            json.dump(self.used, handle, ensure_ascii=True)
+        os.replace(tmp_path, path)
 
-def keyword_hits(text: str, keywords: list[str]) -> int:
-    return sum(1 for kw in keywords if kw in text)
+
+DESCRIPTION_CACHE = DescriptionCache()
+
+
+def build_filter_text(job: JobRecord) -> str:
+    parts = (normalize(job.job_title), normalize(job.location), DESCRIPTION_CACHE.text(job))
+    return " ".join(part for part in parts if part)
 
 
 def upper_list(values: Iterable[str]) -> list[str]:
@@ -706,13 +3336,19 @@ NON_US_LOCATION_TOKENS = [
     "SWITZERLAND",
 ]
 
+US_COUNTRY_MATCHER = KeywordMatcher(["UNITED STATES", "USA", "US"])
+REMOTE_HYBRID_MATCHER = KeywordMatcher(["REMOTE", "HYBRID"])
+NON_US_LOCATION_MATCHER = KeywordMatcher(NON_US_LOCATION_TOKENS)
+CAREERS_LINK_CLASSIFIER = CareersLinkClassifier(CAREERS_ROLE_KEYWORDS, CAREERS_NAV_PHRASES, CAREERS_COUNTRY_TERMS)
+
+
 def is_us_location(text: str) -> bool:
     value = normalize(text or "")
     if not value:
         return False
-    if match_any(["UNITED STATES", "USA", "US"], value):
+    if US_COUNTRY_MATCHER.match_any(value):
         return True
-    if match_any(["REMOTE", "HYBRID"], value) and not match_any(NON_US_LOCATION_TOKENS, value):
+    if REMOTE_HYBRID_MATCHER.match_any(value) and not NON_US_LOCATION_MATCHER.match_any(value):
         return True
     if "WASHINGTON DC" in value:
         return True
@@ -727,10 +3363,39 @@ def is_us_location(text: str) -> bool:
     return False
 
 
-def filter_jobs(jobs: list[JobRecord], filter_cfg: dict) -> tuple[list[dict], list[dict], dict]:
-    results: list[dict] = []
-    dropped: list[dict] = []
-    drop_stats: dict[str, int] = {}
+@dataclass
+class CompiledFilter:
+    """jobs_filter.json with every keyword list compiled into a KeywordMatcher."""
+
+    cfg: dict
+    location_include: KeywordMatcher
+    location_exclude: KeywordMatcher
+    title_include: KeywordMatcher
+    title_strict: KeywordMatcher
+    title_soft: KeywordMatcher
+    title_exclude: KeywordMatcher
+    seniority_exclude: KeywordMatcher
+    experience_exclude: KeywordMatcher
+    experience_block: KeywordMatcher
+    global_exclude: KeywordMatcher
+    employment_exclude: KeywordMatcher
+    scoring_strong: KeywordMatcher
+    scoring_medium: KeywordMatcher
+    scoring_nice: KeywordMatcher
+    scoring_neg_high: KeywordMatcher
+    scoring_neg_medium: KeywordMatcher
+    weak_domain_signals: KeywordMatcher
+    bio_context_terms: KeywordMatcher
+    pipeline: FilterPipeline | None = None
+
+
+PIPELINE_TITLE = KeywordMatcher(["PIPELINE"])
+PIPELINE_BUSINESS_TITLE = KeywordMatcher(
+    ["COMMERCIAL", "MARKET ACCESS", "STRATEGY", "OPERATIONS", "SALES", "MARKETING"]
+)
+
+
+def compile_filter(filter_cfg: dict) -> CompiledFilter:
     location_include = upper_list(filter_cfg.get("location_filter", {}).get("include_any", []))
     location_exclude = upper_list(filter_cfg.get("location_filter", {}).get("exclude_any", []))
     title_filter = filter_cfg.get("title_filter", {})
@@ -771,8 +3436,6 @@ def filter_jobs(jobs: list[JobRecord], filter_cfg: dict) -> tuple[list[dict], li
     experience_block = upper_list(experience_filter.get("exclude_if_contains_any", []))
     global_exclude = upper_list(filter_cfg.get("global_exclusions", {}).get("exclude_if_contains_any", []))
     employment_exclude = upper_list(filter_cfg.get("global_exclusions", {}).get("employment_type_excludes_any", []))
-    hard_must_have = upper_list(filter_cfg.get("hard_gates", {}).get("must_have_any", []))
-    domain_gates = filter_cfg.get("hard_gates", {}).get("domain_gates_any_of", [])
     scoring = filter_cfg.get("keyword_scoring", {})
     scoring_strong = upper_list(scoring.get("strong", []))
     scoring_medium = upper_list(scoring.get("medium", []))
@@ -808,328 +3471,653 @@ def filter_jobs(jobs: list[JobRecord], filter_cfg: dict) -> tuple[list[dict], li
         "CLINICAL",
         "MICROBIOME",
     ]
-    for job in jobs:
-        text = build_filter_text(job)
-        title = normalize(job.job_title or "")
-        location = normalize(job.location or "")
-        location_basis = normalize(job.location or "")
-        description = normalize(job.description or "")
-        has_description = len((job.description or "").strip()) >= 40
-        stage1_pass_reasons = []
-
-        # Location include/exclude (soft include, hard exclude)
-        location_match = False
-        if location_basis:
-            location_match = is_us_location(location_basis)
-        if not location_match and location_include and location_basis:
-            location_match = match_any(location_include, location_basis)
-        non_us_tokens = NON_US_LOCATION_TOKENS
-        if match_any(location_exclude, text):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "location_exclude",
-                }
-            )
-            drop_stats["location_exclude"] = drop_stats.get("location_exclude", 0) + 1
-            continue
-        if location_basis and match_any(non_us_tokens, location_basis) and not is_us_location(location_basis):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "location_exclude_non_us",
-                }
-            )
-            drop_stats["location_exclude_non_us"] = drop_stats.get("location_exclude_non_us", 0) + 1
-            continue
+    return CompiledFilter(
+        cfg=filter_cfg,
+        location_include=KeywordMatcher(location_include),
+        location_exclude=KeywordMatcher(location_exclude),
+        title_include=KeywordMatcher(title_include),
+        title_strict=KeywordMatcher(title_strict),
+        title_soft=KeywordMatcher(title_soft),
+        title_exclude=KeywordMatcher(title_exclude),
+        seniority_exclude=KeywordMatcher(seniority_exclude),
+        experience_exclude=KeywordMatcher(experience_exclude),
+        experience_block=KeywordMatcher(experience_block),
+        global_exclude=KeywordMatcher(global_exclude),
+        employment_exclude=KeywordMatcher(employment_exclude),
+        scoring_strong=KeywordMatcher(scoring_strong),
+        scoring_medium=KeywordMatcher(scoring_medium),
+        scoring_nice=KeywordMatcher(scoring_nice),
+        scoring_neg_high=KeywordMatcher(scoring_neg_high),
+        scoring_neg_medium=KeywordMatcher(scoring_neg_medium),
+        weak_domain_signals=KeywordMatcher(weak_domain_signals),
+        bio_context_terms=KeywordMatcher(bio_context_terms),
+        pipeline=FilterPipeline(),
+    )
 
-        # Title include/exclude
-        title_match = False
-        title_strict_match = False
-        if title_include:
-            title_match = match_any(title_include, title)
-        if title_strict:
-            title_strict_match = match_any(title_strict, title)
-            if title_strict_match:
-                title_match = True
-        if title_soft and not title_match:
-            title_match = match_any(title_soft, title)
-        if match_any(title_exclude, title):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "title_exclude",
-                }
-            )
-            drop_stats["title_exclude"] = drop_stats.get("title_exclude", 0) + 1
-            continue
-        if match_any(["PIPELINE"], title) and match_any(
-            ["COMMERCIAL", "MARKET ACCESS", "STRATEGY", "OPERATIONS", "SALES", "MARKETING"],
-            title,
-        ):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "title_exclude_pipeline_business",
-                }
-            )
-            drop_stats["title_exclude_pipeline_business"] = drop_stats.get("title_exclude_pipeline_business", 0) + 1
-            continue
 
-        # Seniority include/exclude
-        if match_any(seniority_exclude, title):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "seniority_exclude",
-                }
-            )
-            drop_stats["seniority_exclude"] = drop_stats.get("seniority_exclude", 0) + 1
-            continue
-        # If include_any provided, do not require match; just use to boost
-
-        # Experience traps / filter
-        if match_any(experience_exclude, text):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "experience_exclude",
-                }
-            )
-            drop_stats["experience_exclude"] = drop_stats.get("experience_exclude", 0) + 1
-            continue
-        if experience_block and match_any(experience_block, text):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "experience_exclude",
-                }
-            )
-            drop_stats["experience_exclude"] = drop_stats.get("experience_exclude", 0) + 1
-            continue
+class JobFields:
+    """Normalized views of one job, computed on first use and shared by every stage."""
 
-        # Global exclusions
-        if match_any(global_exclude, text):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "global_exclude",
-                }
-            )
-            drop_stats["global_exclude"] = drop_stats.get("global_exclude", 0) + 1
-            continue
-        if match_any(employment_exclude, text):
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "employment_exclude",
-                }
-            )
-            drop_stats["employment_exclude"] = drop_stats.get("employment_exclude", 0) + 1
-            continue
+    def __init__(self, job: JobRecord, compiled: CompiledFilter) -> None:
+        self.job = job
+        self.compiled = compiled
 
-        # Stage 1 bioinfo-likely pass condition
-        if title_match:
-            stage1_pass_reasons.append("title_match")
-        weak_in_title = match_any(weak_domain_signals, title)
-        weak_in_desc = match_any(weak_domain_signals, description) and match_any(bio_context_terms, description)
+    @cached_property
+    def title(self) -> str:
+        return normalize(self.job.job_title or "")
+
+    @cached_property
+    def location(self) -> str:
+        return normalize(self.job.location or "")
+
+    @cached_property
+    def description(self) -> str:
+        return DESCRIPTION_CACHE.text(self.job)
+
+    @cached_property
+    def text(self) -> str:
+        # Same value as build_filter_text(job).
+        return " ".join(part for part in (self.title, self.location, self.description) if part)
+
+    @cached_property
+    def title_strict_match(self) -> bool:
+        return self.compiled.title_strict.match_any(self.title)
+
+    @cached_property
+    def title_match(self) -> bool:
+        compiled = self.compiled
+        return (
+            compiled.title_include.match_any(self.title)
+            or self.title_strict_match
+            or compiled.title_soft.match_any(self.title)
+        )
+
+    @cached_property
+    def location_match(self) -> bool:
+        location = self.location
+        return bool(location) and (is_us_location(location) or self.compiled.location_include.match_any(location))
+
+    @cached_property
+    def stage1_pass_reasons(self) -> list[str]:
+        compiled = self.compiled
+        reasons = []
+        if self.title_match:
+            reasons.append("title_match")
+        weak_in_title = compiled.weak_domain_signals.match_any(self.title)
+        weak_in_desc = compiled.weak_domain_signals.match_any(self.description) and compiled.bio_context_terms.match_any(
+            self.description
+        )
         if weak_in_title or weak_in_desc:
-            stage1_pass_reasons.append("weak_domain_signal")
-        if not stage1_pass_reasons:
-            dropped.append(
-                {
-                    "company": job.company,
-                    "job_title": job.job_title,
-                    "location": job.location,
-                    "remote_or_hybrid": job.remote_or_hybrid,
-                    "posting_date": job.posting_date,
-                    "source": job.source,
-                    "job_url": job.job_url,
-                    "score": 0,
-                    "list_source": job.list_source,
-                    "stage1_drop_reason": "no_bioinfo_signal",
-                }
+            reasons.append("weak_domain_signal")
+        return reasons
+
+    @cached_property
+    def posting_age(self) -> int | None:
+        return posting_age(self.job)
+
+
+def location_stage(fields: JobFields) -> str | None:
+    # Location include/exclude (soft include, hard exclude)
+    if fields.compiled.location_exclude.match_any(fields.text):
+        return "location_exclude"
+    location = fields.location
+    if location and NON_US_LOCATION_MATCHER.match_any(location) and not is_us_location(location):
+        return "location_exclude_non_us"
+    return None
+
+
+def title_stage(fields: JobFields) -> str | None:
+    if fields.compiled.title_exclude.match_any(fields.title):
+        return "title_exclude"
+    if PIPELINE_TITLE.match_any(fields.title) and PIPELINE_BUSINESS_TITLE.match_any(fields.title):
+        return "title_exclude_pipeline_business"
+    return None
+
+
+def seniority_stage(fields: JobFields) -> str | None:
+    # If include_any provided, do not require match; just use to boost
+    if fields.compiled.seniority_exclude.match_any(fields.title):
+        return "seniority_exclude"
+    return None
+
+
+def experience_stage(fields: JobFields) -> str | None:
+    compiled = fields.compiled
+    if compiled.experience_exclude.match_any(fields.text) or compiled.experience_block.match_any(fields.text):
+        return "experience_exclude"
+    return None
+
+
+def global_stage(fields: JobFields) -> str | None:
+    if fields.compiled.global_exclude.match_any(fields.text):
+        return "global_exclude"
+    return None
+
+
+def employment_stage(fields: JobFields) -> str | None:
+    if fields.compiled.employment_exclude.match_any(fields.text):
+        return "employment_exclude"
+    return None
+
+
+def bio_signal_stage(fields: JobFields) -> str | None:
+    # Stage 1 bioinfo-likely pass condition
+    if not fields.stage1_pass_reasons:
+        return "no_bioinfo_signal"
+    return None
+
+
+def temporal_stage(fields: JobFields) -> str | None:
+    # Temporal filter (only if posting date is present)
+    posting_age = fields.posting_age
+    if posting_age is None:
+        return None
+    temporal = fields.compiled.cfg.get("temporal_filter", {})
+    hard_exclude_days = temporal.get("hard_exclude_older_than_days")
+    max_days = temporal.get("max_posting_age_days")
+    if hard_exclude_days is not None and posting_age > hard_exclude_days:
+        return "too_old_hard"
+    if max_days is not None and posting_age > max_days:
+        return "too_old"
+    return None
+
+
+@dataclass(frozen=True)
+class FilterStage:
+    name: str
+    cost: int
+    check: Callable[[JobFields], str | None]
+    listing: bool = False
+
+
+# Stages in their historical order, which also decides the drop reason of a
+# job that more than one stage would drop. cost is a rough relative estimate
+# (title-only checks are cheap, full-text scans are not) used to order the
+# stages before any timings have been measured. listing stages decide from
+# the fields an ATS listing carries: a posting they drop without its
+# description is dropped with it too.
+FILTER_STAGES = [
+    FilterStage("location", 3, location_stage, listing=True),
+    FilterStage("title", 1, title_stage, listing=True),
+    FilterStage("seniority", 1, seniority_stage, listing=True),
+    FilterStage("experience", 4, experience_stage),
+    FilterStage("global", 3, global_stage),
+    FilterStage("employment", 2, employment_stage),
+    FilterStage("bio_signal", 2, bio_signal_stage),
+    FilterStage("temporal", 1, temporal_stage, listing=True),
+]
+
+
+class FilterPipeline:
+    """Run filter stages until one drops the job, timing each stage.
+
+    The default order is FILTER_STAGES as listed. reorder() puts the stages
+    with the lowest time per dropped job first, from the stats of a previous
+    run. Which jobs pass and their scores do not depend on the order, but a
+    job that several stages would drop is attributed to the first of them
+    that runs.
+    """
+
+    def __init__(self, stages: list[FilterStage] | None = None) -> None:
+        self.stages = list(stages or FILTER_STAGES)
+        self.stats = {stage.name: {"evaluated": 0, "dropped": 0, "seconds": 0.0} for stage in self.stages}
+
+    def drop_reason(self, fields: JobFields) -> str | None:
+        for stage in self.stages:
+            stats = self.stats[stage.name]
+            start = time.perf_counter()
+            reason = stage.check(fields)
+            stats["seconds"] += time.perf_counter() - start
+            stats["evaluated"] += 1
+            if reason:
+                stats["dropped"] += 1
+                return reason
+        return None
+
+    def listing_drop_reason(self, fields: JobFields) -> str | None:
+        """Drop reason from the listing stages alone; not counted in the stage stats."""
+        for stage in self.stages:
+            if stage.listing:
+                reason = stage.check(fields)
+                if reason:
+                    return reason
+        return None
+
+    def reorder(self, previous: dict | None = None) -> None:
+        previous = previous or {}
+
+        def rank(stage: FilterStage) -> tuple[int, float]:
+            stats = previous.get(stage.name) or {}
+            evaluated = stats.get("evaluated", 0)
+            dropped = stats.get("dropped", 0)
+            if not evaluated:
+                return (1, stage.cost)
+            if not dropped:
+                return (2, stats.get("seconds", 0.0) / evaluated)
+            return (0, stats.get("seconds", 0.0) / dropped)
+
+        self.stages.sort(key=rank)
+
+    def set_order(self, names: list[str]) -> None:
+        position = {name: idx for idx, name in enumerate(names)}
+        self.stages.sort(key=lambda stage: position.get(stage.name, len(position)))
+
+    def take_stats(self) -> dict:
+        stats = self.stats
+        self.stats = {stage.name: {"evaluated": 0, "dropped": 0, "seconds": 0.0} for stage in self.stages}
+        return stats
+
+    def merge_stats(self, stats: dict) -> None:
+        for name, values in stats.items():
+            current = self.stats.setdefault(name, {"evaluated": 0, "dropped": 0, "seconds": 0.0})
+            for field, value in values.items():
+                current[field] += value
+
+    def report(self) -> list[str]:
+        lines = []
+        for stage in self.stages:
+            stats = self.stats[stage.name]
+            evaluated = stats["evaluated"]
+            rate = stats["dropped"] / evaluated if evaluated else 0.0
+            per_job = stats["seconds"] / evaluated * 1e6 if evaluated else 0.0
+            lines.append(
+                f"  {stage.name:<11} {evaluated:>7} seen {stats['dropped']:>6} dropped ({rate:6.1%}) "
+                f"{stats['seconds'] * 1000:8.1f}ms ({per_job:.1f}us/job)"
             )
-            drop_stats["no_bioinfo_signal"] = drop_stats.get("no_bioinfo_signal", 0) + 1
-            continue
+        return lines
 
-        # Temporal filter (only if posting date is present)
-        posting_age = age_days(job.posting_date)
-        temporal = filter_cfg.get("temporal_filter", {})
-        hard_exclude_days = temporal.get("hard_exclude_older_than_days")
-        max_days = temporal.get("max_posting_age_days")
-        if posting_age is not None:
-            if hard_exclude_days is not None and posting_age > hard_exclude_days:
-                dropped.append(
-                    {
-                        "company": job.company,
-                        "job_title": job.job_title,
-                        "location": job.location,
-                        "remote_or_hybrid": job.remote_or_hybrid,
-                        "posting_date": job.posting_date,
-                        "source": job.source,
-                        "job_url": job.job_url,
-                        "score": 0,
-                        "list_source": job.list_source,
-                        "stage1_drop_reason": "too_old_hard",
-                    }
-                )
-                drop_stats["too_old_hard"] = drop_stats.get("too_old_hard", 0) + 1
-                continue
-            if max_days is not None and posting_age > max_days:
-                dropped.append(
-                    {
-                        "company": job.company,
-                        "job_title": job.job_title,
-                        "location": job.location,
-                        "remote_or_hybrid": job.remote_or_hybrid,
-                        "posting_date": job.posting_date,
-                        "source": job.source,
-                        "job_url": job.job_url,
-                        "score": 0,
-                        "list_source": job.list_source,
-                        "stage1_drop_reason": "too_old",
-                    }
-                )
-                drop_stats["too_old"] = drop_stats.get("too_old", 0) + 1
-                continue
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"order": [stage.name for stage in self.stages], "stages": self.stats}
+        path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
-        # Scoring
-        strong_hits = count_matches(scoring_strong, text)
-        medium_hits = count_matches(scoring_medium, text)
-        nice_hits = count_matches(scoring_nice, text)
-        weights = scoring.get("weights", {})
-        score = (
-            strong_hits * weights.get("strong", 0)
-            + medium_hits * weights.get("medium", 0)
-            + nice_hits * weights.get("nice_to_have", 0)
-        )
-        if title_match:
-            score += weights.get("strong", 0)
-        if location_match:
-            score += 1
-
-        # Negative penalties
-        neg = scoring.get("negative_keywords", {})
-        if match_any(scoring_neg_high, text):
-            score += neg.get("penalty_weights", {}).get("high_penalty", 0)
-        if match_any(scoring_neg_medium, text):
-            score += neg.get("penalty_weights", {}).get("medium_penalty", 0)
-
-        # Freshness bonus
-        bonus = 0
-        if posting_age is not None:
-            fresh = filter_cfg.get("priority_logic", {}).get("fresh_posting_bonus", {})
-            if posting_age <= 3:
-                bonus = fresh.get("days_0_to_3", 0)
-            elif posting_age <= 7:
-                bonus = fresh.get("days_4_to_7", 0)
+
+def dropped_row(job: JobRecord, reason: str) -> dict:
+    return {
+        "company": job.company,
+        "job_title": job.job_title,
+        "location": job.location,
+        "remote_or_hybrid": job.remote_or_hybrid,
+        "posting_date": job.posting_date,
+        "source": job.source,
+        "job_url": job.job_url,
+        "score": 0,
+        "list_source": job.list_source,
+        "stage1_drop_reason": reason,
+    }
+
+
+def scored_row(fields: JobFields) -> dict:
+    job = fields.job
+    compiled = fields.compiled
+    filter_cfg = compiled.cfg
+    scoring = filter_cfg.get("keyword_scoring", {})
+    text = fields.text
+
+    # Scoring
+    strong_hits = compiled.scoring_strong.count_matches(text)
+    medium_hits = compiled.scoring_medium.count_matches(text)
+    nice_hits = compiled.scoring_nice.count_matches(text)
+    weights = scoring.get("weights", {})
+    score = (
+        strong_hits * weights.get("strong", 0)
+        + medium_hits * weights.get("medium", 0)
+        + nice_hits * weights.get("nice_to_have", 0)
+    )
+    if fields.title_match:
+        score += weights.get("strong", 0)
+    if fields.location_match:
+        score += 1
+
+    # Negative penalties
+    penalty_weights = scoring.get("negative_keywords", {}).get("penalty_weights", {})
+    penalties = 0
+    if compiled.scoring_neg_high.match_any(text):
+        penalties += penalty_weights.get("high_penalty", 0)
+    if compiled.scoring_neg_medium.match_any(text):
+        penalties += penalty_weights.get("medium_penalty", 0)
+    score += penalties
+
+    # Freshness bonus
+    bonus = 0
+    posting_age = fields.posting_age
+    if posting_age is not None:
+        fresh = filter_cfg.get("priority_logic", {}).get("fresh_posting_bonus", {})
+        if posting_age <= 3:
+            bonus = fresh.get("days_0_to_3", 0)
+        elif posting_age <= 7:
+            bonus = fresh.get("days_4_to_7", 0)
+        else:
+            bonus = fresh.get("older_than_7", 0)
+    if fields.title_strict_match:
+        bonus += filter_cfg.get("priority_logic", {}).get("title_strict_match_bonus", 0)
+    score += bonus
+
+    return {
+        "company": job.company,
+        "job_title": job.job_title,
+        "location": job.location,
+        "remote_or_hybrid": job.remote_or_hybrid,
+        "posting_date": job.posting_date,
+        "source": job.source,
+        "job_url": job.job_url,
+        "score": score,
+        "list_source": job.list_source,
+        "stage1_pass_reasons": fields.stage1_pass_reasons,
+        "score_breakdown": {
+            "title_bonus": weights.get("strong", 0) if fields.title_match else 0,
+            "freshness_bonus": bonus,
+            "strong_hits": strong_hits,
+            "medium_hits": medium_hits,
+            "nice_hits": nice_hits,
+            "penalties": penalties,
+        },
+    }
+
+
+def filter_jobs(
+    jobs: list[JobRecord], filter_cfg: dict | CompiledFilter
+) -> tuple[list[dict], list[dict], dict]:
+    compiled = filter_cfg if isinstance(filter_cfg, CompiledFilter) else compile_filter(filter_cfg)
+    pipeline = compiled.pipeline
+    results: list[dict] = []
+    dropped: list[dict] = []
+    drop_stats: dict[str, int] = {}
+    for job in jobs:
+        fields = JobFields(job, compiled)
+        reason = pipeline.drop_reason(fields)
+        if reason:
+            dropped.append(dropped_row(job, reason))
+            drop_stats[reason] = drop_stats.get(reason, 0) + 1
+        else:
+            results.append(scored_row(fields))
+    return results, dropped, drop_stats
+
+
+TEMPORAL_DROP_REASONS = {"too_old_hard", "too_old"}
+# Bump when a change to the filter code can change outcomes, so delta
+# indexes written by older code are discarded.
+FILTER_VERSION = 3
+
+
+def job_digest(job: JobRecord) -> str:
+    return hashlib.sha1(job.to_json(sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class DeltaIndex:
+    """Per-target fingerprints of last run's postings and their filter outcomes.
+
+    A posting's fingerprint is a digest of its whole record, so an added or
+    edited posting always misses. Every stage ahead of the temporal filter is
+    date-independent, so a cached drop from one of them is reused as-is; a
+    posting that reached the temporal stage is reused only while its
+    posting age (in days) is unchanged.
+    """
+
+    def __init__(self, path: Path, filter_cfg: dict) -> None:
+        self.path = path
+        payload = json.dumps([FILTER_VERSION, filter_cfg], sort_keys=True)
+        self.filter_hash = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        self.targets: dict[str, dict[str, dict]] = {}
+        self.stats = {"targets_unchanged": 0, "postings_reused": 0, "postings_filtered": 0}
+        if path.exists():
+            try:
+                data = load_json(path)
+            except Exception:
+                data = {}
+            if isinstance(data, dict) and data.get("filter_hash") == self.filter_hash:
+                self.targets = data.get("targets", {})
+
+    def lookup(self, key: str, jobs: list[JobRecord]) -> tuple[list[str], list[dict | None], list[JobRecord]]:
+        """Digests, reusable outcomes (None where a posting must be filtered) and the postings to filter."""
+        prior = self.targets.get(key, {})
+        digests = [job_digest(job) for job in jobs]
+        outcomes: list[dict | None] = []
+        pending: list[JobRecord] = []
+        for job, digest in zip(jobs, digests):
+            entry = prior.get(digest)
+            static_drop = entry is not None and not entry["passed"] and entry["reason"] not in TEMPORAL_DROP_REASONS
+            if entry is not None and (static_drop or entry["age"] == posting_age(job)):
+                outcomes.append(entry)
+                # The filter text is not rebuilt, so keep its description for when it is.
+                DESCRIPTION_CACHE.keep(job)
             else:
-                bonus = fresh.get("older_than_7", 0)
-        if title_strict_match:
-            bonus += filter_cfg.get("priority_logic", {}).get("title_strict_match_bonus", 0)
-        score += bonus
+                outcomes.append(None)
+                pending.append(job)
+        if key in self.targets and not pending and set(digests) == set(prior):
+            self.stats["targets_unchanged"] += 1
+        self.stats["postings_reused"] += len(jobs) - len(pending)
+        self.stats["postings_filtered"] += len(pending)
+        return digests, outcomes, pending
 
-        results.append(
-            {
-                "company": job.company,
-                "job_title": job.job_title,
-                "location": job.location,
-                "remote_or_hybrid": job.remote_or_hybrid,
-                "posting_date": job.posting_date,
-                "source": job.source,
-                "job_url": job.job_url,
-                "score": score,
-                "list_source": job.list_source,
-                "stage1_pass_reasons": stage1_pass_reasons,
-                "score_breakdown": {
-                    "title_bonus": weights.get("strong", 0) if title_match else 0,
-                    "freshness_bonus": bonus,
-                    "strong_hits": strong_hits,
-                    "medium_hits": medium_hits,
-                    "nice_hits": nice_hits,
-                    "penalties": (
-                        (neg.get("penalty_weights", {}).get("high_penalty", 0) if match_any(scoring_neg_high, text) else 0)
-                        + (neg.get("penalty_weights", {}).get("medium_penalty", 0) if match_any(scoring_neg_medium, text) else 0)
-                    ),
-                },
-            }
-        )
+    def record(
+        self, key: str, jobs: list[JobRecord], digests: list[str], outcomes: list[dict | None], fresh: list[dict]
+    ) -> tuple[list[dict], list[dict], dict]:
+        fresh_iter = iter(fresh)
+        current: dict[str, dict] = {}
+        merged = []
+        for job, digest, entry in zip(jobs, digests, outcomes):
+            if entry is None:
+                entry = next(fresh_iter)
+                entry["age"] = posting_age(job)
+            current[digest] = entry
+            merged.append(entry)
+        self.targets[key] = current
+        return split_outcomes(merged)
+
+    def filter_target(
+        self, key: str, jobs: list[JobRecord], compiled: CompiledFilter
+    ) -> tuple[list[dict], list[dict], dict]:
+        digests, outcomes, pending = self.lookup(key, jobs)
+        return self.record(key, jobs, digests, outcomes, filter_job_outcomes(pending, compiled))
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump({"filter_hash": self.filter_hash, "targets": self.targets}, handle, ensure_ascii=True)
+        os.replace(tmp_path, self.path)
+
+
+def filter_job_outcomes(jobs: list[JobRecord], compiled: CompiledFilter) -> list[dict]:
+    """Per-job filter outcomes, in input order, for the delta index."""
+    pipeline = compiled.pipeline
+    outcomes = []
+    for job in jobs:
+        fields = JobFields(job, compiled)
+        reason = pipeline.drop_reason(fields)
+        if reason:
+            outcomes.append({"passed": False, "reason": reason, "row": dropped_row(job, reason)})
+        else:
+            outcomes.append({"passed": True, "reason": "", "row": scored_row(fields)})
+    return outcomes
+
+
+def split_outcomes(outcomes: list[dict]) -> tuple[list[dict], list[dict], dict]:
+    results: list[dict] = []
+    dropped: list[dict] = []
+    drop_stats: dict[str, int] = {}
+    for entry in outcomes:
+        if entry["passed"]:
+            results.append(entry["row"])
+        else:
+            dropped.append(entry["row"])
+            drop_stats[entry["reason"]] = drop_stats.get(entry["reason"], 0) + 1
     return results, dropped, drop_stats
 
 
+FILTER_PROCESS_THRESHOLD = 20000
+FILTER_CHUNK_SIZE = 1000
+FILTER_WORKER: CompiledFilter | None = None
+
+
+def init_filter_worker(filter_cfg: dict, order: list[str], descriptions: dict[str, str]) -> None:
+    global FILTER_WORKER, DESCRIPTION_CACHE
+    FILTER_WORKER = compile_filter(filter_cfg)
+    FILTER_WORKER.pipeline.set_order(order)
+    DESCRIPTION_CACHE = DescriptionCache(descriptions)
+    DESCRIPTION_CACHE.pending = {}
+
+
+def filter_worker_shard(jobs: list[JobRecord]) -> tuple[list[dict], dict, tuple[dict, dict]]:
+    outcomes = filter_job_outcomes(jobs, FILTER_WORKER)
+    return outcomes, FILTER_WORKER.pipeline.take_stats(), DESCRIPTION_CACHE.take_used()
+
+
+class FilterPool:
+    """Filter shards of jobs in worker processes.
+
+    Each worker compiles the filter once, in its initializer, and runs the
+    stages in the parent's order. Shards come back in submission order, so
+    merged results match a single in-process pass. Stage stats from the
+    workers are folded into the parent's pipeline, and the description cache
+    entries they used into DESCRIPTION_CACHE, so the next run still has them.
+    """
+
+    def __init__(self, compiled: CompiledFilter, workers: int, chunk_size: int = FILTER_CHUNK_SIZE) -> None:
+        self.compiled = compiled
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        order = [stage.name for stage in compiled.pipeline.stages]
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_filter_worker,
+            initargs=(compiled.cfg, order, DESCRIPTION_CACHE.entries),
+        )
+
+    def submit(self, jobs: list[JobRecord]) -> list[Future]:
+        return [
+            self.executor.submit(filter_worker_shard, jobs[start : start + self.chunk_size])
+            for start in range(0, len(jobs), self.chunk_size)
+        ]
+
+    def collect(self, futures: list[Future]) -> list[dict]:
+        outcomes: list[dict] = []
+        for future in futures:
+            shard, stats, descriptions = future.result()
+            outcomes.extend(shard)
+            self.compiled.pipeline.merge_stats(stats)
+            DESCRIPTION_CACHE.merge_used(*descriptions)
+        return outcomes
+
+    def filter(self, jobs: list[JobRecord]) -> tuple[list[dict], list[dict], dict]:
+        return split_outcomes(self.collect(self.submit(jobs)))
+
+    def close(self) -> None:
+        self.executor.shutdown()
+
+
+def filter_workers_for(requested: int, jobs_seen: int) -> int:
+    """Worker processes to filter with: 0 means auto, 1 keeps filtering in-process."""
+    if requested > 0:
+        return requested if requested > 1 else 0
+    if jobs_seen < FILTER_PROCESS_THRESHOLD:
+        return 0
+    cpu_count = os.cpu_count() or 1
+    return min(cpu_count, 8) if cpu_count > 1 else 0
+
+
+class StreamingFilter:
+    """Filter each target's jobs once, as they arrive.
+
+    Rows accumulate in arrival order, so the totals always equal a single
+    filter_jobs call over every job added so far. With a DeltaIndex, postings
+    unchanged since the last run reuse their previous outcome.
+
+    Once a FilterPool is running, add() only queues the target's jobs on it
+    and merges finished targets, in arrival order; finish() waits for the
+    rest.
+    """
+
+    def __init__(
+        self, filter_cfg: dict | CompiledFilter, delta: DeltaIndex | None = None, filter_workers: int = 0
+    ) -> None:
+        self.compiled = filter_cfg if isinstance(filter_cfg, CompiledFilter) else compile_filter(filter_cfg)
+        self.delta = delta
+        self.filter_workers = filter_workers
+        self.pool: FilterPool | None = None
+        self.queued: deque[tuple] = deque()
+        self.results: list[dict] = []
+        self.drop_stats: dict[str, int] = {}
+        self.passed_by_target: dict[str, int] = {}
+        self.jobs_seen = 0
+
+    def add(self, jobs: list[JobRecord], target_key: str | None = None) -> None:
+        if self.pool is None:
+            workers = filter_workers_for(self.filter_workers, self.jobs_seen + len(jobs))
+            if workers:
+                self.pool = FilterPool(self.compiled, workers)
+        self.jobs_seen += len(jobs)
+        if self.pool is not None:
+            self.queue(jobs, target_key)
+            self.drain(wait_all=False)
+        elif self.delta is not None and target_key is not None:
+            self.merge(self.delta.filter_target(target_key, jobs, self.compiled), target_key)
+        elif jobs:
+            self.merge(filter_jobs(jobs, self.compiled), target_key)
+
+    def queue(self, jobs: list[JobRecord], target_key: str | None) -> None:
+        if self.delta is not None and target_key is not None:
+            digests, outcomes, pending = self.delta.lookup(target_key, jobs)
+            self.queued.append((target_key, jobs, digests, outcomes, self.pool.submit(pending)))
+        else:
+            self.queued.append((target_key, jobs, None, None, self.pool.submit(jobs)))
+
+    def drain(self, wait_all: bool) -> None:
+        while self.queued:
+            target_key, jobs, digests, outcomes, futures = self.queued[0]
+            if not wait_all and not all(future.done() for future in futures):
+                return
+            self.queued.popleft()
+            fresh = self.pool.collect(futures)
+            if digests is None:
+                self.merge(split_outcomes(fresh), target_key)
+            else:
+                self.merge(self.delta.record(target_key, jobs, digests, outcomes, fresh), target_key)
+
+    def merge(self, filtered: tuple[list[dict], list[dict], dict], target_key: str | None = None) -> None:
+        # Dropped rows are only counted, by reason.
+        results, _, drop_stats = filtered
+        if target_key is not None:
+            self.passed_by_target[target_key] = self.passed_by_target.get(target_key, 0) + len(results)
+        self.results.extend(results)
+        for reason, count in drop_stats.items():
+            self.drop_stats[reason] = self.drop_stats.get(reason, 0) + count
+
+    def finish(self) -> None:
+        if self.pool is not None:
+            self.drain(wait_all=True)
+            self.pool.close()
+
+
+class JsonlWriter:
+    """Append-only JSONL writer that publishes its file atomically.
+
+    Rows go to a sibling .tmp file as they are written; commit() renames it
+    over the real path, so an interrupted run leaves the previous file intact.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.count = 0
+        self._handle = self.tmp_path.open("w", encoding="utf-8")
+
+    def write(self, rows: Iterable[dict]) -> None:
+        self.write_lines(json.dumps(row, ensure_ascii=True) for row in rows)
+
+    def write_lines(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self._handle.write(line + "\n")
+            self.count += 1
+        self._handle.flush()
+
+    def commit(self) -> None:
+        self._handle.close()
+        os.replace(self.tmp_path, self.path)
+
+
 def write_csv(path: Path, rows: list[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     headers = [
@@ -1173,23 +4161,159 @@ def write_latest_json(path: Path, rows: list[dict]) -> None:
         json.dump(rows, handle, ensure_ascii=True, indent=2)
 
 
-def merge_history(history_path: Path, latest_rows: list[dict]) -> list[dict]:
-    if not history_path.exists():
-        return latest_rows
+HISTORY_OPTIONAL_FIELDS = ("stage1_pass_reasons", "stage1_drop_reason", "score_breakdown")
 
-    with history_path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        existing = list(reader)
 
-    seen = {(row.get("job_url") or "", normalize_company(row.get("company") or "")) for row in existing}
-    combined = existing[:]
-    for row in latest_rows:
-        key = (row.get("job_url") or "", normalize_company(row.get("company") or ""))
-        if key in seen:
-            continue
-        seen.add(key)
-        combined.append(row)
-    return combined
+def history_row(row: dict) -> dict:
+    """A copy of a filtered row with the cell values write_csv would give it."""
+    row = dict(row)
+    if not row.get("location"):
+        row["location"] = "NA"
+    if not row.get("posting_date"):
+        row["posting_date"] = "NA"
+    for key in HISTORY_OPTIONAL_FIELDS:
+        if key in row and isinstance(row[key], (list, dict)):
+            row[key] = json.dumps(row[key], ensure_ascii=True)
+    return row
+
+
+class JobStore:
+    """Every filtered posting ever seen, in SQLite, keyed on (job_url, normalized company).
+
+    Replaces re-reading and rewriting jobs_history.csv at every checkpoint:
+    upsert() only touches the rows it is given, keeping the first row stored
+    for a posting (as the CSV merge did) and moving its last_seen forward.
+    export_csv() writes jobs_history.csv in first-seen order. On open, any
+    CSV rows the store lacks are merged in, so the committed CSV stays a
+    complete backup even when the cached store is stale or missing.
+    """
+
+    def __init__(self, path: Path, history_csv: Path | None = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS postings (
+                seq INTEGER PRIMARY KEY,
+                job_url TEXT NOT NULL,
+                company_key TEXT NOT NULL,
+                row TEXT NOT NULL,
+                first_seen TEXT,
+                last_seen TEXT,
+                UNIQUE (job_url, company_key)
+            )
+            """
+        )
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS lifecycle (
+                source TEXT NOT NULL,
+                company_key TEXT NOT NULL,
+                posting_key TEXT NOT NULL,
+                target_key TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                closed_at TEXT,
+                PRIMARY KEY (source, company_key, posting_key)
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS lifecycle_target ON lifecycle (target_key, closed_at)")
+        self.lifecycle_stats = {"new": 0, "seen": 0, "reopened": 0, "closed": 0}
+        self.stats = {"inserted": 0, "updated": 0}
+        self.merged = 0
+        if history_csv is not None and history_csv.exists():
+            with history_csv.open(newline="", encoding="utf-8") as handle:
+                self.merged = self.merge(csv.DictReader(handle))
+
+    def merge(self, rows: Iterable[dict]) -> int:
+        """Add the history rows the store lacks; returns how many were added.
+
+        A store restored from an older cache is missing whatever later runs
+        committed to the CSV. Rows from the CSV have no known first/last seen.
+        """
+        before = self.count()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO postings (job_url, company_key, row) VALUES (?, ?, ?)",
+                (
+                    (
+                        row.get("job_url") or "",
+                        normalize_company(row.get("company") or ""),
+                        json.dumps(history_row(row), ensure_ascii=True),
+                    )
+                    for row in rows
+                ),
+            )
+        return self.count() - before
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def upsert(self, rows: Iterable[dict], seen_at: str | None) -> None:
+        with self.conn:
+            for row in rows:
+                key = (row.get("job_url") or "", normalize_company(row.get("company") or ""))
+                cursor = self.conn.execute(
+                    "UPDATE postings SET last_seen = ? WHERE job_url = ? AND company_key = ?", (seen_at, *key)
+                )
+                if cursor.rowcount:
+                    self.stats["updated"] += 1
+                    continue
+                self.conn.execute(
+                    "INSERT INTO postings (job_url, company_key, row, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)",
+                    (*key, json.dumps(history_row(row), ensure_ascii=True), seen_at, seen_at),
+                )
+                self.stats["inserted"] += 1
+
+    def observe(self, target_key: str, jobs: list[JobRecord], seen_at: str, complete: bool) -> None:
+        """Record this run's postings for a target and set each job's first_seen.
+
+        Postings are keyed on (source, company, job_id or URL). When the
+        target was pulled without failures, its open postings that did not
+        show up this run are marked closed; a closed posting that returns
+        is reopened with its original first_seen.
+        """
+        with self.conn:
+            for job in jobs:
+                key = (job.source, normalize_company(job.company), job.job_id or job.job_url)
+                found = self.conn.execute(
+                    "SELECT first_seen, closed_at FROM lifecycle WHERE source = ? AND company_key = ? AND posting_key = ?",
+                    key,
+                ).fetchone()
+                if found is None:
+                    self.conn.execute(
+                        "INSERT INTO lifecycle (source, company_key, posting_key, target_key, first_seen, last_seen) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (*key, target_key, seen_at, seen_at),
+                    )
+                    self.lifecycle_stats["new"] += 1
+                    job.first_seen = seen_at
+                    continue
+                self.conn.execute(
+                    "UPDATE lifecycle SET last_seen = ?, closed_at = NULL, target_key = ? "
+                    "WHERE source = ? AND company_key = ? AND posting_key = ?",
+                    (seen_at, target_key, *key),
+                )
+                self.lifecycle_stats["reopened" if found[1] else "seen"] += 1
+                job.first_seen = found[0]
+            if complete:
+                cursor = self.conn.execute(
+                    "UPDATE lifecycle SET closed_at = ? WHERE target_key = ? AND closed_at IS NULL AND last_seen < ?",
+                    (seen_at, target_key, seen_at),
+                )
+                self.lifecycle_stats["closed"] += cursor.rowcount
+
+    def rows(self) -> Iterator[dict]:
+        for (row,) in self.conn.execute("SELECT row FROM postings ORDER BY seq"):
+            yield json.loads(row)
+
+    def export_csv(self, path: Path) -> None:
+        write_csv(path, list(self.rows()))
+
+    def close(self) -> None:
+        self.conn.close()
 
 
 def parse_args() -> argparse.Namespace:
@@ -1202,9 +4326,81 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--latest-json", default="data/jobs_latest.json")
     parser.add_argument("--history-csv", default="data/jobs_history.csv")
     parser.add_argument("--failures-output", default="data/ats_pull_failures.jsonl")
+    parser.add_argument("--job-store", default="data/jobs_store.sqlite3", help="SQLite history; --history-csv is its export.")
     parser.add_argument("--batch-interval-seconds", type=int, default=120)
     parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads")
+    parser.add_argument("--concurrency", type=int, default=200, help="In-flight requests for --engine async.")
+    parser.add_argument("--per-host-limit", type=int, default=16, help="In-flight requests per host for --engine async.")
+    parser.add_argument("--workday-search-text", default="", help="Server-side searchText for Workday CXS.")
+    parser.add_argument(
+        "--json-decoder",
+        choices=["typed", "stdlib", "stream"],
+        default="typed",
+        help=(
+            "Decode Greenhouse/Lever/Ashby payloads into typed records (needs msgspec), via resp.json(), "
+            "or one posting at a time as the body streams in (memory bounded by the largest posting)."
+        ),
+    )
+    parser.add_argument(
+        "--pushdown",
+        action="store_true",
+        help="Narrow ATS searches server-side from the filter (Workday country facet); may miss remote postings.",
+    )
+    parser.add_argument(
+        "--greenhouse-two-phase",
+        action="store_true",
+        help="List Greenhouse boards without content and fetch descriptions only for postings the listing stages keep.",
+    )
+    parser.add_argument("--greenhouse-detail-cache", default="data/http_cache/greenhouse_details.json.gz")
+    parser.add_argument(
+        "--detail-pages",
+        action="store_true",
+        help="Fill location, date and description of icims/rippling/careers_url postings from their pages' JSON-LD.",
+    )
+    parser.add_argument("--detail-page-cache", default="data/http_cache/detail_pages.json.gz")
+    parser.add_argument("--detail-pages-per-host", type=int, default=2, help="Concurrent detail-page fetches per host.")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=0,
+        help=(
+            "Seconds to spend fetching; targets that do not fit are deferred to the next run and "
+            "served from the HTTP cache meanwhile (0 = no limit)."
+        ),
+    )
+    parser.add_argument("--crawl-yield", default="data/http_cache/crawl_yield.json")
+    parser.add_argument(
+        "--link-extractor",
+        choices=sorted(LINK_EXTRACTORS),
+        default="tokenizer",
+        help="HTML anchor extraction for icims/rippling/careers_url pages (lxml is fastest but may differ).",
+    )
+    parser.add_argument(
+        "--debug-careers-links", action="store_true", help="Print why each careers_url anchor was rejected."
+    )
+    parser.add_argument("--host-rate", type=float, default=20.0, help="Starting request rate per host (per second).")
     parser.add_argument("--skip-network-check", action="store_true")
+    parser.add_argument("--http-cache-dir", default="data/http_cache")
+    parser.add_argument("--no-http-cache", action="store_true")
+    parser.add_argument("--delta-index", default="data/http_cache/delta_index.json")
+    parser.add_argument("--no-delta-index", action="store_true")
+    parser.add_argument("--description-cache", default="data/http_cache/descriptions.json.gz")
+    parser.add_argument("--no-description-cache", action="store_true")
+    parser.add_argument(
+        "--filter-workers",
+        type=int,
+        default=0,
+        help=f"Filter in N worker processes; 0 switches a pool on past {FILTER_PROCESS_THRESHOLD} jobs, 1 disables it.",
+    )
+    parser.add_argument("--filter-stage-stats", default="data/http_cache/filter_stages.json")
+    parser.add_argument("--telemetry-output", default="data/http_cache/run_telemetry.jsonl")
+    parser.add_argument("--no-telemetry", action="store_true")
+    parser.add_argument(
+        "--adaptive-stage-order",
+        action="store_true",
+        help="Order filter stages by last run's time per drop (drop reasons may shift between stages).",
+    )
     return parser.parse_args()
 
 
@@ -1221,6 +4417,15 @@ def _run_sanity_checks() -> None:
     assert match_token("US", normalize("REMOTE US")) is True
     assert match_token("GENOM", normalize("GENOMICS")) is True
     assert match_token("COMPUTATIONAL BIOLOGY", normalize("Scientist Computational Biology")) is True
+    matcher = KeywordMatcher(["US", "GENOM", "COMPUTATIONAL BIOLOGY", "US"])
+    assert matcher.match_any(normalize("BUSINESS")) is False
+    assert KeywordMatcher(["GENOMICS", "GENOM"]).match_any(normalize("Genome")) is True
+    assert substring_pattern(["GENOMICS", "GENOME", "GENOM"]).pattern == "GENOM"
+    assert KeywordMatcher(["US"]).match_any(normalize("Genomics")) is False
+    assert matcher.which_matched(normalize("Remote US, Genomics")) == ["US", "GENOM", "US"]
+    assert matcher.count_matches(normalize("Scientist Computational Biology")) == 1
+    assert keyword_pattern(["US", "GENOM"]).search(normalize("BUSINESS")) is None
+    assert keyword_pattern(["US", "GENOM"]).search(normalize("Genomics")) is not None
 
 
 def main() -> int:
@@ -1233,9 +4438,15 @@ def main() -> int:
     target_paths = [Path(p) for p in args.targeted]
     targets = load_targets(target_paths)
 
-    filter_cfg = load_json(Path(args.filter))
+    filter_cfg = compile_filter(load_json(Path(args.filter)))
+    stage_stats_path = Path(args.filter_stage_stats)
+    description_cache_path = Path(args.description_cache)
+    if not args.no_description_cache:
+        DESCRIPTION_CACHE.load(description_cache_path)
+    if args.adaptive_stage_order:
+        previous = load_json(stage_stats_path).get("stages", {}) if stage_stats_path.exists() else {}
+        filter_cfg.pipeline.reorder(previous)
 
-    all_jobs: list[JobRecord] = []
     unfiltered_path = Path(args.unfiltered_output)
     filtered_path = Path(args.filtered_output)
     latest_csv_path = Path(args.latest_csv)
@@ -1251,14 +4462,34 @@ def main() -> int:
 
     last_batch = time.monotonic()
     batch_interval = max(0, args.batch_interval_seconds)
+    delta = None if args.no_delta_index else DeltaIndex(Path(args.delta_index), filter_cfg.cfg)
+    stream = StreamingFilter(filter_cfg, delta, args.filter_workers)
 
-    def fetch_target(target: tuple[dict, str]) -> list[JobRecord]:
-        row, list_source = target
-        if not row.get("company_name"):
-            return []
-        session = requests.Session()
-        session.headers.update({"User-Agent": USER_AGENT})
-        return pull_jobs_for_target(row, session, list_source)
+    unfiltered_writer = JsonlWriter(unfiltered_path)
+    filtered_writer = JsonlWriter(filtered_path)
+    run_started = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    job_store = JobStore(Path(args.job_store), history_csv_path)
+    stored_count = 0
+
+    def write_outputs() -> None:
+        nonlocal stored_count
+        filtered_writer.write(stream.results[filtered_writer.count:])
+        # write_csv rewrites cells in place, so hand it copies of the
+        # accumulated rows rather than the rows themselves.
+        filtered_rows = [dict(row) for row in stream.results]
+        write_csv(latest_csv_path, filtered_rows)
+        write_latest_json(latest_json_path, filtered_rows)
+        job_store.upsert(stream.results[stored_count:], run_started)
+        stored_count = len(stream.results)
+        if FAILURE_LOG:
+            with failures_path.open("w", encoding="utf-8") as handle:
+                for row in FAILURE_LOG:
+                    handle.write(json.dumps(row, ensure_ascii=True) + "\n")
+
+    def print_drop_reasons() -> None:
+        if stream.drop_stats:
+            top_reasons = sorted(stream.drop_stats.items(), key=lambda item: item[1], reverse=True)[:5]
+            print("Top drop reasons:", ", ".join(f"{reason}={count}" for reason, count in top_reasons))
 
     cpu_count = os.cpu_count() or 1
     if cpu_count < 1:
@@ -1270,87 +4501,157 @@ def main() -> int:
         auto_workers = 32
     workers = args.workers if args.workers and args.workers > 0 else auto_workers
 
-    print(f"Using workers: {workers}")
-    if workers <= 1:
-        session = requests.Session()
-        session.headers.update({"User-Agent": USER_AGENT})
-        for row, list_source in targets:
-            if row.get("company_name"):
-                all_jobs.extend(pull_jobs_for_target(row, session, list_source))
-            if batch_interval and (time.monotonic() - last_batch) >= batch_interval:
-                with unfiltered_path.open("w", encoding="utf-8") as handle:
-                    for job in all_jobs:
-                        handle.write(json.dumps(job.__dict__, ensure_ascii=True) + "\n")
-                filtered_rows, dropped_rows, drop_stats = filter_jobs(all_jobs, filter_cfg)
-                with filtered_path.open("w", encoding="utf-8") as handle:
-                    for row in filtered_rows:
-                        handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-                write_csv(latest_csv_path, filtered_rows)
-                write_latest_json(latest_json_path, filtered_rows)
-                history_rows = merge_history(history_csv_path, filtered_rows)
-                write_csv(history_csv_path, history_rows)
-                if FAILURE_LOG:
-                    with failures_path.open("w", encoding="utf-8") as handle:
-                        for row in FAILURE_LOG:
-                            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-                print(f"Batch write: {len(all_jobs)} jobs total; {len(filtered_rows)} filtered")
-                if drop_stats:
-                    top_reasons = sorted(drop_stats.items(), key=lambda item: item[1], reverse=True)[:5]
-                    print("Top drop reasons:", ", ".join(f"{reason}={count}" for reason, count in top_reasons))
-                last_batch = time.monotonic()
+    global WORKDAY_SEARCH_TEXT, LINK_EXTRACTOR, CAREERS_LINK_DEBUG, GREENHOUSE_TWO_PHASE, QUERY_PUSHDOWN, JSON_DECODER
+    global DETAIL_PAGES
+    WORKDAY_SEARCH_TEXT = args.workday_search_text
+    JSON_DECODER = args.json_decoder
+    if args.pushdown:
+        QUERY_PUSHDOWN = QueryPushdown(filter_cfg.cfg)
+    LINK_EXTRACTOR = args.link_extractor
+    CAREERS_LINK_DEBUG = args.debug_careers_links
+    greenhouse_detail_path = Path(args.greenhouse_detail_cache)
+    if args.greenhouse_two_phase:
+        details = DetailCache()
+        details.load(greenhouse_detail_path)
+        GREENHOUSE_TWO_PHASE = GreenhouseTwoPhase(filter_cfg, details)
+    detail_page_path = Path(args.detail_page_cache)
+    if args.detail_pages:
+        pages = DetailCache()
+        pages.load(detail_page_path)
+        DETAIL_PAGES = DetailPages(filter_cfg, pages, args.detail_pages_per_host)
+    HOST_SCHEDULER.configure(args.host_rate)
+    if args.engine == "async":
+        # Worker threads only wait on the loop and parse, so run one per
+        # in-flight request rather than one per core.
+        session_pool = AsyncFetchEngine(args.concurrency, args.per_host_limit)
+        workers = session_pool.concurrency
+        print(f"Using async engine: {workers} in flight, {session_pool.per_host} per host")
     else:
-        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
-            futures = {pool.submit(fetch_target, t): t for t in targets}
-            for idx, future in enumerate(as_completed(futures), 1):
-                all_jobs.extend(future.result())
-                if batch_interval and (time.monotonic() - last_batch) >= batch_interval:
-                    with unfiltered_path.open("w", encoding="utf-8") as handle:
-                        for job in all_jobs:
-                            handle.write(json.dumps(job.__dict__, ensure_ascii=True) + "\n")
-                    filtered_rows, dropped_rows, drop_stats = filter_jobs(all_jobs, filter_cfg)
-                    with filtered_path.open("w", encoding="utf-8") as handle:
-                        for row in filtered_rows:
-                            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-                    write_csv(latest_csv_path, filtered_rows)
-                    write_latest_json(latest_json_path, filtered_rows)
-                    history_rows = merge_history(history_csv_path, filtered_rows)
-                    write_csv(history_csv_path, history_rows)
-                    if FAILURE_LOG:
-                        with failures_path.open("w", encoding="utf-8") as handle:
-                            for row in FAILURE_LOG:
-                                handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-                    print(f"Batch write: {len(all_jobs)} jobs total; {len(filtered_rows)} filtered")
-                    if drop_stats:
-                        top_reasons = sorted(drop_stats.items(), key=lambda item: item[1], reverse=True)[:5]
-                        print("Top drop reasons:", ", ".join(f"{reason}={count}" for reason, count in top_reasons))
-                    last_batch = time.monotonic()
-
-    # Write unfiltered JSONL
-    with unfiltered_path.open("w", encoding="utf-8") as handle:
-        for job in all_jobs:
-            handle.write(json.dumps(job.__dict__, ensure_ascii=True) + "\n")
-
-    filtered_rows, dropped_rows, drop_stats = filter_jobs(all_jobs, filter_cfg)
-
-    # Write filtered JSONL
-    with filtered_path.open("w", encoding="utf-8") as handle:
-        for row in filtered_rows:
-            handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-
-    write_csv(latest_csv_path, filtered_rows)
-    write_latest_json(latest_json_path, filtered_rows)
-
-    history_rows = merge_history(history_csv_path, filtered_rows)
-    write_csv(history_csv_path, history_rows)
-    if FAILURE_LOG:
-        with failures_path.open("w", encoding="utf-8") as handle:
-            for row in FAILURE_LOG:
-                handle.write(json.dumps(row, ensure_ascii=True) + "\n")
-
-    print(f"Pulled {len(all_jobs)} jobs; filtered to {len(filtered_rows)}")
-    if drop_stats:
-        top_reasons = sorted(drop_stats.items(), key=lambda item: item[1], reverse=True)[:5]
-        print("Top drop reasons:", ", ".join(f"{reason}={count}" for reason, count in top_reasons))
+        session_pool = SessionPool(workers)
+        print(f"Using workers: {workers}")
+    http_cache = None
+    if not args.no_http_cache:
+        modes = {
+            "greenhouse_two_phase": args.greenhouse_two_phase,
+            "pushdown": args.pushdown,
+            "detail_pages": args.detail_pages,
+        }
+        http_cache = HttpCache(Path(args.http_cache_dir), HttpCache.fetch_variant(filter_cfg.cfg, modes))
+    telemetry = None if args.no_telemetry else RunTelemetry(Path(args.telemetry_output))
+    scheduler = CrawlScheduler(Path(args.crawl_yield), args.time_budget)
+    if args.time_budget > 0:
+        targets = scheduler.order(targets)
+    for (row, list_source), jobs in iter_target_jobs(
+        targets, workers, session_pool, http_cache, telemetry, scheduler
+    ):
+        # Records are written out as they arrive rather than held for the
+        # whole run, so memory stays flat as the target list grows.
+        unfiltered_writer.write_lines(job.to_json() for job in jobs)
+        target_key = HttpCache.target_key(row, list_source)
+        # Stale records are last run's, and a narrowed search leaves out
+        # postings that are still open, so neither may close anything.
+        complete = (
+            not has_failure(row, list_source)
+            and not (jobs and jobs[0].stale)
+            and not (QUERY_PUSHDOWN is not None and target_key in QUERY_PUSHDOWN.narrowed)
+        )
+        job_store.observe(target_key, jobs, run_started, complete=complete)
+        filter_started = time.perf_counter()
+        stream.add(jobs, target_key)
+        if telemetry is not None:
+            telemetry.finish(target_key, len(jobs), time.perf_counter() - filter_started)
+        if batch_interval and (time.monotonic() - last_batch) >= batch_interval:
+            write_outputs()
+            print(f"Batch write: {unfiltered_writer.count} jobs total; {len(stream.results)} filtered")
+            print_drop_reasons()
+            last_batch = time.monotonic()
+
+    stream.finish()
+    if stream.pool is not None:
+        print(f"Filtered in {stream.pool.workers} worker processes")
+    scheduler.save(stream.passed_by_target)
+    if args.time_budget > 0:
+        print(
+            f"Time budget: {len(scheduler.spent)} targets fetched, "
+            f"{len(scheduler.deferred)} deferred to the next run"
+        )
+    write_outputs()
+    unfiltered_writer.commit()
+    filtered_writer.commit()
+    job_store.export_csv(history_csv_path)
+    print(
+        f"Job store: {job_store.stats['inserted']} new postings, {job_store.stats['updated']} seen again, "
+        f"{job_store.merged} merged from {history_csv_path.name}; {job_store.count()} in history"
+    )
+    lifecycle = job_store.lifecycle_stats
+    print(
+        f"Lifecycle: {lifecycle['new']} new, {lifecycle['seen']} still open, "
+        f"{lifecycle['reopened']} reopened, {lifecycle['closed']} closed"
+    )
+    job_store.close()
+    conn_stats = session_pool.connection_stats()
+    session_pool.close()
+    print(f"Pulled {unfiltered_writer.count} jobs; filtered to {len(stream.results)}")
+    print_drop_reasons()
+    print("Filter stages:")
+    for line in filter_cfg.pipeline.report():
+        print(line)
+    filter_cfg.pipeline.save(stage_stats_path)
+    print(
+        f"HTTP connections: {conn_stats['opened']} opened, {conn_stats['reused']} reused "
+        f"across {conn_stats['hosts']} hosts"
+    )
+    sched_stats = HOST_SCHEDULER.stats
+    print(
+        f"Scheduler: {sched_stats['retries']} retries ({sched_stats['throttled']} throttled), "
+        f"{sched_stats['requeued']} targets requeued"
+    )
+    if delta is not None:
+        delta.save()
+        print(
+            f"Delta index: {delta.stats['targets_unchanged']} targets unchanged; "
+            f"{delta.stats['postings_reused']} postings reused, {delta.stats['postings_filtered']} filtered"
+        )
+    if not args.no_description_cache:
+        DESCRIPTION_CACHE.save(description_cache_path)
+        print(
+            f"Description cache: {DESCRIPTION_CACHE.stats['reused']} reused, "
+            f"{DESCRIPTION_CACHE.stats['normalized']} normalized"
+        )
+    if http_cache is not None:
+        cache_stats = http_cache.stats
+        print(
+            f"HTTP cache: {cache_stats['targets_reused']} targets reused, "
+            f"{cache_stats['targets_fetched']} fetched, {cache_stats['targets_stale']} served stale; "
+            f"{cache_stats['not_modified']} not modified, {cache_stats['same_hash']} same hash, "
+            f"{cache_stats['changed']} changed"
+        )
+    if QUERY_PUSHDOWN is not None:
+        push_stats = QUERY_PUSHDOWN.stats
+        print(
+            f"Query pushdown: {push_stats['targets']} searches narrowed; {push_stats['postings_fetched']} postings "
+            f"fetched, {push_stats['postings_avoided']} avoided (~{push_stats['bytes_avoided'] / 1024:.0f} KiB)"
+        )
+    if GREENHOUSE_TWO_PHASE is not None:
+        GREENHOUSE_TWO_PHASE.details.save(greenhouse_detail_path)
+        gh_stats = GREENHOUSE_TWO_PHASE.stats
+        print(
+            f"Greenhouse two-phase: {gh_stats['listed']} listed, {gh_stats['skipped']} dropped before details; "
+            f"{gh_stats['fetched']} details fetched, {gh_stats['reused']} cached, {gh_stats['failed']} failed"
+        )
+    if DETAIL_PAGES is not None:
+        DETAIL_PAGES.details.save(detail_page_path)
+        page_stats = DETAIL_PAGES.stats
+        print(
+            f"Detail pages: {page_stats['listed']} listed, {page_stats['skipped']} dropped before fetching; "
+            f"{page_stats['fetched']} fetched, {page_stats['reused']} cached, {page_stats['failed']} failed; "
+            f"{page_stats['enriched']} enriched from JSON-LD"
+        )
+    if telemetry is not None:
+        telemetry.close()
+        print(f"Target telemetry ({args.telemetry_output}):")
+        for line in telemetry.summary():
+            print(line)
     return 0
 
 
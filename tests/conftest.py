@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline is a set of scripts rather than a package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
@@ -0,0 +1,66 @@
+import asyncio
+import json
+from http.server import ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+import pull_jobs
+from bench_engines import build_targets, make_handler
+from pull_jobs import AsyncFetchEngine, SessionPool, iter_body, iter_target_jobs
+
+
+@pytest.fixture(scope="module")
+def mock_ats():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(0.0, 1500))
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def engine():
+    engine = AsyncFetchEngine(8, 4)
+    yield engine
+    engine.close()
+
+
+def crawl(targets, workers, sessions) -> tuple[list[str], list[str]]:
+    pull_jobs.FAILURE_LOG.clear()
+    records = sorted(job.to_json(sort_keys=True) for _, jobs in iter_target_jobs(targets, workers, sessions) for job in jobs)
+    sessions.close()
+    return records, sorted(json.dumps(row, sort_keys=True) for row in pull_jobs.FAILURE_LOG)
+
+
+@pytest.mark.parametrize("decoder", ["typed", "stream"])
+def test_async_engine_matches_threads(mock_ats, monkeypatch, decoder):
+    monkeypatch.setattr(pull_jobs, "JSON_DECODER", decoder)
+    targets = build_targets(mock_ats, 26)
+    threads = crawl(targets, 4, SessionPool(4))
+    engine = AsyncFetchEngine(4, 4)
+    assert crawl(targets, engine.concurrency, engine) == threads
+    assert threads[0] and threads[1]
+
+
+def test_streamed_body_arrives_in_chunks_and_frees_the_host_slot(mock_ats, engine):
+    session = engine.session_for(mock_ats)
+    resp = session.get(f"{mock_ats}/greenhouse/board1", stream=True)
+    assert not resp._content_consumed
+    chunks = list(iter_body(resp))
+    assert len(chunks) > 1
+    assert len(json.loads(b"".join(chunks))["jobs"]) == 1500
+    resp.close()
+    engine.run(asyncio.sleep(0))
+    assert engine._host_limits["127.0.0.1"]._value == engine.per_host
+
+
+def test_closing_a_partly_read_stream_frees_the_host_slot(mock_ats, engine):
+    # More streams than the host has slots: a leaked slot would block here.
+    session = engine.session_for(mock_ats)
+    for _ in range(engine.per_host + 1):
+        resp = session.get(f"{mock_ats}/greenhouse/board1", stream=True)
+        next(iter_body(resp))
+        resp.close()
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+
+import pull_jobs
+from pull_jobs import DeltaIndex, DescriptionCache, JobRecord, compile_filter, load_json
+
+FILTER_CFG = Path(__file__).resolve().parents[1] / "data" / "jobs_filter.json"
+
+
+def posting() -> JobRecord:
+    return JobRecord(
+        company="Acme Bio",
+        job_title="Bioinformatics Scientist",
+        location="Boston, MA",
+        remote_or_hybrid="unknown",
+        posting_date="",
+        source="greenhouse",
+        job_url="https://example.com/1",
+        job_id="1",
+        description="<p>Python and RNA-seq</p>",
+        list_source="test",
+    )
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "descriptions.json.gz"
+
+
+@pytest.fixture
+def run(tmp_path, cache_path, monkeypatch):
+    filter_cfg = load_json(FILTER_CFG)
+    compiled = compile_filter(filter_cfg)
+
+    def filter_once() -> DescriptionCache:
+        cache = DescriptionCache()
+        cache.load(cache_path)
+        monkeypatch.setattr(pull_jobs, "DESCRIPTION_CACHE", cache)
+        delta = DeltaIndex(tmp_path / "delta.json", filter_cfg)
+        delta.filter_target("acme", [posting()], compiled)
+        delta.save()
+        cache.save(cache_path)
+        return cache
+
+    return filter_once
+
+
+def test_descriptions_of_reused_outcomes_stay_cached(run, cache_path):
+    assert run().stats == {"reused": 0, "normalized": 1}
+    # The delta index reuses the outcome, so the description is not read...
+    assert run().stats == {"reused": 0, "normalized": 0}
+    assert run().stats == {"reused": 0, "normalized": 0}
+    # ...but it is still cached for the day the posting is filtered again.
+    cache = DescriptionCache()
+    cache.load(cache_path)
+    cache.text(posting())
+    assert cache.stats == {"reused": 1, "normalized": 0}
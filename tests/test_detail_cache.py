@@ -0,0 +1,109 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+import requests
+
+import pull_jobs
+from pull_jobs import DetailCache, DetailPages, GreenhouseTwoPhase, HttpCache, compile_filter, load_json
+
+FILTER_CFG = Path(__file__).resolve().parents[1] / "data" / "jobs_filter.json"
+GREENHOUSE_ROW = {"company_name": "Acme", "api_name": "greenhouse", "api_url": "https://boards.example.test/v1/boards/acme/jobs"}
+ROW = {"company_name": "Acme", "api_name": "icims", "api_url": "https://careers-acme.icims.com/jobs/search?ss=1"}
+
+
+class IcimsTenant:
+    """One-page iCIMS search with ETags, plus a JSON-LD detail page per posting."""
+
+    def __init__(self, postings: list[int]) -> None:
+        self.postings = postings
+        self.details_served: list[str] = []
+
+    def response(self, url: str, status: int, body: str, headers: dict | None = None) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers.update(headers or {})
+        resp._content = body.encode("utf-8")
+        resp.encoding = "utf-8"
+        resp.url = url
+        return resp
+
+    def get(self, url, timeout=20, allow_redirects=True, headers=None, stream=False):
+        if "/jobs/search" in url:
+            etag = f'"{len(self.postings)}"'
+            if (headers or {}).get("If-None-Match") == etag:
+                return self.response(url, 304, "")
+            links = "".join(f'<a href="/jobs/{job_id}/scientist/job">Bioinformatics Scientist</a>' for job_id in self.postings)
+            return self.response(url, 200, f"<html><body>{links}</body></html>", {"ETag": etag})
+        self.details_served.append(url)
+        posting = {"@type": "JobPosting", "title": "Bioinformatics Scientist", "description": "Python genomics"}
+        return self.response(url, 200, f'<script type="application/ld+json">{json.dumps(posting)}</script>')
+
+
+class GreenhouseBoard(IcimsTenant):
+    """A Greenhouse board listing with ETags, plus the /jobs/{id} detail of each posting."""
+
+    def get(self, url, timeout=20, allow_redirects=True, headers=None, stream=False):
+        if not url.split("?")[0].rsplit("/", 1)[1].isdigit():
+            etag = f'"{len(self.postings)}"'
+            if (headers or {}).get("If-None-Match") == etag:
+                return self.response(url, 304, "")
+            jobs = [
+                {
+                    "id": job_id,
+                    "title": "Bioinformatics Scientist",
+                    "updated_at": f"{date.today().isoformat()}T00:00:00Z",
+                    "absolute_url": f"https://boards.example.test/acme/jobs/{job_id}",
+                    "location": {"name": "Boston, MA"},
+                }
+                for job_id in self.postings
+            ]
+            return self.response(url, 200, json.dumps({"jobs": jobs}), {"ETag": etag})
+        self.details_served.append(url)
+        return self.response(url, 200, json.dumps({"content": "Python genomics"}))
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    compiled = compile_filter(load_json(FILTER_CFG))
+    cache_path = tmp_path / "detail_pages.json.gz"
+
+    def pull(tenant: IcimsTenant) -> dict:
+        details = DetailCache()
+        details.load(cache_path)
+        if isinstance(tenant, GreenhouseBoard):
+            monkeypatch.setattr(pull_jobs, "GREENHOUSE_TWO_PHASE", GreenhouseTwoPhase(compiled, details))
+            row = GREENHOUSE_ROW
+        else:
+            monkeypatch.setattr(pull_jobs, "DETAIL_PAGES", DetailPages(compiled, details, per_host=2))
+            row = ROW
+        records = HttpCache(tmp_path / "http").pull(row, tenant, "test")
+        assert all(record.description == "Python genomics" for record in records)
+        details.save(cache_path)
+        saved = DetailCache()
+        saved.load(cache_path)
+        return saved.entries
+
+    return pull
+
+
+def test_unchanged_board_keeps_its_detail_pages(run):
+    tenant = IcimsTenant([1])
+    assert len(run(tenant)) == 1
+    # The listing comes back 304, so the puller never runs...
+    assert len(run(tenant)) == 1
+    assert len(run(tenant)) == 1
+    # ...and once it changes, only the new posting's page is fetched.
+    tenant.postings.append(2)
+    assert len(run(tenant)) == 2
+    assert [url.rsplit("/jobs/", 1)[1] for url in tenant.details_served] == ["1/scientist/job", "2/scientist/job"]
+
+
+def test_unchanged_two_phase_board_keeps_its_details(run):
+    board = GreenhouseBoard([1])
+    for _ in range(3):
+        assert len(run(board)) == 1
+    board.postings.append(2)
+    assert len(run(board)) == 2
+    assert [url.rsplit("/", 1)[1] for url in board.details_served] == ["1", "2"]
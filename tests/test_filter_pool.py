@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+import pull_jobs
+from pull_jobs import DescriptionCache, FilterPool, JobRecord, compile_filter, load_json
+
+FILTER_CFG = Path(__file__).resolve().parents[1] / "data" / "jobs_filter.json"
+
+
+def job(idx: int) -> JobRecord:
+    return JobRecord(
+        company="Acme Bio",
+        job_title="Bioinformatics Scientist",
+        location="Boston, MA",
+        remote_or_hybrid="unknown",
+        posting_date="",
+        source="greenhouse",
+        job_url=f"https://example.com/{idx}",
+        job_id=str(idx),
+        description=f"<p>Python and RNA-seq, posting {idx}</p>",
+        list_source="test",
+    )
+
+
+@pytest.fixture
+def descriptions(monkeypatch):
+    def install(entries: dict[str, str]) -> DescriptionCache:
+        cache = DescriptionCache(entries)
+        monkeypatch.setattr(pull_jobs, "DESCRIPTION_CACHE", cache)
+        return cache
+
+    return install
+
+
+def test_worker_description_entries_reach_the_parent_cache(descriptions):
+    jobs = [job(idx) for idx in range(6)]
+    warm = DescriptionCache()
+    for posting in jobs[:3]:
+        warm.text(posting)
+    cache = descriptions(dict(warm.used))
+
+    pool = FilterPool(compile_filter(load_json(FILTER_CFG)), workers=2, chunk_size=2)
+    try:
+        pool.filter(jobs)
+    finally:
+        pool.close()
+
+    # Every posting the workers saw is saved for the next run, and the three
+    # the parent loaded were reused in the workers rather than normalized again.
+    assert len(cache.used) == 6
+    assert cache.stats == {"reused": 3, "normalized": 3}
@@ -0,0 +1,125 @@
+import threading
+
+import pytest
+import requests
+
+import pull_jobs
+from pull_jobs import CachedSession, HttpCache, RetryLater
+
+
+class Board:
+    """Replays scripted (status, headers, body) responses and records the headers it was sent."""
+
+    def __init__(self, *responses: tuple[int, dict, bytes]) -> None:
+        self.responses = list(responses)
+        self.sent: list[dict] = []
+
+    def get(self, url, timeout=20, allow_redirects=True, headers=None, stream=False):
+        self.sent.append(dict(headers or {}))
+        status, resp_headers, body = self.responses.pop(0)
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers.update(resp_headers)
+        resp._content = body
+        resp.url = url
+        return resp
+
+
+PRIOR = {"https://boards.example.test/v1/jobs": {"etag": '"v1"', "last_modified": "", "sha256": "0"}}
+
+
+def test_revalidate_sends_validators():
+    board = Board((304, {}, b""))
+    cached = CachedSession(board, PRIOR)
+    assert cached.revalidate()
+    assert board.sent == [{"If-None-Match": '"v1"'}]
+    assert cached.stats["not_modified"] == 1
+
+
+def test_revalidate_429_is_rescheduled_not_refetched():
+    # Inside fetch_target a throttled revalidation hands the target back to
+    # the worker loop instead of falling through to a full pull.
+    board = Board((429, {"Retry-After": "30"}, b""))
+    cached = CachedSession(board, {"https://throttled.example.test/v1/jobs": PRIOR[next(iter(PRIOR))]})
+    pull_jobs.REQUEST_CONTEXT.target_key = "throttled"
+    try:
+        with pytest.raises(RetryLater):
+            cached.revalidate()
+    finally:
+        pull_jobs.REQUEST_CONTEXT.target_key = None
+    assert len(board.sent) == 1
+
+
+class PagedBoard:
+    """Answers 304 for every page; pages after the first wait at a barrier, so they must be in flight together."""
+
+    def __init__(self, urls: list[str], changed: str = "") -> None:
+        self.changed = changed
+        self.sent: list[str] = []
+        self.barrier = threading.Barrier(len(urls) - 1, timeout=5)
+        self.first = urls[0]
+
+    def get(self, url, timeout=20, allow_redirects=True, headers=None, stream=False):
+        self.sent.append(url)
+        if url != self.first:
+            self.barrier.wait()
+        resp = requests.Response()
+        resp.status_code = 200 if url == self.changed else 304
+        resp._content = b"new" if url == self.changed else b""
+        resp.url = url
+        return resp
+
+
+def test_revalidate_replays_pages_after_the_first_concurrently():
+    urls = [f"https://boards.example.test/v1/jobs?page={page}" for page in range(1, 5)]
+    prior = {url: {"etag": '"v1"', "last_modified": "", "sha256": "0"} for url in urls}
+    board = PagedBoard(urls)
+    cached = CachedSession(board, prior)
+    assert cached.revalidate()
+    assert board.sent[0] == urls[0]
+    assert sorted(board.sent) == urls
+    assert cached.stats["not_modified"] == 4
+
+
+def test_revalidate_stops_when_the_first_page_changed():
+    urls = [f"https://boards.example.test/v1/jobs?page={page}" for page in range(1, 4)]
+    prior = {url: {"etag": '"v1"', "last_modified": "", "sha256": "0"} for url in urls}
+    board = PagedBoard(urls, changed=urls[0])
+    cached = CachedSession(board, prior)
+    assert not cached.revalidate()
+    assert board.sent == urls[:1]
+    # The changed page is served to the puller without a second download.
+    assert cached.get(urls[0]).content == b"new"
+    assert board.sent == urls[:1]
+
+
+def test_entries_are_reused_only_under_the_same_filter_variant(tmp_path):
+    modes = {"greenhouse_two_phase": True, "pushdown": False, "detail_pages": False}
+    before = HttpCache.fetch_variant({"title_keywords": ["scientist"]}, modes)
+    after = HttpCache.fetch_variant({"title_keywords": ["engineer"]}, modes)
+    assert before != after
+    assert HttpCache.fetch_variant({"title_keywords": ["scientist"]}, dict.fromkeys(modes, False)) == ""
+
+    HttpCache(tmp_path, before).save("board", {}, [])
+    assert HttpCache(tmp_path, before).load("board") is not None
+    assert HttpCache(tmp_path, after).load("board") is None
+    assert HttpCache(tmp_path).load("board") is None
+
+
+def test_deferred_target_is_served_stale_from_the_cache(tmp_path):
+    cached_target = ({"company_name": "Acme", "api_name": "greenhouse", "api_url": "https://acme.test"}, "list")
+    uncached_target = ({"company_name": "Initech", "api_name": "greenhouse", "api_url": "https://initech.test"}, "list")
+    job = pull_jobs.JobRecord("Acme", "Scientist", "Remote", "Remote", "", "greenhouse", "https://acme.test/1", "1", "", "list")
+    cache = HttpCache(tmp_path / "http")
+    cache.save(HttpCache.target_key(*cached_target), {}, [job])
+    scheduler = pull_jobs.CrawlScheduler(tmp_path / "yield.json", budget_seconds=1)
+    scheduler.deadline -= 10
+
+    for workers in (1, 2):
+        results = list(
+            pull_jobs.iter_target_jobs([cached_target, uncached_target], workers, None, cache, scheduler=scheduler)
+        )
+        assert results == [(cached_target, [job])]
+        assert results[0][1][0].stale
+    assert cache.stats["targets_stale"] == 2
+    assert list(scheduler.deferred) == [HttpCache.target_key(*t) for t in (cached_target, uncached_target)]
@@ -0,0 +1,53 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+import pull_jobs
+from pull_jobs import pull_icims
+
+SEARCH_URL = "https://careers-acme.icims.com/jobs/search?ss=1"
+
+
+class IcimsBoard:
+    """Serves `pages` search pages of two postings each, labelled "Page N of pages"."""
+
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.requested: list[int] = []
+
+    def get(self, url, timeout=20, allow_redirects=True, headers=None, stream=False):
+        page = int(parse_qs(urlparse(url).query).get("pr", ["0"])[0])
+        self.requested.append(page)
+        postings = "".join(
+            f'<a href="/jobs/{page * 2 + idx}/scientist/job">Scientist {page * 2 + idx}</a>' for idx in range(2)
+        )
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = f"<html><body>{postings}<div>Page {page + 1} of {self.pages}</div></body></html>".encode()
+        resp.encoding = "utf-8"
+        resp.url = url
+        return resp
+
+
+@pytest.fixture
+def failures(monkeypatch):
+    log: list[dict] = []
+    monkeypatch.setattr(pull_jobs, "FAILURE_LOG", log)
+    monkeypatch.setattr(pull_jobs, "ICIMS_MAX_PAGES", 3)
+    return log
+
+
+def test_board_past_the_page_limit_is_logged(failures):
+    board = IcimsBoard(pages=5)
+    records = pull_icims("Acme", SEARCH_URL, board, "test")
+    assert sorted(board.requested) == [0, 1, 2]
+    assert len(records) == 6
+    assert [entry["reason"] for entry in failures] == ["page_limit"]
+    assert "pr=3" in failures[0]["api_url"]
+
+
+def test_board_within_the_page_limit_is_not_logged(failures):
+    board = IcimsBoard(pages=3)
+    assert len(pull_icims("Acme", SEARCH_URL, board, "test")) == 6
+    assert failures == []
@@ -0,0 +1,35 @@
+import csv
+
+from pull_jobs import JobStore, write_csv
+
+
+def history(path, urls):
+    write_csv(path, [{"company": "Acme Bio", "job_title": "Scientist", "job_url": url} for url in urls])
+
+
+def exported(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return [row["job_url"] for row in csv.DictReader(handle)]
+
+
+def test_stale_store_keeps_rows_committed_after_it(tmp_path):
+    db, csv_path = tmp_path / "jobs.sqlite3", tmp_path / "jobs_history.csv"
+    history(csv_path, ["https://x/1", "https://x/2"])
+    JobStore(db, csv_path).close()
+    # Later runs committed more rows to the CSV, but the cached store is older.
+    history(csv_path, ["https://x/1", "https://x/2", "https://x/3", "https://x/4"])
+    store = JobStore(db, csv_path)
+    assert store.merged == 2
+    store.upsert([{"company": "Acme Bio", "job_title": "Scientist", "job_url": "https://x/5"}], "2026-01-02")
+    store.export_csv(csv_path)
+    store.close()
+    assert exported(csv_path) == ["https://x/1", "https://x/2", "https://x/3", "https://x/4", "https://x/5"]
+
+
+def test_reopening_a_current_store_merges_nothing(tmp_path):
+    db, csv_path = tmp_path / "jobs.sqlite3", tmp_path / "jobs_history.csv"
+    history(csv_path, ["https://x/1", "https://x/1", "https://x/2"])
+    JobStore(db, csv_path).close()
+    store = JobStore(db, csv_path)
+    assert (store.merged, store.count()) == (0, 2)
+    store.close()
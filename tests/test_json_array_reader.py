@@ -0,0 +1,62 @@
+import json
+
+import pytest
+
+from pull_jobs import InvalidPayload, JsonArrayReader
+
+BOARD = {
+    "apiVersion": "1",
+    "meta": {"jobs": [0], "total": 3},
+    "jobs": [
+        {"id": 4027048751406460113, "title": "Bioinformatics Scientist é✓ \"II\"", "score": 27048.751406460113},
+        {"id": -12, "ratio": -1.5e-3, "big": 6.02E+23, "flags": [True, False, None]},
+        [],
+        "Remote - US",
+        0,
+        1e5,
+    ],
+    "after": {"x": 1},
+}
+
+
+def split_at(body: bytes, cut: int) -> list[bytes]:
+    return [body[:cut], body[cut:]]
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_every_split_point(ensure_ascii):
+    body = json.dumps(BOARD, ensure_ascii=ensure_ascii).encode("utf-8")
+    for cut in range(len(body) + 1):
+        assert list(JsonArrayReader(split_at(body, cut), "jobs")) == BOARD["jobs"], cut
+
+
+def test_every_split_point_top_level_array():
+    body = json.dumps(BOARD["jobs"], separators=(",", ":")).encode("utf-8")
+    for cut in range(len(body) + 1):
+        assert list(JsonArrayReader(split_at(body, cut))) == BOARD["jobs"], cut
+
+
+def test_one_byte_chunks():
+    body = json.dumps(BOARD, indent=2).encode("utf-8")
+    assert list(JsonArrayReader([body[i : i + 1] for i in range(len(body))], "jobs")) == BOARD["jobs"]
+
+
+def test_number_cut_before_fraction():
+    chunks = [b'["xxxx", 27048.', b"751406460113]"]
+    assert list(JsonArrayReader(chunks)) == ["xxxx", 27048.751406460113]
+
+
+def test_missing_key_reads_as_empty():
+    assert list(JsonArrayReader([b'{"meta": {}}'], "jobs")) == []
+
+
+@pytest.mark.parametrize("body", [b'{"jobs": null}', b'{"jobs": {}}', b"[1, 2]"])
+def test_wrong_shape(body):
+    with pytest.raises(InvalidPayload):
+        list(JsonArrayReader([body], "jobs"))
+
+
+@pytest.mark.parametrize("body", [b'{"jobs": [1, 2', b'{"jobs": [1 2]}', b'{"a": 1 "jobs": []}', b""])
+def test_broken_json(body):
+    with pytest.raises(json.JSONDecodeError):
+        list(JsonArrayReader([body], "jobs"))
@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+from pull_jobs import KEYWORD_REGEX_MAX_CHARS, KeywordMatcher, match_token, normalize
+
+TOKENS = ["US", "GENOM", "GENOMICS", "RNA SEQ", "SEQUENCING", "NGS", "SINGLE CELL", "CELL"]
+WORDS = ["GENOME", "GENOMICS", "RNA", "SEQ", "BUSINESS", "US", "CELLULAR", "SINGLE", "SCIENTIST", "NGSX"]
+
+
+@pytest.mark.parametrize("words", [2, 6, 40])
+def test_match_any_agrees_with_match_token(words):
+    rnd = random.Random(words)
+    for tokens in (TOKENS, TOKENS[1:2], ["SINGLE CELL", "SEQUENCING"], []):
+        matcher = KeywordMatcher(tokens)
+        for _ in range(500):
+            text = normalize(" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, words))))
+            assert matcher.match_any(text) == any(match_token(token, text) for token in tokens), text
+
+
+def test_short_and_long_texts_take_both_paths():
+    matcher = KeywordMatcher(["GENOM"])
+    short = normalize("Scientist, Genomics")
+    long = normalize("Scientist " * (KEYWORD_REGEX_MAX_CHARS // 10 + 1) + "Genomics")
+    assert len(short) <= KEYWORD_REGEX_MAX_CHARS < len(long)
+    assert matcher.match_any(short) and matcher.match_any(long)
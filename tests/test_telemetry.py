@@ -0,0 +1,67 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+import pull_jobs
+from pull_jobs import CrawlScheduler, HttpCache, RetryLater, RunTelemetry, SessionPool, iter_target_jobs
+
+
+class Ok(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def port():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Ok)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+def test_threaded_engine_times_dns_apart_from_connect(port):
+    record = dict.fromkeys(pull_jobs.TELEMETRY_COUNTERS, 0)
+    session = SessionPool(1).session_for(f"http://localhost:{port}/")
+    pull_jobs.REQUEST_CONTEXT.telemetry = record
+    try:
+        # localhost may resolve to ::1 first, which nothing listens on here;
+        # the connection falls through to 127.0.0.1 without a second lookup.
+        assert session.get(f"http://localhost:{port}/", timeout=5).json() == {}
+    finally:
+        pull_jobs.REQUEST_CONTEXT.telemetry = None
+    assert record["connections"] == 1
+    assert record["dns_s"] > 0
+    assert record["connect_s"] >= 0
+
+
+class NoSessions:
+    def session_for(self, url):
+        return None
+
+
+def test_target_deferred_after_a_requeue_gets_a_deferred_record(tmp_path, monkeypatch):
+    def throttled(row, session, list_source):
+        raise RetryLater("boards.example.test", 60)
+
+    monkeypatch.setattr(pull_jobs, "pull_jobs_for_target", throttled)
+    target = ({"company_name": "Acme", "api_name": "greenhouse", "api_url": "https://boards.example.test"}, "list")
+    telemetry = RunTelemetry(tmp_path / "telemetry.jsonl")
+    # Admitted now, but the host reopens after the deadline.
+    scheduler = CrawlScheduler(tmp_path / "yield.json", budget_seconds=5)
+    assert list(iter_target_jobs([target], 1, NoSessions(), telemetry=telemetry, scheduler=scheduler)) == []
+    telemetry.close()
+
+    (record,) = [json.loads(line) for line in (tmp_path / "telemetry.jsonl").read_text().splitlines()]
+    assert record["outcome"] == "deferred"
+    assert record["company_name"] == "Acme"
+    assert list(scheduler.deferred) == [HttpCache.target_key(*target)]
+    assert "over 0 targets (1 deferred)" in telemetry.summary()[0]
@@ -0,0 +1,112 @@
+from json import dumps
+
+import pytest
+import requests
+
+import pull_jobs
+from pull_jobs import QueryPushdown, pull_workday
+
+US_FILTER = {"location_filter": {"include_any": ["UNITED STATES", "USA"]}}
+
+
+class WorkdayTenant:
+    """Stands in for a CXS search endpoint: `postings` of (id, country), filtered by appliedFacets."""
+
+    def __init__(self, postings: list[tuple[str, str]]) -> None:
+        self.postings = postings
+        self.searches: list[dict] = []
+
+    def post(self, url, json=None, timeout=20, allow_redirects=True, headers=None):
+        self.searches.append(json)
+        wanted = (json.get("appliedFacets") or {}).get("locationCountry")
+        jobs = [(job_id, country) for job_id, country in self.postings if not wanted or f"id-{country}" in wanted]
+        counts: dict[str, int] = {}
+        for _, country in self.postings:
+            counts[country] = counts.get(country, 0) + 1
+        names = {"US": "United States of America", "GB": "United Kingdom"}
+        page = jobs[json["offset"] : json["offset"] + json["limit"]]
+        body = {
+            "total": len(jobs),
+            "jobPostings": [
+                {"title": "Bioinformatics Scientist", "locationsText": names[country], "externalPath": f"/job/{job_id}"}
+                for job_id, country in page
+            ],
+            "facets": [
+                {
+                    "facetParameter": "locationCountry",
+                    "values": [{"descriptor": names[c], "id": f"id-{c}", "count": n} for c, n in sorted(counts.items())],
+                }
+            ],
+        }
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = dumps(body).encode("utf-8")
+        resp.url = url
+        return resp
+
+
+@pytest.fixture
+def pushdown(monkeypatch):
+    query_pushdown = QueryPushdown(US_FILTER)
+    monkeypatch.setattr(pull_jobs, "QUERY_PUSHDOWN", query_pushdown)
+    return query_pushdown
+
+
+def urls(records):
+    return sorted(record.job_url.rsplit("/", 1)[1] for record in records)
+
+
+def test_us_facet_smaller_than_a_page_is_still_fetched(pushdown):
+    # 5 US postings, all past the first (unfiltered) page.
+    tenant = WorkdayTenant([(f"gb{i}", "GB") for i in range(95)] + [(f"us{i}", "US") for i in range(5)])
+    records = pull_workday("Acme", "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/Careers/jobs", tenant, "test")
+
+    assert [search["appliedFacets"] for search in tenant.searches] == [{}, {"locationCountry": ["id-US"]}]
+    assert {f"us{i}" for i in range(5)} <= set(urls(records))
+    assert len(records) == 25
+    assert pushdown.stats["postings_fetched"] == 5
+    assert pushdown.stats["postings_avoided"] == 75
+
+
+def test_narrowed_search_spanning_pages(pushdown):
+    tenant = WorkdayTenant([(f"gb{i}", "GB") for i in range(60)] + [(f"us{i}", "US") for i in range(45)])
+    records = pull_workday("Acme", "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/Careers/jobs", tenant, "test")
+
+    assert [search["offset"] for search in tenant.searches[1:]] == [0, 20, 40]
+    assert {f"us{i}" for i in range(45)} <= set(urls(records))
+    assert pushdown.stats["postings_avoided"] == 105 - len(records)
+
+
+def test_without_pushdown_every_page_is_fetched(monkeypatch):
+    monkeypatch.setattr(pull_jobs, "QUERY_PUSHDOWN", None)
+    tenant = WorkdayTenant([(f"gb{i}", "GB") for i in range(95)] + [(f"us{i}", "US") for i in range(5)])
+    records = pull_workday("Acme", "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/Careers/jobs", tenant, "test")
+
+    assert len(records) == 100
+    assert all(search["appliedFacets"] == {} for search in tenant.searches)
+
+
+class OneSession:
+    def __init__(self, session) -> None:
+        self.session = session
+
+    def session_for(self, url):
+        return self.session
+
+
+def test_narrowed_targets_are_kept_from_closing_postings_even_when_reused(tmp_path, monkeypatch):
+    tenant = WorkdayTenant([(f"gb{i}", "GB") for i in range(95)] + [(f"us{i}", "US") for i in range(5)])
+    row = {"company_name": "Acme", "api_name": "workday", "api_url": "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/Careers/jobs"}
+    target = (row, "test")
+    key = pull_jobs.HttpCache.target_key(*target)
+    cache = pull_jobs.HttpCache(tmp_path)
+    for reused in (0, 1):
+        query_pushdown = QueryPushdown(US_FILTER)
+        monkeypatch.setattr(pull_jobs, "QUERY_PUSHDOWN", query_pushdown)
+        assert len(pull_jobs.fetch_target(target, OneSession(tenant), cache)) == 25
+        assert cache.stats["targets_reused"] == reused
+        assert query_pushdown.narrowed == {key}
+
+    monkeypatch.setattr(pull_jobs, "QUERY_PUSHDOWN", QueryPushdown({}))
+    pull_jobs.fetch_target(target, OneSession(tenant), pull_jobs.HttpCache(tmp_path / "unfiltered"))
+    assert pull_jobs.QUERY_PUSHDOWN.narrowed == set()